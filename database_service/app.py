@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -5,6 +6,7 @@ from fastapi import FastAPI
 
 from dependencies import engine
 from model.base import Base
+from service.stop_request_notifier import stop_request_notifier
 
 from router.invocations_router import router as invocations_router
 from router.profiles_router import router as profiles_router
@@ -36,7 +38,9 @@ def create_tables():
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     create_tables()
+    stop_request_notifier.start(asyncio.get_running_loop())
     yield
+    stop_request_notifier.stop()
     engine.dispose()
 
 
@@ -6,6 +6,10 @@ class DocumentsEmbeddedCreate(BaseModel):
     points: str
 
 
+class DocumentsEmbeddedBulkUpsert(BaseModel):
+    documents: list[DocumentsEmbeddedCreate]
+
+
 class DocumentsEmbeddedResponse(BaseModel):
     id: str
     filename: str
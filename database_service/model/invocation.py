@@ -1,6 +1,6 @@
 import json
 from datetime import datetime
-from typing import Optional
+from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, field_validator
 
@@ -18,6 +18,29 @@ class InvocationUpdate(BaseModel):
     graph_state: Optional[dict] = None
 
 
+class GraphStatePatchOperation(BaseModel):
+    # A JSON Patch (RFC 6902) operation limited to what invocation state
+    # updates need: top-level fields ("/field") and appends to top-level
+    # lists ("/field/-").
+    op: Literal["add", "replace", "remove"]
+    path: str
+    value: Any = None
+
+
+class InvocationGraphStatePatch(BaseModel):
+    status: Optional[str] = None
+    patch: list[GraphStatePatchOperation] = []
+
+
+class InvocationStatusResponse(BaseModel):
+    invocation_id: str
+    status: str
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class InvocationResponse(BaseModel):
     invocation_id: str
     profile_id: str
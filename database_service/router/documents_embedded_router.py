@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from model.documents_embedded import (
     DocumentsEmbeddedCreate,
+    DocumentsEmbeddedBulkUpsert,
     DocumentsEmbeddedResponse,
 )
 from service import documents_embedded_service
@@ -53,6 +54,23 @@ def update_documents_embedded(
     return updated
 
 
+@router.put("/documents-embedded/bulk")
+def bulk_update_documents_embedded(
+    data: DocumentsEmbeddedBulkUpsert,
+    db: Session = Depends(get_db),
+):
+    logger.info(
+        f"Bulk updating {len(data.documents)} documents embedded entries"
+    )
+
+    count = documents_embedded_service.bulk_upsert_documents_embedded(
+        db=db,
+        documents=data.documents,
+    )
+
+    return {"status": "ok", "count": count}
+
+
 @router.delete("/documents-embedded")
 def delete_documents_embedded(
     filename: str,
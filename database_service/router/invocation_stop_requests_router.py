@@ -1,22 +1,32 @@
+import asyncio
 import logging
 
+from typing import Optional
+
 from fastapi import (
     APIRouter,
     Depends,
     HTTPException,
+    Query,
+    Response,
 )
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from model.invocation_stop_request import (
     InvocationStopRequestCreate,
     InvocationStopRequestResponse,
 )
+from model.invocation_stop_request_model import InvocationStopRequestModel
 from service import invocation_stop_requests_service
-from dependencies import get_db
+from service.stop_request_notifier import stop_request_notifier
+from dependencies import get_db, SessionLocal
 
 
 logger = logging.getLogger(__name__)
 
+STOP_REQUEST_WAIT_MAX_SECONDS = 60.0
+
 router = APIRouter(
     prefix="/api/database",
     tags=["database"],
@@ -71,6 +81,73 @@ def get_stop_request(
     return stop_request
 
 
+def _find_stop_request(
+    invocation_id: str,
+) -> Optional[InvocationStopRequestModel]:
+    # A session of its own, closed right away, so waiting requests do
+    # not hold on to pooled database connections.
+    db = SessionLocal()
+    try:
+        stop_request = invocation_stop_requests_service.get_stop_request_by_invocation_id(
+            db=db,
+            invocation_id=invocation_id,
+        )
+        if stop_request is not None:
+            db.expunge(stop_request)
+        return stop_request
+    finally:
+        db.close()
+
+
+@router.get(
+    "/invocation-stop-requests/{invocation_id}/wait",
+    response_model=InvocationStopRequestResponse,
+    responses={204: {"description": "No stop request before the timeout"}},
+)
+async def wait_for_stop_request(
+    invocation_id: str,
+    timeout: float = Query(
+        default=30.0,
+        gt=0,
+        le=STOP_REQUEST_WAIT_MAX_SECONDS,
+    ),
+):
+    # Long poll: answers as soon as a stop request for the invocation
+    # exists, or with 204 once the timeout passes without one.
+    if not stop_request_notifier.available:
+        raise HTTPException(
+            status_code=503,
+            detail="Stop request notifications are unavailable",
+        )
+
+    # Subscribed before the lookup, so a stop request created in between
+    # still wakes this waiter.
+    event = stop_request_notifier.subscribe(invocation_id)
+    try:
+        stop_request = await run_in_threadpool(
+            _find_stop_request,
+            invocation_id,
+        )
+        if stop_request is not None:
+            return stop_request
+
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return Response(status_code=204)
+
+        stop_request = await run_in_threadpool(
+            _find_stop_request,
+            invocation_id,
+        )
+        if stop_request is None:
+            # Deleted again before it could be read.
+            return Response(status_code=204)
+        return stop_request
+    finally:
+        stop_request_notifier.unsubscribe(invocation_id, event)
+
+
 @router.delete(
     "/invocation-stop-requests/{invocation_id}",
 )
@@ -12,6 +12,8 @@ from model.invocation import (
     InvocationCreate,
     InvocationUpdate,
     InvocationResponse,
+    InvocationGraphStatePatch,
+    InvocationStatusResponse,
 )
 from service import invocations_service
 from dependencies import get_db
@@ -141,6 +143,45 @@ def update_invocation(
     return updated
 
 
+@router.patch(
+    "/{profile_id}/invocations/{invocation_id}/graph-state",
+    response_model=InvocationStatusResponse,
+)
+def patch_invocation_graph_state(
+    profile_id: str,
+    invocation_id: str,
+    graph_state_patch: InvocationGraphStatePatch,
+    db: Session = Depends(get_db),
+):
+    # Incremental counterpart of update_invocation: only the changed
+    # parts of the graph state are sent, and only the status comes back.
+    logger.debug(
+        f"Patching graph state of invocation {invocation_id} for profile "
+        f"{profile_id} with {len(graph_state_patch.patch)} operations"
+    )
+
+    try:
+        updated = invocations_service.patch_invocation_graph_state(
+            db=db,
+            invocation_id=invocation_id,
+            graph_state_patch=graph_state_patch,
+            profile_id=profile_id,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e),
+        )
+
+    if not updated:
+        raise HTTPException(
+            status_code=404,
+            detail="Invocation not found",
+        )
+
+    return updated
+
+
 @router.delete(
     "/{profile_id}/invocations/{invocation_id}",
 )
@@ -58,6 +58,35 @@ def update_documents_embedded(
     )
 
 
+def bulk_upsert_documents_embedded(
+    db: Session,
+    documents: list[DocumentsEmbeddedCreate],
+) -> int:
+    # Later entries win when the same filename appears more than once.
+    points_by_filename = {
+        document.filename: document.points for document in documents
+    }
+
+    existing = db.query(DocumentsEmbeddedModel).filter(
+        DocumentsEmbeddedModel.filename.in_(list(points_by_filename))
+    ).all()
+
+    for db_document in existing:
+        db_document.points = points_by_filename.pop(db_document.filename)
+
+    db.add_all(
+        DocumentsEmbeddedModel(
+            id=str(uuid.uuid4()),
+            filename=filename,
+            points=points,
+        )
+        for filename, points in points_by_filename.items()
+    )
+    db.commit()
+
+    return len(existing) + len(points_by_filename)
+
+
 def delete_documents_embedded(
     db: Session,
     filename: str,
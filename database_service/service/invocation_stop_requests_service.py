@@ -4,6 +4,7 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from model.invocation_stop_request_model import InvocationStopRequestModel
+from service.stop_request_notifier import notify_stop_request
 
 import logging
 
@@ -28,6 +29,7 @@ def create_stop_request(
     )
 
     db.add(db_stop_request)
+    notify_stop_request(db, invocation_id)
     db.commit()
     db.refresh(db_stop_request)
 
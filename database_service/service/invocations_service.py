@@ -1,6 +1,6 @@
 import json
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
 from sqlalchemy.orm import Session
 
@@ -8,6 +8,8 @@ from model.invocation_model import InvocationModel
 from model.invocation import (
     InvocationCreate,
     InvocationUpdate,
+    InvocationGraphStatePatch,
+    GraphStatePatchOperation,
 )
 
 
@@ -95,6 +97,72 @@ def update_invocation(
     return db_invocation
 
 
+def _apply_graph_state_operation(
+    graph_state: dict[str, Any],
+    operation: GraphStatePatchOperation,
+):
+    parts = operation.path.split("/")
+    if len(parts) not in (2, 3) or parts[0] != "" or not parts[1]:
+        raise ValueError(f"Unsupported patch path '{operation.path}'")
+
+    key = parts[1].replace("~1", "/").replace("~0", "~")
+
+    if len(parts) == 3:
+        if operation.op != "add" or parts[2] != "-":
+            raise ValueError(
+                f"Only appends ('add' to '/field/-') are supported below "
+                f"the top level, got '{operation.op}' to '{operation.path}'"
+            )
+        target = graph_state.setdefault(key, [])
+        if not isinstance(target, list):
+            raise ValueError(f"Cannot append to non-list field '{key}'")
+        target.append(operation.value)
+        return
+
+    if operation.op == "remove":
+        graph_state.pop(key, None)
+    else:
+        graph_state[key] = operation.value
+
+
+def patch_invocation_graph_state(
+    db: Session,
+    invocation_id: str,
+    graph_state_patch: InvocationGraphStatePatch,
+    profile_id: str,
+) -> Optional[InvocationModel]:
+    # The row is locked so patches of the same invocation are applied
+    # one after the other to the state the previous one left behind.
+    db_invocation = db.query(InvocationModel).filter(
+        InvocationModel.invocation_id == invocation_id,
+        InvocationModel.profile_id == profile_id,
+    ).with_for_update().first()
+
+    if not db_invocation:
+        return None
+
+    if graph_state_patch.patch:
+        graph_state = (
+            json.loads(db_invocation.graph_state)
+            if db_invocation.graph_state else {}
+        )
+        try:
+            for operation in graph_state_patch.patch:
+                _apply_graph_state_operation(graph_state, operation)
+        except ValueError:
+            db.rollback()
+            raise
+        db_invocation.graph_state = json.dumps(graph_state)
+
+    if graph_state_patch.status is not None:
+        db_invocation.status = graph_state_patch.status
+
+    db_invocation.updated_at = datetime.now(timezone.utc)
+    db.commit()
+    db.refresh(db_invocation)
+    return db_invocation
+
+
 def delete_invocation_by_id(
     db: Session,
     invocation_id: str,
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import select
+import threading
+
+from typing import Optional
+
+import psycopg2
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from config.vars import DATABASE_URL
+
+
+logger = logging.getLogger(__name__)
+
+STOP_REQUEST_CHANNEL = "invocation_stop_requests"
+
+# How long the listener blocks for notifications before checking whether
+# it was asked to stop.
+LISTEN_SELECT_TIMEOUT_SECONDS = 5.0
+
+LISTEN_RECONNECT_DELAY_SECONDS = 5.0
+
+
+def notify_stop_request(db: Session, invocation_id: str):
+    # Postgres only delivers the notification once the surrounding
+    # transaction commits, so listeners never see a stop request that
+    # was rolled back.
+    if db.get_bind().dialect.name != "postgresql":
+        return
+
+    db.execute(
+        text("SELECT pg_notify(:channel, :invocation_id)"),
+        {
+            "channel": STOP_REQUEST_CHANNEL,
+            "invocation_id": invocation_id,
+        },
+    )
+
+
+class StopRequestNotifier:
+
+    # Wakes waiters on stop requests as soon as they are created, by any
+    # replica of this service, through Postgres LISTEN/NOTIFY. One thread
+    # holds a dedicated LISTEN connection and hands notifications to the
+    # event loop; while that connection is down, available is False and
+    # callers have to poll instead.
+
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+        self.available = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._waiters: dict[str, set[asyncio.Event]] = {}
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+
+    def start(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._listen_forever,
+            name="stop-request-listener",
+            daemon=True,
+        )
+        self._thread.start()
+
+
+    def stop(self):
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=LISTEN_SELECT_TIMEOUT_SECONDS + 1)
+            self._thread = None
+        self.available = False
+
+
+    def subscribe(self, invocation_id: str) -> asyncio.Event:
+        event = asyncio.Event()
+        self._waiters.setdefault(invocation_id, set()).add(event)
+        return event
+
+
+    def unsubscribe(self, invocation_id: str, event: asyncio.Event):
+        waiters = self._waiters.get(invocation_id)
+        if waiters is None:
+            return
+        waiters.discard(event)
+        if not waiters:
+            del self._waiters[invocation_id]
+
+
+    def _dispatch(self, invocation_id: str):
+        for event in self._waiters.get(invocation_id, ()):
+            event.set()
+
+
+    def _listen_forever(self):
+        while not self._stopping.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                logger.error(
+                    f"Stop request listener failed, reconnecting in "
+                    f"{LISTEN_RECONNECT_DELAY_SECONDS}s: {str(e)}"
+                )
+            self.available = False
+            self._stopping.wait(LISTEN_RECONNECT_DELAY_SECONDS)
+
+
+    def _listen(self):
+        connection = psycopg2.connect(self.dsn)
+        try:
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {STOP_REQUEST_CHANNEL}")
+
+            self.available = True
+            logger.info(
+                f"Listening for stop requests on channel "
+                f"{STOP_REQUEST_CHANNEL}"
+            )
+
+            while not self._stopping.is_set():
+                readable, _, _ = select.select(
+                    [connection], [], [], LISTEN_SELECT_TIMEOUT_SECONDS
+                )
+                if not readable:
+                    continue
+
+                connection.poll()
+                while connection.notifies:
+                    notification = connection.notifies.pop(0)
+                    self._loop.call_soon_threadsafe(
+                        self._dispatch,
+                        notification.payload,
+                    )
+        finally:
+            connection.close()
+
+
+stop_request_notifier = StopRequestNotifier(
+    DATABASE_URL.replace("postgresql+psycopg2://", "postgresql://", 1)
+)
@@ -1,14 +1,30 @@
+import re
 import logging
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 
 from service.embedding_service import EmbeddingService
+from service.reembedding_service import ReembeddingService
+from service.search_coalescer import SearchCoalescer
 from processor.document_processor import DocumentProcessor
-from client.qdrant_vector_client import QdrantVectorClient
+from processor.pdf_extractor import create_pdf_extractor
+from client.vector_client import VectorClient
+from client.extracted_text_cache_client import ExtractedTextCacheClient
 from router import embedding_router
 from config.vars import (
     QDRANT_URL,
     SENTENCE_TRANSFORMER_MODEL,
+    VECTOR_BACKEND,
+    VECTOR_STORAGE_LAYOUT,
+    SHARED_COLLECTION_NAME,
+    LOCAL_VECTOR_STORE_PATH,
+    PDF_EXTRACTORS,
+    CHUNKING_MODE,
+    CHUNK_SIZE_TOKENS,
+    CHUNK_OVERLAP_TOKENS,
+    STORAGE_SERVICE_URL,
+    SEARCH_CACHE_TTL_SECONDS,
+    SEARCH_CACHE_MAX_ENTRIES,
 )
 
 
@@ -27,22 +43,107 @@ logger = logging.getLogger(__name__)
 app = FastAPI(title="Deep Research Embedding Service")
 
 logger.info("Starting Deep Research Embedding Service initialization")
-logger.info(f"Qdrant URL: {QDRANT_URL}")
+logger.info(f"Vector backend: {VECTOR_BACKEND}")
+logger.info(f"Vector storage layout: {VECTOR_STORAGE_LAYOUT}")
 logger.info(f"Model: {SENTENCE_TRANSFORMER_MODEL}")
+logger.info(f"PDF extractors: {', '.join(PDF_EXTRACTORS)}")
+
+
+def _create_vector_client() -> VectorClient:
+    if VECTOR_STORAGE_LAYOUT not in ("per_collection", "shared"):
+        raise ValueError(
+            f"Unknown vector storage layout: '{VECTOR_STORAGE_LAYOUT}'. "
+            f"Supported values: 'per_collection', 'shared'."
+        )
+
+    if VECTOR_BACKEND == "qdrant" and VECTOR_STORAGE_LAYOUT == "shared":
+        from client.shared_qdrant_vector_client import SharedQdrantVectorClient
+
+        logger.info(f"Qdrant URL: {QDRANT_URL}")
+        return SharedQdrantVectorClient(
+            url=QDRANT_URL,
+            shared_collection_name=SHARED_COLLECTION_NAME
+        )
+
+    if VECTOR_BACKEND == "qdrant":
+        from client.qdrant_vector_client import QdrantVectorClient
+
+        logger.info(f"Qdrant URL: {QDRANT_URL}")
+        return QdrantVectorClient(url=QDRANT_URL)
+
+    if VECTOR_BACKEND == "local":
+        if VECTOR_STORAGE_LAYOUT == "shared":
+            raise ValueError(
+                "The shared vector storage layout requires the qdrant backend"
+            )
+
+        from client.local_vector_client import LocalVectorClient
+
+        logger.info(f"Local vector store path: {LOCAL_VECTOR_STORE_PATH}")
+        return LocalVectorClient(storage_path=LOCAL_VECTOR_STORE_PATH)
+
+    raise ValueError(
+        f"Unknown vector backend: '{VECTOR_BACKEND}'. "
+        f"Supported values: 'qdrant', 'local'."
+    )
+
 
 embedding_service = EmbeddingService(model_name=SENTENCE_TRANSFORMER_MODEL)
-vector_client = QdrantVectorClient(url=QDRANT_URL)
-document_processor = DocumentProcessor(embedding_service=embedding_service)
+vector_client = _create_vector_client()
+document_processor = DocumentProcessor(
+    embedding_service=embedding_service,
+    pdf_extractor=create_pdf_extractor(PDF_EXTRACTORS),
+    chunking_mode=CHUNKING_MODE,
+    chunk_tokens=CHUNK_SIZE_TOKENS,
+    chunk_overlap_tokens=CHUNK_OVERLAP_TOKENS,
+    text_cache=(
+        ExtractedTextCacheClient(storage_service_url=STORAGE_SERVICE_URL)
+        if STORAGE_SERVICE_URL else None
+    )
+)
+search_coalescer = SearchCoalescer(
+    ttl_seconds=SEARCH_CACHE_TTL_SECONDS,
+    max_entries=SEARCH_CACHE_MAX_ENTRIES
+)
+reembedding_service = ReembeddingService(
+    embedding_service=embedding_service,
+    vector_client=vector_client,
+    search_coalescer=search_coalescer
+)
 
 logger.info("All services initialized successfully")
 
 app.state.embedding_service = embedding_service
 app.state.vector_client = vector_client
 app.state.document_processor = document_processor
+app.state.reembedding_service = reembedding_service
+app.state.search_coalescer = search_coalescer
 
 app.include_router(embedding_router.router)
 
 
+COLLECTION_PATH_PATTERN = re.compile(
+    r"^/api/embeddings/collections/(?P<collection>[^/]+)(?:/(?P<action>.*))?$"
+)
+
+
+@app.middleware("http")
+async def invalidate_search_cache(request: Request, call_next):
+    # Any non-search request that may modify a collection drops its cached
+    # search results once the handler has finished, whether it succeeded
+    # or not, and before the client sees the response.
+    try:
+        return await call_next(request)
+    finally:
+        match = COLLECTION_PATH_PATTERN.match(request.url.path)
+        if (
+            match is not None and
+            request.method in ("POST", "PUT", "PATCH", "DELETE") and
+            match.group("action") != "search"
+        ):
+            search_coalescer.invalidate(match.group("collection"))
+
+
 @app.get("/health")
 async def health():
     logger.debug("Health check requested")
@@ -0,0 +1,116 @@
+# Throughput and parity benchmark for the PDF text extractors. Every
+# engine extracts every page of every fixture PDF; the report lists
+# pages/sec and, per engine, the word-level F1 of its output against the
+# reference engine (the first one listed), averaged over pages.
+#
+# Usage:
+#   python -m benchmark.pdf_extraction fixtures/*.pdf \
+#       --engines pypdf pypdfium2 --repeat 3
+
+import argparse
+import glob
+import os
+import time
+
+from collections import Counter
+from typing import Dict, List
+
+from processor.pdf_extractor import PDF_EXTRACTOR_NAMES, create_pdf_extractor
+
+
+def _collect_pdf_paths(paths: List[str]) -> List[str]:
+    pdf_paths = []
+    for path in paths:
+        if os.path.isdir(path):
+            pdf_paths.extend(
+                sorted(glob.glob(os.path.join(path, "**", "*.pdf"), recursive=True))
+            )
+        else:
+            pdf_paths.append(path)
+    return pdf_paths
+
+
+def _word_f1(reference: str, candidate: str) -> float:
+    reference_words = Counter(reference.split())
+    candidate_words = Counter(candidate.split())
+    if not reference_words and not candidate_words:
+        return 1.0
+
+    overlap = sum((reference_words & candidate_words).values())
+    if overlap == 0:
+        return 0.0
+
+    precision = overlap / sum(candidate_words.values())
+    recall = overlap / sum(reference_words.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def run(pdf_paths: List[str], engines: List[str], repeat: int):
+    texts: Dict[str, Dict[str, List[str]]] = {engine: {} for engine in engines}
+
+    print(
+        f"{'engine':>10} {'pages':>7} {'failed':>7} {'seconds':>9} "
+        f"{'pages/sec':>10} {'word F1':>8}"
+    )
+    for engine in engines:
+        extractor = create_pdf_extractor([engine])
+        page_count = 0
+        extracted_pages = 0
+        failed = 0
+        elapsed = 0.0
+
+        for pdf_path in pdf_paths:
+            for attempt in range(repeat):
+                started = time.perf_counter()
+                try:
+                    pages = list(extractor.iter_pages(pdf_path))
+                except Exception as e:
+                    print(f"{engine}: failed on '{pdf_path}': {e}")
+                    failed += 1
+                    break
+                elapsed += time.perf_counter() - started
+                extracted_pages += len(pages)
+                if attempt == 0:
+                    page_count += len(pages)
+                    texts[engine][pdf_path] = pages
+
+        reference = texts[engines[0]]
+        scores = [
+            _word_f1(reference_page, page)
+            for pdf_path, pages in texts[engine].items()
+            if pdf_path in reference
+            for reference_page, page in zip(reference[pdf_path], pages)
+        ]
+        parity = sum(scores) / len(scores) if scores else float("nan")
+
+        print(
+            f"{engine:>10} {page_count:>7} {failed:>7} "
+            f"{elapsed:>9.3f} {extracted_pages / max(elapsed, 1e-9):>10.1f} "
+            f"{parity:>8.4f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure PDF text extraction speed and parity"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="PDF files or directories searched recursively for PDFs"
+    )
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        choices=PDF_EXTRACTOR_NAMES,
+        default=["pypdf", "pypdfium2"],
+        help="Engines to compare; the first one is the parity reference"
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    run(
+        pdf_paths=_collect_pdf_paths(args.paths),
+        engines=args.engines,
+        repeat=args.repeat
+    )
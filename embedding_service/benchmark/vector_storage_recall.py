@@ -0,0 +1,151 @@
+# Recall benchmark for reduced-dimension and reduced-precision vector
+# storage. Exact float32 search over the full model dimension is the
+# ground truth; every (dimension, datatype) combination is reported with
+# its recall@k and bytes per vector.
+#
+# Usage:
+#   python -m benchmark.vector_storage_recall corpus.txt \
+#       --queries queries.txt --dimensions 384 256 128 64 --top-k 10
+
+import argparse
+
+from typing import List, Optional
+
+import numpy as np
+
+from service.embedding_service import EmbeddingService
+from config.vars import SENTENCE_TRANSFORMER_MODEL
+
+
+BYTES_PER_COMPONENT = {
+    "float32": 4,
+    "float16": 2,
+    "uint8": 1,
+}
+
+
+def _read_lines(path: str) -> List[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _store(vectors: np.ndarray, datatype: str) -> np.ndarray:
+    if datatype == "float16":
+        return vectors.astype(np.float16).astype(np.float32)
+
+    if datatype == "uint8":
+        # Symmetric int8 scalar quantization, mirroring what Qdrant keeps
+        # in RAM for collections created with the uint8 datatype.
+        scale = np.abs(vectors).max() / 127.0
+        quantized = np.round(vectors / scale).astype(np.int8)
+        return quantized.astype(np.float32) * scale
+
+    return vectors
+
+
+def _top_k(
+    queries: np.ndarray,
+    corpus: np.ndarray,
+    top_k: int,
+    exclude_self: bool
+) -> np.ndarray:
+    scores = queries @ corpus.T
+    if exclude_self:
+        np.fill_diagonal(scores[:, :len(queries)], -np.inf)
+    return np.argsort(-scores, axis=1)[:, :top_k]
+
+
+def run(
+    corpus_path: str,
+    queries_path: Optional[str],
+    dimensions: List[int],
+    top_k: int
+):
+    embedding_service = EmbeddingService(model_name=SENTENCE_TRANSFORMER_MODEL)
+
+    corpus_texts = _read_lines(corpus_path)
+    corpus = np.asarray(
+        embedding_service.get_encoding_for_batch(corpus_texts),
+        dtype=np.float32
+    )
+
+    exclude_self = queries_path is None
+    if exclude_self:
+        queries = corpus[:min(len(corpus), 200)]
+    else:
+        queries = np.asarray(
+            embedding_service.get_encoding_for_batch(_read_lines(queries_path)),
+            dtype=np.float32
+        )
+
+    ground_truth = _top_k(
+        _normalize(queries),
+        _normalize(corpus),
+        top_k,
+        exclude_self
+    )
+
+    print(
+        f"{'dimension':>10} {'datatype':>9} {'bytes/vec':>10} "
+        f"{'recall@' + str(top_k):>10}"
+    )
+    for dimension in dimensions:
+        projected_queries = _normalize(
+            embedding_service.project(queries, dimension)
+        )
+        projected_corpus = _normalize(
+            embedding_service.project(corpus, dimension)
+        )
+
+        for datatype, component_bytes in BYTES_PER_COMPONENT.items():
+            stored_corpus = _store(projected_corpus, datatype)
+            approximate = _top_k(
+                projected_queries,
+                stored_corpus,
+                top_k,
+                exclude_self
+            )
+
+            hits = sum(
+                len(set(expected) & set(found))
+                for expected, found in zip(ground_truth, approximate)
+            )
+            recall = hits / (len(ground_truth) * top_k)
+            vector_dimension = min(dimension, corpus.shape[1])
+
+            print(
+                f"{vector_dimension:>10} {datatype:>9} "
+                f"{vector_dimension * component_bytes:>10} {recall:>10.4f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure recall of reduced vector storage modes"
+    )
+    parser.add_argument("corpus", help="Text file with one passage per line")
+    parser.add_argument(
+        "--queries",
+        default=None,
+        help="Text file with one query per line (defaults to corpus sample)"
+    )
+    parser.add_argument(
+        "--dimensions",
+        type=int,
+        nargs="+",
+        default=[384, 256, 128, 64]
+    )
+    parser.add_argument("--top-k", type=int, default=10)
+    args = parser.parse_args()
+
+    run(
+        corpus_path=args.corpus,
+        queries_path=args.queries,
+        dimensions=args.dimensions,
+        top_k=args.top_k
+    )
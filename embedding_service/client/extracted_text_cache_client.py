@@ -0,0 +1,65 @@
+import logging
+
+from typing import List, Optional
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+EXTRACTED_TEXT_CACHE_TIMEOUT_SECONDS = 10
+
+
+class ExtractedTextCacheClient:
+
+    # Best effort: the cache only saves work, so any failure to reach the
+    # storage service is logged and treated as a miss.
+
+    def __init__(self, storage_service_url: str):
+        logger.info(
+            f"Initializing ExtractedTextCacheClient for {storage_service_url}"
+        )
+        self.base_url = f"{storage_service_url}/extracted-text"
+        self.client = httpx.Client(timeout=EXTRACTED_TEXT_CACHE_TIMEOUT_SECONDS)
+
+
+    def get_pages(
+        self,
+        content_hash: str,
+        extractor: str
+    ) -> Optional[List[str]]:
+        try:
+            response = self.client.get(
+                f"{self.base_url}/{content_hash}",
+                params={"extractor": extractor}
+            )
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            return response.json()["pages"]
+        except Exception as e:
+            logger.warning(
+                f"Failed to read extracted text cache for "
+                f"{content_hash[:12]}: {e}"
+            )
+            return None
+
+
+    def put_pages(
+        self,
+        content_hash: str,
+        extractor: str,
+        pages: List[str]
+    ):
+        try:
+            response = self.client.put(
+                f"{self.base_url}/{content_hash}",
+                params={"extractor": extractor},
+                json={"pages": pages}
+            )
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning(
+                f"Failed to write extracted text cache for "
+                f"{content_hash[:12]}: {e}"
+            )
@@ -0,0 +1,858 @@
+import os
+import re
+import json
+import shutil
+import logging
+import threading
+
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set, Tuple, Union
+
+import numpy as np
+from qdrant_client.models import PointStruct, UpdateResult, UpdateStatus
+
+from client.vector_client import VectorClient
+from model.search_filter import SearchFilter, MetadataCondition
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 100000
+
+INITIAL_CAPACITY = 1024
+
+# Unit-norm components lie in [-1, 1], so 8-bit storage is a fixed-scale
+# symmetric quantization that needs no per-collection calibration.
+INT8_SCALE = 127.0
+
+STORAGE_DTYPES = {
+    "float32": np.float32,
+    "float16": np.float16,
+    "uint8": np.int8,
+}
+
+COLLECTION_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+META_FILENAME = "meta.json"
+POINTS_FILENAME = "points.json"
+POINTS_LOG_FILENAME = "points.log.jsonl"
+VECTORS_FILENAME = "vectors.npy"
+ALIASES_FILENAME = "aliases.json"
+
+# The points log is folded into points.json on load, and while running
+# once it has grown past the snapshot (and past this floor), which keeps
+# the total bytes written linear in the bytes ingested.
+LOG_COMPACTION_MIN_BYTES = 16 * 1024 * 1024
+
+
+def _write_json_atomic(path: Path, data: Any):
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _project_payload(
+    payload: Dict[str, Any],
+    with_payload: Union[bool, List[str]]
+) -> Optional[Dict[str, Any]]:
+    if with_payload is True:
+        return dict(payload)
+    if not with_payload:
+        return None
+    return {key: payload[key] for key in with_payload if key in payload}
+
+
+def _matches_condition(
+    custom_metadata: Dict[str, Any],
+    condition: MetadataCondition
+) -> bool:
+    if condition.key not in custom_metadata:
+        return False
+    value = custom_metadata[condition.key]
+
+    if condition.equals is not None and value != condition.equals:
+        return False
+
+    bounds = (condition.gt, condition.gte, condition.lt, condition.lte)
+    if all(bound is None for bound in bounds):
+        return True
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+
+    return (
+        (condition.gt is None or value > condition.gt) and
+        (condition.gte is None or value >= condition.gte) and
+        (condition.lt is None or value < condition.lt) and
+        (condition.lte is None or value <= condition.lte)
+    )
+
+
+class _LocalCollection:
+
+    # Vectors live in a memory-mapped .npy file; ids and payloads in a
+    # points.json snapshot plus an append-only log of row changes since
+    # then. Every write appends only the rows it touched, and replaying
+    # the log repeats the same row operations, so rows keep matching the
+    # vector file.
+
+    def __init__(
+        self,
+        path: Path,
+        vector_size: int,
+        datatype: str
+    ):
+        self.path = path
+        self.vector_size = vector_size
+        self.datatype = datatype
+        self.ids: List[str] = []
+        self.payloads: List[Dict[str, Any]] = []
+        self.id_to_row: Dict[str, int] = {}
+        self.source_index: Dict[str, Set[int]] = {}
+        self.vectors: Optional[np.memmap] = None
+        self._log = None
+        self._log_bytes = 0
+        self._snapshot_bytes = 0
+
+
+    @property
+    def count(self) -> int:
+        return len(self.ids)
+
+
+    @classmethod
+    def create(
+        cls,
+        path: Path,
+        vector_size: int,
+        datatype: str
+    ) -> "_LocalCollection":
+        path.mkdir(parents=True, exist_ok=True)
+        collection = cls(path, vector_size, datatype)
+        collection._open_vectors(INITIAL_CAPACITY)
+        _write_json_atomic(
+            path / META_FILENAME,
+            {"vector_size": vector_size, "datatype": datatype}
+        )
+        collection.compact()
+        return collection
+
+
+    @classmethod
+    def load(cls, path: Path) -> "_LocalCollection":
+        with open(path / META_FILENAME, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(path / POINTS_FILENAME, "r", encoding="utf-8") as f:
+            points = json.load(f)
+
+        collection = cls(path, meta["vector_size"], meta["datatype"])
+        collection.vectors = np.load(path / VECTORS_FILENAME, mmap_mode="r+")
+        collection.ids = points["ids"]
+        collection.payloads = points["payloads"]
+        collection.id_to_row = {
+            point_id: row for row, point_id in enumerate(collection.ids)
+        }
+        for row, payload in enumerate(collection.payloads):
+            collection._index_row(row, payload)
+
+        log_path = path / POINTS_LOG_FILENAME
+        if log_path.exists():
+            collection._replay_log(log_path)
+        collection.compact()
+        return collection
+
+
+    def _replay_log(self, log_path: Path):
+        replayed = 0
+        with open(log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A line cut short by a crash; nothing after it was
+                    # acknowledged either.
+                    logger.warning(
+                        f"Ignoring truncated record in {log_path}"
+                    )
+                    break
+
+                if record["op"] == "put":
+                    self._put_row(
+                        record["row"],
+                        record["id"],
+                        record["payload"]
+                    )
+                elif record["op"] == "delete":
+                    self._delete_row(record["row"])
+                replayed += 1
+
+        logger.debug(f"Replayed {replayed} records from {log_path}")
+
+
+    def _open_vectors(self, capacity: int):
+        vectors_path = self.path / VECTORS_FILENAME
+        tmp_path = self.path / (VECTORS_FILENAME + ".tmp")
+
+        vectors = np.lib.format.open_memmap(
+            tmp_path,
+            mode="w+",
+            dtype=STORAGE_DTYPES[self.datatype],
+            shape=(capacity, self.vector_size)
+        )
+        if self.vectors is not None and self.count:
+            vectors[:self.count] = self.vectors[:self.count]
+        vectors.flush()
+        del vectors
+
+        self.vectors = None
+        os.replace(tmp_path, vectors_path)
+        self.vectors = np.load(vectors_path, mmap_mode="r+")
+
+
+    def compact(self):
+        # Writes the full snapshot and starts an empty log.
+        if self.vectors is not None:
+            self.vectors.flush()
+        self.close()
+
+        points_path = self.path / POINTS_FILENAME
+        _write_json_atomic(
+            points_path,
+            {"ids": self.ids, "payloads": self.payloads}
+        )
+        self._snapshot_bytes = points_path.stat().st_size
+
+        log_path = self.path / POINTS_LOG_FILENAME
+        if log_path.exists():
+            log_path.unlink()
+        self._log_bytes = 0
+
+
+    def close(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
+    def _append_log(self, records: List[Dict[str, Any]]):
+        if not records:
+            return
+
+        # Vectors are flushed first so a logged row never points at
+        # vector data that did not reach the file.
+        self.vectors.flush()
+
+        if self._log is None:
+            self._log = open(
+                self.path / POINTS_LOG_FILENAME,
+                "a",
+                encoding="utf-8"
+            )
+        data = "".join(json.dumps(record) + "\n" for record in records)
+        self._log.write(data)
+        self._log.flush()
+        self._log_bytes += len(data)
+
+        if self._log_bytes > max(self._snapshot_bytes, LOG_COMPACTION_MIN_BYTES):
+            self.compact()
+
+
+    def _index_row(self, row: int, payload: Dict[str, Any]):
+        source_name = payload.get("source_name")
+        if source_name is not None:
+            self.source_index.setdefault(source_name, set()).add(row)
+
+
+    def _unindex_row(self, row: int, payload: Dict[str, Any]):
+        source_name = payload.get("source_name")
+        rows = self.source_index.get(source_name)
+        if rows is not None:
+            rows.discard(row)
+            if not rows:
+                del self.source_index[source_name]
+
+
+    def _encode(self, vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        vectors = vectors / np.maximum(norms, 1e-12)
+
+        if self.datatype == "uint8":
+            return np.round(vectors * INT8_SCALE).astype(np.int8)
+        return vectors.astype(STORAGE_DTYPES[self.datatype])
+
+
+    def _decode(self, vectors: np.ndarray) -> np.ndarray:
+        if self.datatype == "uint8":
+            return vectors.astype(np.float32) / INT8_SCALE
+        return vectors.astype(np.float32)
+
+
+    def upsert(self, points: List[PointStruct]):
+        if not points:
+            return
+
+        vectors = np.asarray(
+            [point.vector for point in points],
+            dtype=np.float32
+        )
+        if vectors.ndim != 2 or vectors.shape[1] != self.vector_size:
+            raise ValueError(
+                f"Expected vectors of size {self.vector_size}, "
+                f"got shape {vectors.shape}"
+            )
+
+        new_ids = {
+            str(point.id) for point in points
+            if str(point.id) not in self.id_to_row
+        }
+        required_capacity = self.count + len(new_ids)
+        if required_capacity > self.vectors.shape[0]:
+            capacity = self.vectors.shape[0]
+            while capacity < required_capacity:
+                capacity *= 2
+            self._open_vectors(capacity)
+
+        encoded = self._encode(vectors)
+        records = []
+        for point, vector in zip(points, encoded):
+            point_id = str(point.id)
+            payload = dict(point.payload or {})
+            row = self.id_to_row.get(point_id, self.count)
+
+            self._put_row(row, point_id, payload)
+            self.vectors[row] = vector
+            records.append(
+                {"op": "put", "row": row, "id": point_id, "payload": payload}
+            )
+
+        self._append_log(records)
+
+
+    def _put_row(self, row: int, point_id: str, payload: Dict[str, Any]):
+        if row == self.count:
+            self.ids.append(point_id)
+            self.payloads.append(payload)
+            self.id_to_row[point_id] = row
+        else:
+            self._unindex_row(row, self.payloads[row])
+            self.payloads[row] = payload
+        self._index_row(row, payload)
+
+
+    def _delete_row(self, row: int):
+        # Keep storage dense by moving the last row into the freed slot.
+        last = self.count - 1
+        self._unindex_row(row, self.payloads[row])
+        del self.id_to_row[self.ids[row]]
+
+        if row != last:
+            self._unindex_row(last, self.payloads[last])
+            self.vectors[row] = self.vectors[last]
+            self.ids[row] = self.ids[last]
+            self.payloads[row] = self.payloads[last]
+            self.id_to_row[self.ids[row]] = row
+            self._index_row(row, self.payloads[row])
+
+        self.ids.pop()
+        self.payloads.pop()
+
+
+    def delete_rows(self, rows: Set[int]):
+        records = []
+        for row in sorted(rows, reverse=True):
+            self._delete_row(row)
+            records.append({"op": "delete", "row": row})
+        self._append_log(records)
+
+
+    def update_payload_field(self, rows: Set[int], key: str, value: Any):
+        records = []
+        for row in sorted(rows):
+            self.payloads[row][key] = value
+            records.append({
+                "op": "put",
+                "row": row,
+                "id": self.ids[row],
+                "payload": self.payloads[row]
+            })
+        self._append_log(records)
+
+
+    def rows_for_source(self, source_name: str) -> Set[int]:
+        return set(self.source_index.get(source_name, set()))
+
+
+    def rows_matching(self, search_filter: SearchFilter) -> np.ndarray:
+        # Narrow through the source_name index first; custom metadata
+        # conditions are checked by scanning the remaining candidates.
+        if search_filter.source_names is not None:
+            candidates = set()
+            for source_name in search_filter.source_names:
+                candidates |= self.source_index.get(source_name, set())
+            candidates = sorted(candidates)
+        else:
+            candidates = range(self.count)
+
+        rows = [
+            row for row in candidates
+            if all(
+                _matches_condition(
+                    self.payloads[row].get("custom_metadata") or {},
+                    condition
+                )
+                for condition in search_filter.custom_metadata
+            )
+        ]
+        return np.asarray(rows, dtype=np.int64)
+
+
+    def vectors_for_rows(self, rows: List[int]) -> np.ndarray:
+        return self._decode(self.vectors[rows])
+
+
+    def scores(
+        self,
+        query_vector: List[float],
+        rows: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        query = np.asarray(query_vector, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        vectors = (
+            self.vectors[:self.count] if rows is None else self.vectors[rows]
+        )
+        return self._decode(vectors) @ query
+
+
+class LocalVectorClient(VectorClient):
+
+    def __init__(self, storage_path: str):
+        logger.info(
+            f"Initializing LocalVectorClient with storage path: {storage_path}"
+        )
+        self.storage_path = Path(storage_path)
+        self.storage_path.mkdir(parents=True, exist_ok=True)
+        self._collections: Dict[str, _LocalCollection] = {}
+        self._aliases: Dict[str, str] = {}
+        aliases_path = self.storage_path / ALIASES_FILENAME
+        if aliases_path.exists():
+            with open(aliases_path, "r", encoding="utf-8") as f:
+                self._aliases = json.load(f)
+        self._lock = threading.RLock()
+        logger.debug("LocalVectorClient initialized successfully")
+
+
+    def _collection_path(self, collection_name: str) -> Path:
+        if not COLLECTION_NAME_PATTERN.match(collection_name):
+            raise ValueError(
+                f"Invalid collection name '{collection_name}'"
+            )
+        return self.storage_path / collection_name
+
+
+    def _resolve(self, collection_name: str) -> str:
+        return self._aliases.get(collection_name, collection_name)
+
+
+    def _get_collection(self, collection_name: str) -> _LocalCollection:
+        collection_name = self._resolve(collection_name)
+        collection = self._collections.get(collection_name)
+        if collection is not None:
+            return collection
+
+        path = self._collection_path(collection_name)
+        if not (path / META_FILENAME).exists():
+            raise ValueError(f"Collection '{collection_name}' not found")
+
+        collection = _LocalCollection.load(path)
+        self._collections[collection_name] = collection
+        return collection
+
+
+    def _close_collection(self, collection_name: str):
+        collection = self._collections.pop(collection_name, None)
+        if collection is not None:
+            collection.close()
+
+
+    def create_collection(
+        self,
+        collection_name: str,
+        vector_size: int,
+        datatype: str = "float32"
+    ):
+        logger.info(
+            f"Creating collection '{collection_name}' with vector size "
+            f"{vector_size} and datatype '{datatype}'"
+        )
+        with self._lock:
+            try:
+                path = self._collection_path(collection_name)
+                self._close_collection(collection_name)
+                if path.exists():
+                    shutil.rmtree(path)
+
+                self._collections[collection_name] = _LocalCollection.create(
+                    path,
+                    vector_size,
+                    datatype
+                )
+                logger.info(f"Collection '{collection_name}' created successfully")
+            except Exception as e:
+                logger.error(f"Failed to create collection '{collection_name}': {e}")
+                raise Exception(f"Failed to create collection: {e}")
+
+
+    def upsert(
+        self,
+        collection_name: str,
+        points: List[PointStruct],
+        wait: bool = True
+    ):
+        # Writes are applied and logged synchronously under the lock, so
+        # every upsert is already a consistency barrier.
+        logger.debug(f"Upserting {len(points)} points to collection '{collection_name}'")
+        with self._lock:
+            try:
+                self._get_collection(collection_name).upsert(points)
+                logger.debug(f"Successfully upserted {len(points)} points to collection '{collection_name}'")
+            except Exception as e:
+                logger.error(f"Failed to upsert points to collection '{collection_name}': {e}")
+                raise
+
+
+    def collection_exists(self, collection_name: str) -> bool:
+        logger.debug(f"Checking if collection '{collection_name}' exists")
+        with self._lock:
+            collection_name = self._resolve(collection_name)
+            if collection_name in self._collections:
+                return True
+            try:
+                path = self._collection_path(collection_name)
+            except ValueError:
+                return False
+            return (path / META_FILENAME).exists()
+
+
+    def get_vector_size(self, collection_name: str) -> int:
+        with self._lock:
+            return self._get_collection(collection_name).vector_size
+
+
+    def get_vector_datatype(self, collection_name: str) -> str:
+        with self._lock:
+            return self._get_collection(collection_name).datatype
+
+
+    def create_payload_index(
+        self,
+        collection_name: str,
+        field_name: str,
+        field_schema: str
+    ):
+        # source_name is always indexed; other fields are filtered by
+        # scanning, which is cheap at the sizes this backend targets.
+        logger.debug(
+            f"Payload index on '{field_name}' requested for local "
+            f"collection '{collection_name}'; filtering by scan"
+        )
+
+
+    def get_payload_indexes(self, collection_name: str) -> Dict[str, str]:
+        with self._lock:
+            self._get_collection(collection_name)
+            return {"source_name": "keyword"}
+
+
+    def get_collections(self) -> List[str]:
+        logger.debug("Fetching all collections")
+        with self._lock:
+            alias_targets = set(self._aliases.values())
+            collection_names = [
+                path.name for path in self.storage_path.iterdir()
+                if (path / META_FILENAME).exists()
+                and path.name not in alias_targets
+            ]
+            collection_names.extend(self._aliases.keys())
+            return sorted(collection_names)
+
+
+    def resolve_alias(self, alias_name: str) -> Optional[str]:
+        with self._lock:
+            return self._aliases.get(alias_name)
+
+
+    def set_alias(self, alias_name: str, collection_name: str):
+        logger.info(
+            f"Pointing alias '{alias_name}' to collection '{collection_name}'"
+        )
+        with self._lock:
+            self._collection_path(alias_name)
+            self._get_collection(collection_name)
+            self._aliases[alias_name] = collection_name
+            _write_json_atomic(
+                self.storage_path / ALIASES_FILENAME,
+                self._aliases
+            )
+
+
+    def delete_collection(self, collection_name: str) -> bool:
+        logger.info(f"Deleting collection '{collection_name}'")
+        with self._lock:
+            try:
+                if collection_name in self._aliases:
+                    alias_name = collection_name
+                    collection_name = self._aliases.pop(alias_name)
+                    _write_json_atomic(
+                        self.storage_path / ALIASES_FILENAME,
+                        self._aliases
+                    )
+
+                path = self._collection_path(collection_name)
+                self._close_collection(collection_name)
+                if path.exists():
+                    shutil.rmtree(path)
+                logger.info(f"Collection '{collection_name}' deleted successfully")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to delete collection '{collection_name}': {e}")
+                raise
+
+
+    def clear_collection(self, collection_name: str) -> int:
+        logger.info(f"Clearing all points from collection '{collection_name}'")
+        with self._lock:
+            collection = self._get_collection(collection_name)
+            count_before = collection.count
+            self.create_collection(
+                self._resolve(collection_name),
+                collection.vector_size,
+                datatype=collection.datatype
+            )
+            logger.info(
+                f"Cleared {count_before} points from "
+                f"collection '{collection_name}'"
+            )
+            return count_before
+
+
+    def search(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        top_k: int,
+        score_threshold: Optional[float] = None,
+        with_payload: Union[bool, List[str]] = True,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[Dict[str, Any]]:
+        logger.debug(
+            f"Searching collection '{collection_name}' " +
+            f"with top_k={top_k}, score_threshold={score_threshold}"
+        )
+        with self._lock:
+            collection = self._get_collection(collection_name)
+            if collection.count == 0 or top_k <= 0:
+                return []
+
+            # Exact search: score every candidate vector (all of them, or
+            # only the filter matches), then select the top k with a
+            # partial sort instead of sorting the whole candidate set.
+            rows = (
+                collection.rows_matching(search_filter)
+                if search_filter is not None
+                else np.arange(collection.count)
+            )
+            k = min(top_k, len(rows))
+            if k == 0:
+                return []
+
+            scores = collection.scores(
+                query_vector,
+                rows=rows if search_filter is not None else None
+            )
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+
+            if score_threshold is not None:
+                top = top[scores[top] >= score_threshold]
+
+            results = [
+                {
+                    "id": collection.ids[rows[i]],
+                    "score": float(scores[i]),
+                    "metadata": _project_payload(
+                        collection.payloads[rows[i]],
+                        with_payload
+                    )
+                } for i in top
+            ]
+            logger.debug(
+                f"Search returned {len(results)} results " +
+                f"from collection '{collection_name}'"
+            )
+            return results
+
+
+    def retrieve(
+        self,
+        collection_name: str,
+        ids: List[Union[str, int]],
+        with_payload: Union[bool, List[str]] = True,
+        with_vectors: bool = False
+    ) -> List[Dict[str, Any]]:
+        with self._lock:
+            collection = self._get_collection(collection_name)
+            rows = [
+                collection.id_to_row[str(point_id)] for point_id in ids
+                if str(point_id) in collection.id_to_row
+            ]
+            results = [
+                {
+                    "id": collection.ids[row],
+                    "payload": _project_payload(
+                        collection.payloads[row],
+                        with_payload
+                    )
+                }
+                for row in rows
+            ]
+            if with_vectors and rows:
+                vectors = collection.vectors_for_rows(rows)
+                for result, vector in zip(results, vectors):
+                    result["vector"] = vector.tolist()
+            return results
+
+
+    def count_points(self, collection_name: str) -> int:
+        with self._lock:
+            return self._get_collection(collection_name).count
+
+
+    def scroll_points(
+        self,
+        collection_name: str,
+        limit: int,
+        offset: Optional[Union[str, int]] = None,
+        with_payload: bool = True,
+        with_vectors: bool = False
+    ) -> Tuple[List[Dict[str, Any]], Optional[Union[str, int]]]:
+        # Offsets are row positions. Deleting points while scrolling can
+        # move rows, so callers reconcile ids once the scroll is done.
+        with self._lock:
+            collection = self._get_collection(collection_name)
+            start = int(offset or 0)
+            rows = list(range(start, min(start + limit, collection.count)))
+            results = [
+                {
+                    "id": collection.ids[row],
+                    "payload": (
+                        dict(collection.payloads[row]) if with_payload else None
+                    )
+                }
+                for row in rows
+            ]
+            if with_vectors and rows:
+                vectors = collection.vectors_for_rows(rows)
+                for result, vector in zip(results, vectors):
+                    result["vector"] = vector.tolist()
+
+            next_offset = start + len(rows)
+            if next_offset >= collection.count:
+                next_offset = None
+            return results, next_offset
+
+
+    def get_all_points(
+        self,
+        collection_name: str,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        with self._lock:
+            collection = self._get_collection(collection_name)
+            limit = limit if limit is not None else DEFAULT_LIMIT
+            return [
+                {
+                    "id": collection.ids[row],
+                    "payload": dict(collection.payloads[row])
+                }
+                for row in range(min(limit, collection.count))
+            ]
+
+
+    def get_point_ids_by_source(
+        self,
+        collection_name: str,
+        source_name: str
+    ) -> List[str]:
+        with self._lock:
+            collection = self._get_collection(collection_name)
+            return [
+                collection.ids[row]
+                for row in sorted(collection.rows_for_source(source_name))
+            ]
+
+
+    def delete_points(
+        self,
+        collection_name: str,
+        ids: List[Union[str, int]]
+    ) -> int:
+        logger.info(
+            f"Deleting {len(ids)} points from '{collection_name}'"
+        )
+        with self._lock:
+            collection = self._get_collection(collection_name)
+            rows = {
+                collection.id_to_row[str(point_id)] for point_id in ids
+                if str(point_id) in collection.id_to_row
+            }
+            collection.delete_rows(rows)
+            return len(rows)
+
+
+    def count_points_by_source(
+        self,
+        collection_name: str,
+        source_name: str
+    ) -> int:
+        with self._lock:
+            collection = self._get_collection(collection_name)
+            return len(collection.rows_for_source(source_name))
+
+
+    def delete_points_by_source(
+        self,
+        collection_name: str,
+        source_name: str
+    ) -> int:
+        logger.info(
+            f"Deleting points from '{collection_name}' "
+            f"with source_name='{source_name}'"
+        )
+        with self._lock:
+            collection = self._get_collection(collection_name)
+            rows = collection.rows_for_source(source_name)
+            collection.delete_rows(rows)
+            return len(rows)
+
+
+    def update_custom_metadata_by_source(
+        self,
+        collection_name: str,
+        source_name: str,
+        custom_metadata: Dict[str, Any]
+    ) -> UpdateResult:
+        logger.info(
+            f"Updating custom_metadata for points in '{collection_name}' "
+            f"with source_name='{source_name}'"
+        )
+        with self._lock:
+            collection = self._get_collection(collection_name)
+            collection.update_payload_field(
+                collection.rows_for_source(source_name),
+                "custom_metadata",
+                custom_metadata
+            )
+            return UpdateResult(
+                operation_id=0,
+                status=UpdateStatus.COMPLETED
+            )
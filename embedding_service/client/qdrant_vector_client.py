@@ -1,46 +1,196 @@
 import logging
+import threading
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
     PointStruct,
     Distance,
     VectorParams,
+    Datatype,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
     Filter, 
     FieldCondition, 
+    Condition,
     MatchValue,
+    MatchAny,
+    Range,
+    PayloadSchemaType,
+    PointIdsList,
+    HnswConfigDiff,
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
     UpdateResult
 )
 
+from client.vector_client import VectorClient
+from model.search_filter import SearchFilter
+
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_LIMIT = 100000
 
+SCROLL_PAGE_SIZE = 1000
+
+
+def _source_condition(source_name: str) -> FieldCondition:
+    return FieldCondition(
+        key="source_name",
+        match=MatchValue(value=source_name)
+    )
+
 
-class QdrantVectorClient:
+def _to_qdrant_conditions(
+    search_filter: Optional[SearchFilter]
+) -> List[FieldCondition]:
+    if search_filter is None:
+        return []
+
+    conditions = []
+
+    if search_filter.source_names is not None:
+        conditions.append(
+            FieldCondition(
+                key="source_name",
+                match=MatchAny(any=search_filter.source_names)
+            )
+        )
+
+    for condition in search_filter.custom_metadata:
+        key = f"custom_metadata.{condition.key}"
+
+        if isinstance(condition.equals, float):
+            # MatchValue only covers keywords, integers and booleans.
+            conditions.append(
+                FieldCondition(
+                    key=key,
+                    range=Range(gte=condition.equals, lte=condition.equals)
+                )
+            )
+        elif condition.equals is not None:
+            conditions.append(
+                FieldCondition(
+                    key=key,
+                    match=MatchValue(value=condition.equals)
+                )
+            )
+
+        if any(
+            bound is not None for bound in
+            (condition.gt, condition.gte, condition.lt, condition.lte)
+        ):
+            conditions.append(
+                FieldCondition(
+                    key=key,
+                    range=Range(
+                        gt=condition.gt,
+                        gte=condition.gte,
+                        lt=condition.lt,
+                        lte=condition.lte
+                    )
+                )
+            )
+
+    return conditions
+
+
+class QdrantVectorClient(VectorClient):
 
     def __init__(self, url: str):
         logger.info(f"Initializing QdrantVectorClient with URL: {url}")
         self.client = QdrantClient(url=url)
+        # Vector sizes are read on every search and embed request, so they
+        # are remembered per collection name. Any create, delete or alias
+        # change drops them all, since it can re-point a name.
+        self._vector_sizes: Dict[str, int] = {}
+        self._vector_sizes_lock = threading.Lock()
         logger.debug("QdrantVectorClient initialized successfully")
 
 
+    def _invalidate_vector_sizes(self):
+        with self._vector_sizes_lock:
+            self._vector_sizes.clear()
+
+
+    def _scope(
+        self,
+        collection_name: str,
+        conditions: Optional[List[Condition]] = None
+    ) -> Tuple[str, Optional[Filter]]:
+        # Maps a collection name to the physical collection and filter that
+        # hold its points; overridden by the shared tenant layout.
+        return collection_name, Filter(must=conditions) if conditions else None
+
+
+    def _read_payload(
+        self,
+        payload: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        # Hook for payload keys that belong to the storage layout rather
+        # than the caller; overridden by the shared tenant layout.
+        return payload
+
+
     def create_collection(
         self,
         collection_name: str,
-        vector_size: int
+        vector_size: int,
+        datatype: str = "float32",
+        hnsw_config: Optional[HnswConfigDiff] = None
     ):
-        logger.info(f"Creating collection '{collection_name}' with vector size {vector_size}")
+        logger.info(
+            f"Creating collection '{collection_name}' with vector size "
+            f"{vector_size} and datatype '{datatype}'"
+        )
         client: QdrantClient = self.client
+
+        # float16 is stored natively by Qdrant. For 8-bit storage the
+        # original vectors are kept on disk and searched through an int8
+        # scalar-quantized copy held in RAM, since Qdrant's raw uint8
+        # datatype expects 0-255 integers rather than unit-norm floats.
+        quantization_config = None
+        if datatype == "float16":
+            vectors_config = VectorParams(
+                size=vector_size,
+                distance=Distance.COSINE,
+                datatype=Datatype.FLOAT16
+            )
+        elif datatype == "uint8":
+            vectors_config = VectorParams(
+                size=vector_size,
+                distance=Distance.COSINE,
+                on_disk=True
+            )
+            quantization_config = ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    always_ram=True
+                )
+            )
+        else:
+            vectors_config = VectorParams(
+                size=vector_size,
+                distance=Distance.COSINE
+            )
+
+        self._invalidate_vector_sizes()
         try:
             client.recreate_collection(
                 collection_name=collection_name,
-                vectors_config=VectorParams(
-                    size=vector_size,
-                    distance=Distance.COSINE
-                ),
+                vectors_config=vectors_config,
+                quantization_config=quantization_config,
+                hnsw_config=hnsw_config,
+            )
+            self.create_payload_index(
+                collection_name,
+                field_name="source_name",
+                field_schema="keyword"
             )
             logger.info(f"Collection '{collection_name}' created successfully")
         except Exception as e:
@@ -48,17 +198,43 @@ class QdrantVectorClient:
             raise Exception(f"Failed to create collection: {e}")
 
 
+    def create_payload_index(
+        self,
+        collection_name: str,
+        field_name: str,
+        field_schema: str
+    ):
+        logger.info(
+            f"Creating {field_schema} payload index on '{field_name}' "
+            f"in collection '{collection_name}'"
+        )
+        try:
+            self.client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=PayloadSchemaType(field_schema)
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to create payload index on '{field_name}' "
+                f"in collection '{collection_name}': {e}"
+            )
+            raise
+
+
     def upsert(
         self,
         collection_name: str,
-        points: List[PointStruct]
+        points: List[PointStruct],
+        wait: bool = True
     ):
         logger.debug(f"Upserting {len(points)} points to collection '{collection_name}'")
         client: QdrantClient = self.client
         try:
             client.upsert(
                 collection_name=collection_name,
-                points=points
+                points=points,
+                wait=wait
             )
             logger.debug(f"Successfully upserted {len(points)} points to collection '{collection_name}'")
         except Exception as e:
@@ -66,6 +242,14 @@ class QdrantVectorClient:
             raise
 
 
+    def _get_alias_targets(self) -> Dict[str, str]:
+        response = self.client.get_aliases()
+        return {
+            alias.alias_name: alias.collection_name
+            for alias in response.aliases
+        }
+
+
     def collection_exists(self, collection_name: str) -> bool:
         logger.debug(f"Checking if collection '{collection_name}' exists")
         try:
@@ -73,7 +257,7 @@ class QdrantVectorClient:
             exists = any(
                 collection.name == collection_name 
                 for collection in collections.collections
-            )
+            ) or collection_name in self._get_alias_targets()
             logger.debug(
                 f"Collection '{collection_name}' exists: {exists}"
             )
@@ -83,11 +267,72 @@ class QdrantVectorClient:
             raise
         
 
+    def get_vector_size(self, collection_name: str) -> int:
+        logger.debug(f"Fetching vector size of collection '{collection_name}'")
+        with self._vector_sizes_lock:
+            vector_size = self._vector_sizes.get(collection_name)
+        if vector_size is not None:
+            return vector_size
+
+        try:
+            info = self.client.get_collection(collection_name=collection_name)
+            vector_size = info.config.params.vectors.size
+        except Exception as e:
+            logger.error(
+                f"Failed to fetch vector size of collection "
+                f"'{collection_name}': {e}"
+            )
+            raise
+
+        with self._vector_sizes_lock:
+            self._vector_sizes[collection_name] = vector_size
+        return vector_size
+
+
+    def get_vector_datatype(self, collection_name: str) -> str:
+        try:
+            info = self.client.get_collection(collection_name=collection_name)
+            if info.config.params.vectors.datatype == Datatype.FLOAT16:
+                return "float16"
+            if info.config.quantization_config is not None:
+                return "uint8"
+            return "float32"
+        except Exception as e:
+            logger.error(
+                f"Failed to fetch datatype of collection "
+                f"'{collection_name}': {e}"
+            )
+            raise
+
+
+    def get_payload_indexes(self, collection_name: str) -> Dict[str, str]:
+        logger.debug(f"Fetching payload indexes of collection '{collection_name}'")
+        try:
+            info = self.client.get_collection(collection_name=collection_name)
+            return {
+                field_name: str(index_info.data_type.value)
+                for field_name, index_info in info.payload_schema.items()
+            }
+        except Exception as e:
+            logger.error(
+                f"Failed to fetch payload indexes of collection "
+                f"'{collection_name}': {e}"
+            )
+            raise
+
+
     def get_collections(self) -> List[str]:
         logger.debug("Fetching all collections")
         try:
             response = self.client.get_collections()
-            collection_names = [collection.name for collection in response.collections]
+            alias_targets = self._get_alias_targets()
+
+            # Collections backing an alias are reported under the alias.
+            collection_names = [
+                collection.name for collection in response.collections
+                if collection.name not in alias_targets.values()
+            ]
+            collection_names.extend(alias_targets.keys())
             logger.debug(f"Found {len(collection_names)} collections")
             return collection_names
         except Exception as e:
@@ -95,9 +340,63 @@ class QdrantVectorClient:
             raise
 
 
+    def resolve_alias(self, alias_name: str) -> Optional[str]:
+        try:
+            return self._get_alias_targets().get(alias_name)
+        except Exception as e:
+            logger.error(f"Failed to resolve alias '{alias_name}': {e}")
+            raise
+
+
+    def set_alias(self, alias_name: str, collection_name: str):
+        logger.info(
+            f"Pointing alias '{alias_name}' to collection '{collection_name}'"
+        )
+        try:
+            # Deleting and re-creating the alias in a single request is
+            # applied atomically, so readers never see the alias missing.
+            operations = []
+            if alias_name in self._get_alias_targets():
+                operations.append(
+                    DeleteAliasOperation(
+                        delete_alias=DeleteAlias(alias_name=alias_name)
+                    )
+                )
+            operations.append(
+                CreateAliasOperation(
+                    create_alias=CreateAlias(
+                        collection_name=collection_name,
+                        alias_name=alias_name
+                    )
+                )
+            )
+            self.client.update_collection_aliases(
+                change_aliases_operations=operations
+            )
+            self._invalidate_vector_sizes()
+        except Exception as e:
+            logger.error(
+                f"Failed to point alias '{alias_name}' to collection "
+                f"'{collection_name}': {e}"
+            )
+            raise
+
+
     def delete_collection(self, collection_name: str) -> bool:
         logger.info(f"Deleting collection '{collection_name}'")
+        self._invalidate_vector_sizes()
         try:
+            target_name = self._get_alias_targets().get(collection_name)
+            if target_name is not None:
+                self.client.update_collection_aliases(
+                    change_aliases_operations=[
+                        DeleteAliasOperation(
+                            delete_alias=DeleteAlias(alias_name=collection_name)
+                        )
+                    ]
+                )
+                collection_name = target_name
+
             self.client.delete_collection(collection_name=collection_name)
             logger.info(f"Collection '{collection_name}' deleted successfully")
             return True
@@ -109,14 +408,16 @@ class QdrantVectorClient:
     def clear_collection(self, collection_name: str) -> int:
         logger.info(f"Clearing all points from collection '{collection_name}'")
         try:
+            physical_name, points_filter = self._scope(collection_name)
             count_before = self.client.count(
-                collection_name=collection_name
+                collection_name=physical_name,
+                count_filter=points_filter
             ).count
 
             if count_before > 0:
                 self.client.delete(
-                    collection_name=collection_name,
-                    points_selector=Filter(must=[])
+                    collection_name=physical_name,
+                    points_selector=points_filter or Filter(must=[])
                 )
 
             logger.info(
@@ -135,24 +436,34 @@ class QdrantVectorClient:
         self,
         collection_name: str,
         query_vector: List[float],
-        top_k: int
+        top_k: int,
+        score_threshold: Optional[float] = None,
+        with_payload: Union[bool, List[str]] = True,
+        search_filter: Optional[SearchFilter] = None
     ) -> List[Dict[str, Any]]:
         logger.debug(
             f"Searching collection '{collection_name}' " + 
-            f"with top_k={top_k}"
+            f"with top_k={top_k}, score_threshold={score_threshold}"
         )
         client: QdrantClient = self.client
         try:
+            physical_name, query_filter = self._scope(
+                collection_name,
+                _to_qdrant_conditions(search_filter)
+            )
             hits = client.search(
-                collection_name=collection_name,
+                collection_name=physical_name,
                 query_vector=query_vector,
-                limit=top_k
+                query_filter=query_filter,
+                limit=top_k,
+                score_threshold=score_threshold,
+                with_payload=with_payload
             )
             results = [
                 {
                     "id": h.id,
                     "score": h.score,
-                    "metadata": h.payload
+                    "metadata": self._read_payload(h.payload)
                 } for h in hits
             ]
             logger.debug(
@@ -164,6 +475,98 @@ class QdrantVectorClient:
             logger.error(f"Search failed on collection '{collection_name}': {e}")
             raise
 
+
+    def retrieve(
+        self,
+        collection_name: str,
+        ids: List[Union[str, int]],
+        with_payload: Union[bool, List[str]] = True,
+        with_vectors: bool = False
+    ) -> List[Dict[str, Any]]:
+        logger.debug(
+            f"Retrieving {len(ids)} points from collection '{collection_name}'"
+        )
+        client: QdrantClient = self.client
+        try:
+            records = client.retrieve(
+                collection_name=collection_name,
+                ids=ids,
+                with_payload=with_payload,
+                with_vectors=with_vectors
+            )
+            results = []
+            for record in records:
+                result = {
+                    "id": record.id,
+                    "payload": self._read_payload(record.payload)
+                }
+                if with_vectors:
+                    result["vector"] = record.vector
+                results.append(result)
+            return results
+        except Exception as e:
+            logger.error(
+                f"Failed to retrieve points from collection "
+                f"'{collection_name}': {e}"
+            )
+            raise
+
+    
+    def count_points(self, collection_name: str) -> int:
+        try:
+            physical_name, count_filter = self._scope(collection_name)
+            return self.client.count(
+                collection_name=physical_name,
+                count_filter=count_filter,
+                exact=True
+            ).count
+        except Exception as e:
+            logger.error(
+                f"Failed to count points in collection '{collection_name}': {e}"
+            )
+            raise
+
+
+    def scroll_points(
+        self,
+        collection_name: str,
+        limit: int,
+        offset: Optional[Union[str, int]] = None,
+        with_payload: bool = True,
+        with_vectors: bool = False
+    ) -> Tuple[List[Dict[str, Any]], Optional[Union[str, int]]]:
+        logger.debug(
+            f"Scrolling {limit} points from collection '{collection_name}' "
+            f"at offset {offset}"
+        )
+        client: QdrantClient = self.client
+        try:
+            physical_name, scroll_filter = self._scope(collection_name)
+            points, next_offset = client.scroll(
+                collection_name=physical_name,
+                scroll_filter=scroll_filter,
+                limit=limit,
+                offset=offset,
+                with_payload=with_payload,
+                with_vectors=with_vectors
+            )
+            results = []
+            for point in points:
+                result = {
+                    "id": point.id,
+                    "payload": self._read_payload(point.payload)
+                }
+                if with_vectors:
+                    result["vector"] = point.vector
+                results.append(result)
+            return results, next_offset
+        except Exception as e:
+            logger.error(
+                f"Failed to scroll points from collection "
+                f"'{collection_name}': {e}"
+            )
+            raise
+
     
     def get_all_points(
         self,
@@ -178,8 +581,10 @@ class QdrantVectorClient:
         try:
             limit = limit if limit is not None else DEFAULT_LIMIT
 
+            physical_name, scroll_filter = self._scope(collection_name)
             points = client.scroll(
-                collection_name=collection_name,
+                collection_name=physical_name,
+                scroll_filter=scroll_filter,
                 limit=limit,
                 with_payload=True,
                 with_vectors=False
@@ -187,7 +592,7 @@ class QdrantVectorClient:
             results = [
                 {
                     "id": point.id,
-                    "payload": point.payload
+                    "payload": self._read_payload(point.payload)
                 }
                 for point in points[0]
             ]
@@ -204,6 +609,62 @@ class QdrantVectorClient:
             raise
 
 
+    def get_point_ids_by_source(
+        self,
+        collection_name: str,
+        source_name: str
+    ) -> List[str]:
+        logger.debug(
+            f"Fetching point ids in '{collection_name}' "
+            f"with source_name='{source_name}'"
+        )
+        client: QdrantClient = self.client
+        try:
+            physical_name, scroll_filter = self._scope(
+                collection_name,
+                [_source_condition(source_name)]
+            )
+            point_ids = []
+            offset = None
+            while True:
+                points, offset = client.scroll(
+                    collection_name=physical_name,
+                    scroll_filter=scroll_filter,
+                    limit=SCROLL_PAGE_SIZE,
+                    offset=offset,
+                    with_payload=False,
+                    with_vectors=False
+                )
+                point_ids.extend(str(point.id) for point in points)
+                if offset is None:
+                    break
+            return point_ids
+        except Exception as e:
+            logger.error(f"Failed to fetch point ids by source: {e}")
+            raise
+
+
+    def delete_points(
+        self,
+        collection_name: str,
+        ids: List[Union[str, int]]
+    ) -> int:
+        logger.info(
+            f"Deleting {len(ids)} points from '{collection_name}'"
+        )
+        if not ids:
+            return 0
+        try:
+            self.client.delete(
+                collection_name=collection_name,
+                points_selector=PointIdsList(points=ids)
+            )
+            return len(ids)
+        except Exception as e:
+            logger.error(f"Failed to delete points: {e}")
+            raise
+
+
     def count_points_by_source(
         self,
         collection_name: str,
@@ -214,16 +675,13 @@ class QdrantVectorClient:
             f"with source_name='{source_name}'"
         )
         try:          
+            physical_name, count_filter = self._scope(
+                collection_name,
+                [_source_condition(source_name)]
+            )
             count_result = self.client.count(
-                collection_name=collection_name,
-                count_filter=Filter(
-                    must=[
-                        FieldCondition(
-                            key="source_name",
-                            match=MatchValue(value=source_name)
-                        )
-                    ]
-                )
+                collection_name=physical_name,
+                count_filter=count_filter
             )
             logger.debug(
                 f"Found {count_result.count} points with "
@@ -245,28 +703,18 @@ class QdrantVectorClient:
             f"with source_name='{source_name}'"
         )
         try:
+            physical_name, source_filter = self._scope(
+                collection_name,
+                [_source_condition(source_name)]
+            )
             count_before = self.client.count(
-                collection_name=collection_name,
-                count_filter=Filter(
-                    must=[
-                        FieldCondition(
-                            key="source_name",
-                            match=MatchValue(value=source_name)
-                        )
-                    ]
-                )
+                collection_name=physical_name,
+                count_filter=source_filter
             ).count
 
             self.client.delete(
-                collection_name=collection_name,
-                points_selector=Filter(
-                    must=[
-                        FieldCondition(
-                            key="source_name",
-                            match=MatchValue(value=source_name)
-                        )
-                    ]
-                )
+                collection_name=physical_name,
+                points_selector=source_filter
             )
 
             logger.info(
@@ -291,17 +739,14 @@ class QdrantVectorClient:
             f"with source_name='{source_name}'"
         )
         try:
+            physical_name, source_filter = self._scope(
+                collection_name,
+                [_source_condition(source_name)]
+            )
             update_result = self.client.set_payload(
-                collection_name=collection_name,
+                collection_name=physical_name,
                 payload={"custom_metadata": custom_metadata},
-                points=Filter(
-                    must=[
-                        FieldCondition(
-                            key="source_name",
-                            match=MatchValue(value=source_name)
-                        )
-                    ]
-                )
+                points=source_filter
             )
             logger.info(
                 f"Updated custom_metadata in '{collection_name}' " + 
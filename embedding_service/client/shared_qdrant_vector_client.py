@@ -0,0 +1,346 @@
+import uuid
+import logging
+
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+from qdrant_client.models import (
+    PointStruct,
+    Distance,
+    VectorParams,
+    Filter,
+    FieldCondition,
+    Condition,
+    MatchValue,
+    HasIdCondition,
+    HnswConfigDiff,
+)
+
+from client.qdrant_vector_client import QdrantVectorClient, SCROLL_PAGE_SIZE
+
+
+logger = logging.getLogger(__name__)
+
+TENANT_ID_KEY = "tenant_id"
+
+TENANT_REGISTRY_NAMESPACE = uuid.uuid5(
+    uuid.NAMESPACE_URL,
+    "deepresearch/embedding-service/tenants"
+)
+
+# Qdrant builds one HNSW graph per value of the indexed tenant key instead
+# of a global graph; every query on the shared collection carries a
+# tenant filter, so the global graph would never be used.
+SHARED_HNSW_CONFIG = HnswConfigDiff(payload_m=16, m=0)
+
+
+def _tenant_condition(tenant_id: str) -> FieldCondition:
+    return FieldCondition(
+        key=TENANT_ID_KEY,
+        match=MatchValue(value=tenant_id)
+    )
+
+
+class SharedQdrantVectorClient(QdrantVectorClient):
+
+    # Logical collections are tenants of one physical collection, so
+    # there is no physical collection per name to point an alias at.
+    supports_aliases = False
+
+    def __init__(self, url: str, shared_collection_name: str):
+        super().__init__(url)
+        logger.info(
+            f"Using shared collection '{shared_collection_name}' "
+            f"partitioned by '{TENANT_ID_KEY}'"
+        )
+        self.shared_collection_name = shared_collection_name
+        self.registry_collection_name = f"{shared_collection_name}_tenants"
+
+
+    def _scope(
+        self,
+        collection_name: str,
+        conditions: Optional[List[Condition]] = None
+    ) -> Tuple[str, Optional[Filter]]:
+        return self.shared_collection_name, Filter(
+            must=[_tenant_condition(collection_name), *(conditions or [])]
+        )
+
+
+    def _read_payload(
+        self,
+        payload: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        # The tenant key is injected on upsert; callers never wrote it, so
+        # it must not show up in results or snapshot exports.
+        if not payload or TENANT_ID_KEY not in payload:
+            return payload
+        return {
+            key: value for key, value in payload.items()
+            if key != TENANT_ID_KEY
+        }
+
+
+    def _registry_id(self, collection_name: str) -> str:
+        return str(uuid.uuid5(TENANT_REGISTRY_NAMESPACE, collection_name))
+
+
+    def _ensure_shared_collection(self, vector_size: int, datatype: str):
+        client = self.client
+
+        if not client.collection_exists(self.registry_collection_name):
+            client.create_collection(
+                collection_name=self.registry_collection_name,
+                vectors_config=VectorParams(size=1, distance=Distance.DOT)
+            )
+
+        if not client.collection_exists(self.shared_collection_name):
+            super().create_collection(
+                self.shared_collection_name,
+                vector_size,
+                datatype=datatype,
+                hnsw_config=SHARED_HNSW_CONFIG
+            )
+            super().create_payload_index(
+                self.shared_collection_name,
+                field_name=TENANT_ID_KEY,
+                field_schema="keyword"
+            )
+            return
+
+        shared_vector_size = super().get_vector_size(
+            self.shared_collection_name
+        )
+        shared_datatype = super().get_vector_datatype(
+            self.shared_collection_name
+        )
+        if (vector_size, datatype) != (shared_vector_size, shared_datatype):
+            raise ValueError(
+                f"Shared collection '{self.shared_collection_name}' stores "
+                f"{shared_datatype} vectors of size {shared_vector_size}, "
+                f"got {datatype} vectors of size {vector_size}"
+            )
+
+
+    def create_collection(
+        self,
+        collection_name: str,
+        vector_size: int,
+        datatype: str = "float32",
+        hnsw_config: Optional[HnswConfigDiff] = None
+    ):
+        logger.info(
+            f"Creating tenant '{collection_name}' in shared collection "
+            f"'{self.shared_collection_name}'"
+        )
+        try:
+            self._ensure_shared_collection(vector_size, datatype)
+
+            if self.collection_exists(collection_name):
+                self.clear_collection(collection_name)
+
+            self.client.upsert(
+                collection_name=self.registry_collection_name,
+                points=[
+                    PointStruct(
+                        id=self._registry_id(collection_name),
+                        vector=[1.0],
+                        payload={TENANT_ID_KEY: collection_name}
+                    )
+                ]
+            )
+            logger.info(f"Tenant '{collection_name}' created successfully")
+        except Exception as e:
+            logger.error(f"Failed to create tenant '{collection_name}': {e}")
+            raise Exception(f"Failed to create collection: {e}")
+
+
+    def create_payload_index(
+        self,
+        collection_name: str,
+        field_name: str,
+        field_schema: str
+    ):
+        super().create_payload_index(
+            self.shared_collection_name,
+            field_name=field_name,
+            field_schema=field_schema
+        )
+
+
+    def upsert(
+        self,
+        collection_name: str,
+        points: List[PointStruct],
+        wait: bool = True
+    ):
+        super().upsert(
+            self.shared_collection_name,
+            [
+                PointStruct(
+                    id=point.id,
+                    vector=point.vector,
+                    payload={
+                        **(point.payload or {}),
+                        TENANT_ID_KEY: collection_name
+                    }
+                )
+                for point in points
+            ],
+            wait=wait
+        )
+
+
+    def collection_exists(self, collection_name: str) -> bool:
+        logger.debug(f"Checking if tenant '{collection_name}' exists")
+        try:
+            if not self.client.collection_exists(self.registry_collection_name):
+                return False
+            return bool(
+                self.client.retrieve(
+                    collection_name=self.registry_collection_name,
+                    ids=[self._registry_id(collection_name)],
+                    with_payload=False
+                )
+            )
+        except Exception as e:
+            logger.error(f"Failed to check tenant existence: {e}")
+            raise
+
+
+    def get_vector_size(self, collection_name: str) -> int:
+        return super().get_vector_size(self.shared_collection_name)
+
+
+    def get_vector_datatype(self, collection_name: str) -> str:
+        return super().get_vector_datatype(self.shared_collection_name)
+
+
+    def get_payload_indexes(self, collection_name: str) -> Dict[str, str]:
+        payload_indexes = super().get_payload_indexes(
+            self.shared_collection_name
+        )
+        payload_indexes.pop(TENANT_ID_KEY, None)
+        return payload_indexes
+
+
+    def get_collections(self) -> List[str]:
+        logger.debug("Fetching all tenants")
+        try:
+            if not self.client.collection_exists(self.registry_collection_name):
+                return []
+
+            tenant_ids = []
+            offset = None
+            while True:
+                records, offset = self.client.scroll(
+                    collection_name=self.registry_collection_name,
+                    limit=SCROLL_PAGE_SIZE,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=False
+                )
+                tenant_ids.extend(
+                    record.payload[TENANT_ID_KEY] for record in records
+                )
+                if offset is None:
+                    return tenant_ids
+        except Exception as e:
+            logger.error(f"Failed to fetch tenants: {e}")
+            raise
+
+
+    def resolve_alias(self, alias_name: str) -> Optional[str]:
+        return None
+
+
+    def set_alias(self, alias_name: str, collection_name: str):
+        raise ValueError(
+            "Aliases are not supported with the shared collection layout"
+        )
+
+
+    def delete_collection(self, collection_name: str) -> bool:
+        logger.info(f"Deleting tenant '{collection_name}'")
+        try:
+            self.clear_collection(collection_name)
+            self.client.delete(
+                collection_name=self.registry_collection_name,
+                points_selector=Filter(
+                    must=[HasIdCondition(has_id=[self._registry_id(collection_name)])]
+                )
+            )
+            logger.info(f"Tenant '{collection_name}' deleted successfully")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to delete tenant '{collection_name}': {e}")
+            raise
+
+
+    def retrieve(
+        self,
+        collection_name: str,
+        ids: List[Union[str, int]],
+        with_payload: Union[bool, List[str]] = True,
+        with_vectors: bool = False
+    ) -> List[Dict[str, Any]]:
+        if not ids:
+            return []
+
+        # Point ids are global to the shared collection, so lookups go
+        # through the tenant filter rather than a plain retrieve.
+        try:
+            _, tenant_filter = self._scope(
+                collection_name,
+                [HasIdCondition(has_id=ids)]
+            )
+            records, _ = self.client.scroll(
+                collection_name=self.shared_collection_name,
+                scroll_filter=tenant_filter,
+                limit=len(ids),
+                with_payload=with_payload,
+                with_vectors=with_vectors
+            )
+            results = []
+            for record in records:
+                result = {
+                    "id": record.id,
+                    "payload": self._read_payload(record.payload)
+                }
+                if with_vectors:
+                    result["vector"] = record.vector
+                results.append(result)
+            return results
+        except Exception as e:
+            logger.error(
+                f"Failed to retrieve points of tenant '{collection_name}': {e}"
+            )
+            raise
+
+
+    def delete_points(
+        self,
+        collection_name: str,
+        ids: List[Union[str, int]]
+    ) -> int:
+        logger.info(
+            f"Deleting {len(ids)} points of tenant '{collection_name}'"
+        )
+        if not ids:
+            return 0
+        try:
+            _, tenant_filter = self._scope(
+                collection_name,
+                [HasIdCondition(has_id=ids)]
+            )
+            count_before = self.client.count(
+                collection_name=self.shared_collection_name,
+                count_filter=tenant_filter
+            ).count
+            self.client.delete(
+                collection_name=self.shared_collection_name,
+                points_selector=tenant_filter
+            )
+            return count_before
+        except Exception as e:
+            logger.error(f"Failed to delete points: {e}")
+            raise
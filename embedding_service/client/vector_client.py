@@ -0,0 +1,181 @@
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+from qdrant_client.models import PointStruct, UpdateResult
+
+from model.search_filter import SearchFilter
+
+
+class VectorClient(ABC):
+
+    supports_aliases: bool = True
+
+    @abstractmethod
+    def create_collection(
+        self,
+        collection_name: str,
+        vector_size: int,
+        datatype: str = "float32"
+    ):
+        ...
+
+
+    @abstractmethod
+    def upsert(
+        self,
+        collection_name: str,
+        points: List[PointStruct],
+        wait: bool = True
+    ):
+        ...
+
+
+    @abstractmethod
+    def collection_exists(self, collection_name: str) -> bool:
+        ...
+
+
+    @abstractmethod
+    def get_vector_size(self, collection_name: str) -> int:
+        ...
+
+
+    @abstractmethod
+    def get_vector_datatype(self, collection_name: str) -> str:
+        ...
+
+
+    @abstractmethod
+    def create_payload_index(
+        self,
+        collection_name: str,
+        field_name: str,
+        field_schema: str
+    ):
+        ...
+
+
+    @abstractmethod
+    def get_payload_indexes(self, collection_name: str) -> Dict[str, str]:
+        ...
+
+
+    @abstractmethod
+    def get_collections(self) -> List[str]:
+        ...
+
+
+    @abstractmethod
+    def resolve_alias(self, alias_name: str) -> Optional[str]:
+        ...
+
+
+    @abstractmethod
+    def set_alias(self, alias_name: str, collection_name: str):
+        ...
+
+
+    @abstractmethod
+    def delete_collection(self, collection_name: str) -> bool:
+        ...
+
+
+    @abstractmethod
+    def clear_collection(self, collection_name: str) -> int:
+        ...
+
+
+    @abstractmethod
+    def search(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        top_k: int,
+        score_threshold: Optional[float] = None,
+        with_payload: Union[bool, List[str]] = True,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[Dict[str, Any]]:
+        ...
+
+
+    @abstractmethod
+    def retrieve(
+        self,
+        collection_name: str,
+        ids: List[Union[str, int]],
+        with_payload: Union[bool, List[str]] = True,
+        with_vectors: bool = False
+    ) -> List[Dict[str, Any]]:
+        ...
+
+
+    @abstractmethod
+    def count_points(self, collection_name: str) -> int:
+        ...
+
+
+    @abstractmethod
+    def scroll_points(
+        self,
+        collection_name: str,
+        limit: int,
+        offset: Optional[Union[str, int]] = None,
+        with_payload: bool = True,
+        with_vectors: bool = False
+    ) -> Tuple[List[Dict[str, Any]], Optional[Union[str, int]]]:
+        ...
+
+
+    @abstractmethod
+    def get_all_points(
+        self,
+        collection_name: str,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        ...
+
+
+    @abstractmethod
+    def get_point_ids_by_source(
+        self,
+        collection_name: str,
+        source_name: str
+    ) -> List[str]:
+        ...
+
+
+    @abstractmethod
+    def delete_points(
+        self,
+        collection_name: str,
+        ids: List[Union[str, int]]
+    ) -> int:
+        ...
+
+
+    @abstractmethod
+    def count_points_by_source(
+        self,
+        collection_name: str,
+        source_name: str
+    ) -> int:
+        ...
+
+
+    @abstractmethod
+    def delete_points_by_source(
+        self,
+        collection_name: str,
+        source_name: str
+    ) -> int:
+        ...
+
+
+    @abstractmethod
+    def update_custom_metadata_by_source(
+        self,
+        collection_name: str,
+        source_name: str,
+        custom_metadata: Dict[str, Any]
+    ) -> UpdateResult:
+        ...
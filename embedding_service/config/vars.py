@@ -13,7 +13,14 @@ def _get_required_env_var(var_name):
     return value
 
 
-QDRANT_URL = _get_required_env_var("QDRANT_URL")
+VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "qdrant").strip() or "qdrant"
+
+# The embedded local backend needs no Qdrant server.
+QDRANT_URL = (
+    _get_required_env_var("QDRANT_URL")
+    if VECTOR_BACKEND == "qdrant"
+    else os.getenv("QDRANT_URL")
+)
 
 SENTENCE_TRANSFORMER_MODEL = os.getenv(
     "SENTENCE_TRANSFORMER_MODEL",
@@ -25,14 +32,114 @@ def _get_optional_env_var(var_name, default_value):
     return os.getenv(var_name, default_value)
 
 
+# "shared" stores every collection as a tenant of one Qdrant collection,
+# partitioned by an indexed tenant_id payload key.
+VECTOR_STORAGE_LAYOUT = _get_optional_env_var(
+    var_name="VECTOR_STORAGE_LAYOUT",
+    default_value="per_collection"
+).strip() or "per_collection"
+
+SHARED_COLLECTION_NAME = _get_optional_env_var(
+    var_name="SHARED_COLLECTION_NAME",
+    default_value="shared_documents"
+)
+
+LOCAL_VECTOR_STORE_PATH = _get_optional_env_var(
+    var_name="LOCAL_VECTOR_STORE_PATH",
+    default_value="./vector_store"
+)
+
+
 DATABASE_SERVICE_URL = _get_optional_env_var(
     var_name="DATABASE_SERVICE_URL",
     default_value="http://localhost:8003/api/database"
 )
 
+# Set to an empty value to disable the extracted-text cache kept by the
+# storage service.
+STORAGE_SERVICE_URL = _get_optional_env_var(
+    var_name="STORAGE_SERVICE_URL",
+    default_value="http://localhost:8002/api/storage"
+).strip() or None
+
 MAX_UPLOAD_SIZE_MB = int(
     _get_optional_env_var(
         var_name="MAX_UPLOAD_SIZE_MB",
         default_value="50"
     )
 )
+
+MAX_ARCHIVE_UPLOAD_SIZE_MB = int(
+    _get_optional_env_var(
+        var_name="MAX_ARCHIVE_UPLOAD_SIZE_MB",
+        default_value="500"
+    )
+)
+
+MAX_SNAPSHOT_UPLOAD_SIZE_MB = int(
+    _get_optional_env_var(
+        var_name="MAX_SNAPSHOT_UPLOAD_SIZE_MB",
+        default_value="4096"
+    )
+)
+
+# Comma-separated, in order of preference; later engines are fallbacks
+# for documents the earlier ones fail to parse.
+PDF_EXTRACTORS = [
+    extractor_name.strip()
+    for extractor_name in _get_optional_env_var(
+        var_name="PDF_EXTRACTORS",
+        default_value="pypdfium2,pypdf"
+    ).split(",")
+    if extractor_name.strip()
+]
+
+# "tokens" sizes chunks with the model tokenizer so they fit its max
+# sequence length; "characters" cuts every CHUNK_SIZE characters.
+CHUNKING_MODE = _get_optional_env_var(
+    var_name="CHUNKING_MODE",
+    default_value="tokens"
+).strip() or "tokens"
+
+# 0 fills the model window.
+CHUNK_SIZE_TOKENS = int(
+    _get_optional_env_var(
+        var_name="CHUNK_SIZE_TOKENS",
+        default_value="0"
+    )
+) or None
+
+CHUNK_OVERLAP_TOKENS = int(
+    _get_optional_env_var(
+        var_name="CHUNK_OVERLAP_TOKENS",
+        default_value="32"
+    )
+)
+
+# Identical concurrent searches always share one computation; finished
+# results are additionally reused for this long (0 disables the cache).
+SEARCH_CACHE_TTL_SECONDS = float(
+    _get_optional_env_var(
+        var_name="SEARCH_CACHE_TTL_SECONDS",
+        default_value="30"
+    )
+)
+
+SEARCH_CACHE_MAX_ENTRIES = int(
+    _get_optional_env_var(
+        var_name="SEARCH_CACHE_MAX_ENTRIES",
+        default_value="1024"
+    )
+)
+
+VECTOR_DIMENSION = int(
+    _get_optional_env_var(
+        var_name="VECTOR_DIMENSION",
+        default_value="0"
+    )
+) or None
+
+VECTOR_DATATYPE = _get_optional_env_var(
+    var_name="VECTOR_DATATYPE",
+    default_value="float32"
+)
@@ -0,0 +1,137 @@
+# Converts per-profile collections into tenants of the shared collection
+# used by VECTOR_STORAGE_LAYOUT=shared. Every source collection becomes a
+# tenant with the same name; points keep their ids, vectors and payloads.
+# Collections whose vector size or datatype differs from the shared
+# collection are reported and skipped.
+#
+# Usage:
+#   python -m migration.shared_collection [collection ...] \
+#       --batch-size 512 --delete-source
+
+import argparse
+
+from typing import List, Optional
+
+from qdrant_client.models import PointStruct
+
+from client.qdrant_vector_client import QdrantVectorClient
+from client.shared_qdrant_vector_client import SharedQdrantVectorClient
+from config.vars import QDRANT_URL, SHARED_COLLECTION_NAME
+
+
+def migrate_collection(
+    source_client: QdrantVectorClient,
+    shared_client: SharedQdrantVectorClient,
+    collection_name: str,
+    batch_size: int,
+    delete_source: bool
+) -> int:
+    shared_client.create_collection(
+        collection_name,
+        source_client.get_vector_size(collection_name),
+        datatype=source_client.get_vector_datatype(collection_name)
+    )
+    for field_name, field_schema in (
+        source_client.get_payload_indexes(collection_name).items()
+    ):
+        shared_client.create_payload_index(
+            collection_name,
+            field_name=field_name,
+            field_schema=field_schema
+        )
+
+    copied = 0
+    offset = None
+    while True:
+        points, offset = source_client.scroll_points(
+            collection_name,
+            limit=batch_size,
+            offset=offset,
+            with_vectors=True
+        )
+        if points:
+            shared_client.upsert(
+                collection_name,
+                [
+                    PointStruct(
+                        id=point["id"],
+                        vector=point["vector"],
+                        payload=point["payload"]
+                    )
+                    for point in points
+                ]
+            )
+        copied += len(points)
+        if offset is None:
+            break
+
+    source_count = source_client.count_points(collection_name)
+    tenant_count = shared_client.count_points(collection_name)
+    if tenant_count != source_count:
+        raise RuntimeError(
+            f"Tenant has {tenant_count} points, "
+            f"source collection has {source_count}"
+        )
+
+    if delete_source:
+        source_client.delete_collection(collection_name)
+
+    return copied
+
+
+def run(
+    collection_names: Optional[List[str]],
+    batch_size: int,
+    delete_source: bool
+):
+    source_client = QdrantVectorClient(url=QDRANT_URL)
+    shared_client = SharedQdrantVectorClient(
+        url=QDRANT_URL,
+        shared_collection_name=SHARED_COLLECTION_NAME
+    )
+
+    if not collection_names:
+        collection_names = [
+            name for name in source_client.get_collections()
+            if name not in (
+                shared_client.shared_collection_name,
+                shared_client.registry_collection_name,
+            )
+        ]
+
+    for collection_name in collection_names:
+        try:
+            copied = migrate_collection(
+                source_client,
+                shared_client,
+                collection_name,
+                batch_size,
+                delete_source
+            )
+            print(f"{collection_name}: migrated {copied} points")
+        except Exception as e:
+            print(f"{collection_name}: skipped ({e})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Move per-profile collections into the shared collection"
+    )
+    parser.add_argument(
+        "collections",
+        nargs="*",
+        help="Collections to migrate (defaults to all)"
+    )
+    parser.add_argument("--batch-size", type=int, default=512)
+    parser.add_argument(
+        "--delete-source",
+        action="store_true",
+        help="Delete each source collection once its points are verified"
+    )
+    args = parser.parse_args()
+
+    run(
+        collection_names=args.collections,
+        batch_size=args.batch_size,
+        delete_source=args.delete_source
+    )
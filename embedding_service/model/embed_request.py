@@ -0,0 +1,10 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+
+class EmbedRequest(BaseModel):
+    texts: list[str]
+    dimension: Optional[int] = None
+    dtype: Literal["float32", "float16"] = "float32"
+    encoding_format: Literal["float", "base64"] = "float"
@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+
+ReembeddingStatus = Literal[
+    "running",
+    "swapping",
+    "completed",
+    "failed",
+    "cancelled",
+    "rolled_back",
+]
+
+
+class ReembeddingJob(BaseModel):
+    id: str
+    collection_name: str
+    shadow_collection: str
+    previous_collection: Optional[str] = None
+    model_name: str
+    vector_size: int
+    datatype: str
+    status: ReembeddingStatus = "running"
+    total_points: int = 0
+    processed_points: int = 0
+    skipped_points: int = 0
+    points_per_second: float = 0.0
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,12 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from model.vector_storage_config import VectorDatatype
+
+
+class ReembeddingRequest(BaseModel):
+    dimension: Optional[int] = None
+    datatype: Optional[VectorDatatype] = None
+    batch_size: int = 256
+    max_points_per_second: Optional[float] = None
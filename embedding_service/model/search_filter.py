@@ -0,0 +1,17 @@
+from typing import Optional, Union
+
+from pydantic import BaseModel
+
+
+class MetadataCondition(BaseModel):
+    key: str
+    equals: Optional[Union[bool, int, float, str]] = None
+    gt: Optional[float] = None
+    gte: Optional[float] = None
+    lt: Optional[float] = None
+    lte: Optional[float] = None
+
+
+class SearchFilter(BaseModel):
+    source_names: Optional[list[str]] = None
+    custom_metadata: list[MetadataCondition] = []
@@ -1,6 +1,15 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
+from model.search_filter import SearchFilter
+
 
 class SearchQuery(BaseModel):
     query: str
-    top_k: int
\ No newline at end of file
+    top_k: int
+    score_threshold: Optional[float] = None
+    auto_cut: bool = False
+    max_results: Optional[int] = None
+    payload_fields: Optional[list[str]] = None
+    filter: Optional[SearchFilter] = None
@@ -0,0 +1,11 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+
+VectorDatatype = Literal["float32", "float16", "uint8"]
+
+
+class VectorStorageConfig(BaseModel):
+    dimension: Optional[int] = None
+    datatype: Optional[VectorDatatype] = None
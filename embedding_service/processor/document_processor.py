@@ -1,102 +1,145 @@
 import uuid
+import hashlib
 import logging
 
-from typing import Any, Generator
+from typing import AbstractSet, Any, Dict, Generator, Iterable, List, Optional, Tuple
 
-from pypdf import PdfReader
 from qdrant_client.models import PointStruct
 
 from service.embedding_service import EmbeddingService
+from processor.pdf_extractor import PdfExtractor
+from client.extracted_text_cache_client import ExtractedTextCacheClient
 from model.chunk_metadata import ChunkMetadata
 from model.document_chunk import DocumentChunk
 
 
 logger = logging.getLogger(__name__)
 
+# Chunks are embedded in batches of this size so the encoder can group
+# them by length instead of running one forward pass per chunk.
+ENCODING_BATCH_SIZE = 64
+
+CHUNKING_MODES = ["characters", "tokens"]
+
+# Pages (or text lines) sent to the tokenizer in one call, and the number
+# of consumed tokens after which the token buffer is compacted.
+TOKENIZATION_BATCH_SIZE = 64
+TOKENIZATION_COMPACT_THRESHOLD = 4096
+
+POINT_ID_NAMESPACE = uuid.uuid5(
+    uuid.NAMESPACE_URL,
+    "deepresearch/embedding-service/points"
+)
+
+
+def chunk_point_id(
+    collection_name: str,
+    source_name: str,
+    chunk_index: int,
+    content: str
+) -> str:
+    # Ids are derived from the chunk itself so re-running an upload
+    # overwrites the same points instead of duplicating them.
+    content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    return str(
+        uuid.uuid5(
+            POINT_ID_NAMESPACE,
+            f"{collection_name}\n{source_name}\n{chunk_index}\n{content_hash}"
+        )
+    )
+
+
+def _batched(
+    items: Iterable[Tuple[int, str]],
+    batch_size: int
+) -> Generator[List[Tuple[int, str]], None, None]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _hash_file(file_path: str) -> str:
+    content_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            content_hash.update(block)
+    return content_hash.hexdigest()
+
 
 class DocumentProcessor:
 
-    def __init__(self, embedding_service: EmbeddingService):
-        logger.info("Initializing DocumentProcessor")
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        pdf_extractor: PdfExtractor,
+        chunking_mode: str = "characters",
+        chunk_tokens: Optional[int] = None,
+        chunk_overlap_tokens: int = 0,
+        text_cache: Optional[ExtractedTextCacheClient] = None
+    ):
+        if chunking_mode not in CHUNKING_MODES:
+            raise ValueError(
+                f"Unknown chunking mode: '{chunking_mode}'. "
+                f"Supported values: {', '.join(CHUNKING_MODES)}."
+            )
+
+        if (
+            chunking_mode == "tokens" and
+            not embedding_service.supports_token_offsets()
+        ):
+            logger.warning(
+                "The model tokenizer does not report character offsets, "
+                "falling back to character chunking"
+            )
+            chunking_mode = "characters"
+
         self.embedding_service = embedding_service
+        self.pdf_extractor = pdf_extractor
+        self.text_cache = text_cache
+        self.chunking_mode = chunking_mode
 
+        if chunking_mode == "tokens":
+            max_chunk_tokens = embedding_service.get_max_chunk_tokens()
+            self.chunk_tokens = min(
+                chunk_tokens or max_chunk_tokens,
+                max_chunk_tokens
+            )
+            if not 0 <= chunk_overlap_tokens < self.chunk_tokens:
+                raise ValueError(
+                    f"Chunk overlap must be between 0 and "
+                    f"{self.chunk_tokens - 1} tokens, "
+                    f"got {chunk_overlap_tokens}"
+                )
+            self.chunk_overlap_tokens = chunk_overlap_tokens
 
-    def _chunk_file(
+        logger.info(
+            f"Initializing DocumentProcessor with PDF extractor "
+            f"'{pdf_extractor.name}' and {chunking_mode} chunking"
+            + (
+                f" ({self.chunk_tokens} tokens, "
+                f"{self.chunk_overlap_tokens} overlap)"
+                if chunking_mode == "tokens" else ""
+            )
+        )
+
+
+    def _iter_pages(
         self,
-        file_path: str,
-        chunk_size: int
-    ) -> Generator[DocumentChunk, None, None]:
-        logger.debug(f"Extracting and chunking file: {file_path}")
-        
+        file_path: str
+    ) -> Generator[Tuple[int, str], None, None]:
         if file_path.endswith('.pdf'):
-            logger.debug(f"Extracting text from PDF: {file_path}")
-            reader = PdfReader(file_path)
-            
-            current_chunk_words = []
-            current_size = 0
-            current_page = -1
-            
-            for page_num, page in enumerate(reader.pages, start=1):
-                text = page.extract_text()
-                words = text.split()
-                
-                for word in words:
-                    word_size = len(word) + 1
-                    
-                    if (
-                        current_size + word_size > chunk_size and
-                        len(current_chunk_words) != 0
-                    ):
-                        yield DocumentChunk(
-                            page_number=current_page,
-                            text=" ".join(current_chunk_words)
-                        )
-                        current_chunk_words = [word]
-                        current_size = word_size
-                        current_page = page_num
-                    else:
-                        if current_page is None:
-                            current_page = page_num
-                        current_chunk_words.append(word)
-                        current_size += word_size
-            
-            if current_chunk_words:
-                yield DocumentChunk(
-                    page_number=current_page,
-                    text=" ".join(current_chunk_words)
-                )
-        
+            yield from enumerate(self._iter_pdf_pages(file_path), start=1)
+
         elif file_path.endswith('.txt'):
             logger.debug(f"Extracting text from file: {file_path}")
-            current_chunk_words = []
-            current_size = 0
-            
             with open(file_path, 'r', encoding='utf-8') as f:
                 for line in f:
-                    words = line.split()
-                    
-                    for word in words:
-                        word_size = len(word) + 1
-                        
-                        if (
-                            current_size + word_size > chunk_size and
-                            len(current_chunk_words) != 0
-                        ):
-                            yield DocumentChunk(
-                                page_number=1,
-                                text=" ".join(current_chunk_words)
-                            )
-                            current_chunk_words = [word]
-                            current_size = word_size
-                        else:
-                            current_chunk_words.append(word)
-                            current_size += word_size
-                
-                if current_chunk_words:
-                    yield DocumentChunk(
-                        page_number=1,
-                        text=" ".join(current_chunk_words)
-                    )
+                    yield 1, line
 
         else:
             logger.error(f"Unsupported file format for {file_path}")
@@ -105,40 +148,357 @@ class DocumentProcessor:
             )
 
 
+    def _iter_pdf_pages(self, file_path: str) -> Generator[str, None, None]:
+        if self.text_cache is None:
+            logger.debug(f"Extracting text from PDF: {file_path}")
+            yield from self.pdf_extractor.iter_pages(file_path)
+            return
+
+        content_hash = _hash_file(file_path)
+        cached_pages = self.text_cache.get_pages(
+            content_hash,
+            self.pdf_extractor.name
+        )
+        if cached_pages is not None:
+            logger.debug(
+                f"Using cached text of {len(cached_pages)} pages for "
+                f"PDF: {file_path}"
+            )
+            yield from cached_pages
+            return
+
+        logger.debug(f"Extracting text from PDF: {file_path}")
+        pages = []
+        for text in self.pdf_extractor.iter_pages(file_path):
+            pages.append(text)
+            yield text
+
+        # Only complete extractions are cached.
+        self.text_cache.put_pages(
+            content_hash,
+            self.pdf_extractor.name,
+            pages
+        )
+
+
+    def _chunk_file(
+        self,
+        file_path: str,
+        chunk_size: int
+    ) -> Generator[DocumentChunk, None, None]:
+        logger.debug(f"Extracting and chunking file: {file_path}")
+        pages = self._iter_pages(file_path)
+
+        if self.chunking_mode == "tokens":
+            yield from self._chunk_by_tokens(pages)
+        else:
+            yield from self._chunk_by_characters(pages, chunk_size)
+
+
+    def _chunk_by_characters(
+        self,
+        pages: Iterable[Tuple[int, str]],
+        chunk_size: int
+    ) -> Generator[DocumentChunk, None, None]:
+        current_chunk_words = []
+        current_size = 0
+        current_page = None
+
+        for page_num, text in pages:
+            for word in text.split():
+                word_size = len(word) + 1
+
+                if (
+                    current_size + word_size > chunk_size and
+                    len(current_chunk_words) != 0
+                ):
+                    yield DocumentChunk(
+                        page_number=current_page,
+                        text=" ".join(current_chunk_words)
+                    )
+                    current_chunk_words = [word]
+                    current_size = word_size
+                    current_page = page_num
+                else:
+                    if current_page is None:
+                        current_page = page_num
+                    current_chunk_words.append(word)
+                    current_size += word_size
+
+        if current_chunk_words:
+            yield DocumentChunk(
+                page_number=current_page,
+                text=" ".join(current_chunk_words)
+            )
+
+
+    def _chunk_by_tokens(
+        self,
+        pages: Iterable[Tuple[int, str]]
+    ) -> Generator[DocumentChunk, None, None]:
+        # Chunks are cut so they fit the model window exactly, measured
+        # with the model's own tokenizer. Pages are tokenized in batches
+        # and their tokens kept as (page key, start, end, starts_word)
+        # character spans; a chunk is the source text between its first
+        # and last token, so nothing is re-tokenized. Cuts are moved back
+        # to the nearest word start, and each chunk repeats the last
+        # chunk_overlap_tokens tokens of the previous one.
+        max_tokens = self.chunk_tokens
+        page_texts: Dict[int, Tuple[int, str]] = {}
+        tokens: List[Tuple[int, int, int, bool]] = []
+        head = 0
+        overlap_end = 0
+
+        def word_start_before(index: int, lower_bound: int) -> int:
+            while index > lower_bound and not tokens[index][3]:
+                index -= 1
+            return index
+
+        def chunk_from(first: int, last: int) -> DocumentChunk:
+            segments = []
+            segment_key, segment_start, segment_end = tokens[first][:3]
+            for key, start, end, _ in tokens[first + 1:last]:
+                if key != segment_key:
+                    segments.append(
+                        page_texts[segment_key][1][segment_start:segment_end]
+                    )
+                    segment_key, segment_start = key, start
+                segment_end = end
+            segments.append(
+                page_texts[segment_key][1][segment_start:segment_end]
+            )
+            return DocumentChunk(
+                page_number=page_texts[tokens[first][0]][0],
+                text=" ".join(" ".join(segments).split())
+            )
+
+        page_key = 0
+        for page_batch in _batched(pages, TOKENIZATION_BATCH_SIZE):
+            offsets_batch = self.embedding_service.get_token_offsets(
+                [text for _, text in page_batch]
+            )
+            for (page_num, text), offsets in zip(page_batch, offsets_batch):
+                page_texts[page_key] = (page_num, text)
+                previous_end = None
+                for start, end in offsets:
+                    if end <= start:
+                        continue
+                    starts_word = (
+                        previous_end is None or
+                        start > previous_end
+                    )
+                    tokens.append((page_key, start, end, starts_word))
+                    previous_end = end
+                page_key += 1
+
+            # Emit while a token beyond the window is known, so every cut
+            # can check whether the following token starts a new word.
+            while len(tokens) - head > max_tokens:
+                window_end = head + max_tokens
+                cut = word_start_before(window_end, head)
+                if cut == head:
+                    cut = window_end
+                yield chunk_from(head, cut)
+
+                next_head = word_start_before(
+                    max(cut - self.chunk_overlap_tokens, head + 1),
+                    head
+                )
+                if next_head == head:
+                    next_head = cut
+                overlap_end = cut - next_head
+                head = next_head
+
+            if head > TOKENIZATION_COMPACT_THRESHOLD:
+                tokens = tokens[head:]
+                head = 0
+                first_key = tokens[0][0] if tokens else page_key
+                for key in [key for key in page_texts if key < first_key]:
+                    del page_texts[key]
+
+        # The tail is only emitted when it holds more than the overlap
+        # already repeated from the last chunk.
+        if len(tokens) - head > overlap_end:
+            yield chunk_from(head, len(tokens))
+
+
+    def _chunks_to_points(
+        self,
+        chunks: List[DocumentChunk],
+        first_chunk_index: int,
+        collection_name: str,
+        filename: str,
+        custom_metadata: dict[str, Any],
+        vector_size: Optional[int],
+        skip_point_ids: AbstractSet[str],
+        skipped_point_ids: Optional[List[str]]
+    ) -> List[PointStruct]:
+        pending = []
+        for offset, chunk in enumerate(chunks):
+            chunk_index = first_chunk_index + offset
+            point_id = chunk_point_id(
+                collection_name,
+                filename,
+                chunk_index,
+                chunk.text
+            )
+            if point_id not in skip_point_ids:
+                pending.append((point_id, filename, chunk_index, chunk))
+            elif skipped_point_ids is not None:
+                skipped_point_ids.append(point_id)
+
+        return self._encode_chunks(
+            pending,
+            custom_metadata=custom_metadata,
+            vector_size=vector_size
+        )
+
+
+    def _encode_chunks(
+        self,
+        entries: List[Tuple[str, str, int, DocumentChunk]],
+        custom_metadata: dict[str, Any],
+        vector_size: Optional[int]
+    ) -> List[PointStruct]:
+        if not entries:
+            return []
+
+        vectors = self.embedding_service.get_encoding_for_batch(
+            [chunk.text for _, _, _, chunk in entries],
+            dimension=vector_size
+        )
+
+        points = []
+        for (point_id, filename, chunk_index, chunk), vector in zip(
+            entries,
+            vectors
+        ):
+            chunk_metadata = ChunkMetadata(
+                chunk_index=chunk_index,
+                source_name=filename,
+                content=chunk.text,
+                page_number=chunk.page_number,
+                custom_metadata=custom_metadata
+            )
+
+            points.append(
+                PointStruct(
+                    id=point_id,
+                    vector=vector,
+                    payload=chunk_metadata.model_dump()
+                )
+            )
+
+        return points
+
+
     def process_document(
         self,
         file_path: str,
+        collection_name: str,
         filename: str,
         chunk_size: int = 2000,
-        custom_metadata: dict[str, Any] = {}
+        custom_metadata: dict[str, Any] = {},
+        vector_size: Optional[int] = None,
+        skip_point_ids: AbstractSet[str] = frozenset(),
+        skipped_point_ids: Optional[List[str]] = None
     ) -> Generator[PointStruct, None, None]:
+        # Chunks whose point id is in skip_point_ids are already stored and
+        # are not re-embedded; their ids are collected in skipped_point_ids.
         logger.info(f"Processing document: {filename}")
         
         chunk_index = 0
+        pending_chunks: List[DocumentChunk] = []
+
         for chunk in self._chunk_file(
             file_path=file_path,
             chunk_size=chunk_size
         ):
-            vector = self.embedding_service.get_encoding(chunk.text)
-
-            point_id = str(uuid.uuid4())
+            pending_chunks.append(chunk)
 
-            chunk_metadata = ChunkMetadata(
-                chunk_index=chunk_index,
-                source_name=filename,
-                content=chunk.text,
-                page_number=chunk.page_number,
-                custom_metadata=custom_metadata
-            )
+            if len(pending_chunks) >= ENCODING_BATCH_SIZE:
+                yield from self._chunks_to_points(
+                    chunks=pending_chunks,
+                    first_chunk_index=chunk_index,
+                    collection_name=collection_name,
+                    filename=filename,
+                    custom_metadata=custom_metadata,
+                    vector_size=vector_size,
+                    skip_point_ids=skip_point_ids,
+                    skipped_point_ids=skipped_point_ids
+                )
+                chunk_index += len(pending_chunks)
+                pending_chunks = []
 
-            yield PointStruct(
-                id=point_id,
-                vector=vector,
-                payload=chunk_metadata.model_dump()
+        if pending_chunks:
+            yield from self._chunks_to_points(
+                chunks=pending_chunks,
+                first_chunk_index=chunk_index,
+                collection_name=collection_name,
+                filename=filename,
+                custom_metadata=custom_metadata,
+                vector_size=vector_size,
+                skip_point_ids=skip_point_ids,
+                skipped_point_ids=skipped_point_ids
             )
 
-            chunk_index += 1
-
         logger.info(
             f"Document processing complete: {filename}"
         )
+
+
+    def process_documents(
+        self,
+        documents: Iterable[Tuple[str, str]],
+        collection_name: str,
+        chunk_size: int = 2000,
+        custom_metadata: dict[str, Any] = {},
+        vector_size: Optional[int] = None,
+        errors: Optional[Dict[str, str]] = None
+    ) -> Generator[PointStruct, None, None]:
+        # Chunks of consecutive (file_path, filename) documents share
+        # encoding batches, so many small files still fill each batch. A
+        # document is fully chunked before the next one is requested, which
+        # lets the caller remove its file as soon as iteration moves on.
+        # Documents that cannot be chunked are recorded in errors when
+        # given, instead of aborting the whole run.
+        pending: List[Tuple[str, str, int, DocumentChunk]] = []
+
+        for file_path, filename in documents:
+            logger.info(f"Processing document: {filename}")
+            try:
+                chunks = list(
+                    self._chunk_file(
+                        file_path=file_path,
+                        chunk_size=chunk_size
+                    )
+                )
+            except Exception as e:
+                if errors is None:
+                    raise
+                logger.error(f"Failed to chunk document '{filename}': {e}")
+                errors[filename] = str(e)
+                continue
+
+            for chunk_index, chunk in enumerate(chunks):
+                point_id = chunk_point_id(
+                    collection_name,
+                    filename,
+                    chunk_index,
+                    chunk.text
+                )
+                pending.append((point_id, filename, chunk_index, chunk))
+
+            while len(pending) >= ENCODING_BATCH_SIZE:
+                yield from self._encode_chunks(
+                    pending[:ENCODING_BATCH_SIZE],
+                    custom_metadata=custom_metadata,
+                    vector_size=vector_size
+                )
+                pending = pending[ENCODING_BATCH_SIZE:]
+
+        yield from self._encode_chunks(
+            pending,
+            custom_metadata=custom_metadata,
+            vector_size=vector_size
+        )
@@ -0,0 +1,84 @@
+import logging
+
+from abc import ABC, abstractmethod
+from typing import Generator, List
+
+
+logger = logging.getLogger(__name__)
+
+PDF_EXTRACTOR_NAMES = ["pypdfium2", "pypdf"]
+
+
+class PdfExtractor(ABC):
+
+    name: str
+
+    @abstractmethod
+    def iter_pages(
+        self,
+        file_path: str,
+        start_page: int = 0
+    ) -> Generator[str, None, None]:
+        ...
+
+
+class FallbackPdfExtractor(PdfExtractor):
+
+    # Engines are tried in order. Pages are streamed, so when an engine
+    # fails partway through a document the next one resumes at the first
+    # page that was not extracted yet instead of starting over.
+
+    def __init__(self, extractors: List[PdfExtractor]):
+        self.extractors = extractors
+        self.name = "+".join(extractor.name for extractor in extractors)
+
+
+    def iter_pages(
+        self,
+        file_path: str,
+        start_page: int = 0
+    ) -> Generator[str, None, None]:
+        page_index = start_page
+        last_error = None
+
+        for extractor in self.extractors:
+            try:
+                for text in extractor.iter_pages(file_path, page_index):
+                    yield text
+                    page_index += 1
+                return
+            except Exception as e:
+                logger.warning(
+                    f"PDF extractor '{extractor.name}' failed on "
+                    f"'{file_path}' at page {page_index + 1}: {e}"
+                )
+                last_error = e
+
+        raise ValueError(f"Failed to extract text from PDF: {last_error}")
+
+
+def create_pdf_extractor(extractor_names: List[str]) -> PdfExtractor:
+    extractors: List[PdfExtractor] = []
+
+    for extractor_name in extractor_names:
+        if extractor_name == "pypdfium2":
+            from processor.pdfium_extractor import PdfiumExtractor
+
+            extractors.append(PdfiumExtractor())
+        elif extractor_name == "pypdf":
+            from processor.pypdf_extractor import PypdfExtractor
+
+            extractors.append(PypdfExtractor())
+        else:
+            raise ValueError(
+                f"Unknown PDF extractor: '{extractor_name}'. "
+                f"Supported values: {', '.join(PDF_EXTRACTOR_NAMES)}."
+            )
+
+    if not extractors:
+        raise ValueError("At least one PDF extractor must be configured")
+
+    if len(extractors) == 1:
+        return extractors[0]
+
+    return FallbackPdfExtractor(extractors)
@@ -0,0 +1,49 @@
+import logging
+import threading
+
+from typing import Generator
+
+import pypdfium2 as pdfium
+
+from processor.pdf_extractor import PdfExtractor
+
+
+logger = logging.getLogger(__name__)
+
+# PDFium marks hyphens it inserted at line breaks and unmappable glyphs
+# with these characters; neither belongs in the indexed text.
+PDFIUM_CONTROL_CHARACTERS = str.maketrans("", "", "\x02\ufffe")
+
+# PDFium is not thread-safe, so every call into it is serialized. The
+# lock is never held across a yield.
+_pdfium_lock = threading.Lock()
+
+
+class PdfiumExtractor(PdfExtractor):
+
+    name = "pypdfium2"
+
+    def iter_pages(
+        self,
+        file_path: str,
+        start_page: int = 0
+    ) -> Generator[str, None, None]:
+        logger.debug(f"Extracting text from PDF with pypdfium2: {file_path}")
+        with _pdfium_lock:
+            document = pdfium.PdfDocument(file_path)
+            page_count = len(document)
+
+        try:
+            for page_index in range(start_page, page_count):
+                with _pdfium_lock:
+                    page = document[page_index]
+                    text_page = page.get_textpage()
+                    try:
+                        text = text_page.get_text_bounded()
+                    finally:
+                        text_page.close()
+                        page.close()
+                yield text.translate(PDFIUM_CONTROL_CHARACTERS)
+        finally:
+            with _pdfium_lock:
+                document.close()
@@ -0,0 +1,26 @@
+import logging
+
+from typing import Generator
+
+from pypdf import PdfReader
+
+from processor.pdf_extractor import PdfExtractor
+
+
+logger = logging.getLogger(__name__)
+
+
+class PypdfExtractor(PdfExtractor):
+
+    name = "pypdf"
+
+    def iter_pages(
+        self,
+        file_path: str,
+        start_page: int = 0
+    ) -> Generator[str, None, None]:
+        logger.debug(f"Extracting text from PDF with pypdf: {file_path}")
+        reader = PdfReader(file_path)
+
+        for page in reader.pages[start_page:]:
+            yield page.extract_text()
@@ -1,11 +1,18 @@
 import tempfile
 import os
+import io
+import base64
 import logging
 import json
 import httpx
 import uuid
+import tarfile
+import zipfile
 
-from typing import Any, Optional
+import numpy as np
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Any, Dict, Generator, Iterable, List, Optional, Tuple
 from fastapi import (
     APIRouter,
     Request,
@@ -13,20 +20,70 @@ from fastapi import (
     UploadFile,
     File,
     Form,
+    Body,
+    Depends,
 )
+from fastapi.responses import Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from qdrant_client.models import PointStruct
 
 from model.search_query import SearchQuery
+from model.embed_request import EmbedRequest
 from model.text_chunk_insert import TextChunkInsert
-from client.qdrant_vector_client import QdrantVectorClient
+from model.vector_storage_config import VectorStorageConfig
+from model.reembedding_request import ReembeddingRequest
+from client.vector_client import VectorClient
 from service.embedding_service import EmbeddingService
-from processor.document_processor import DocumentProcessor
-from config.vars import DATABASE_SERVICE_URL, MAX_UPLOAD_SIZE_MB
+from service.score_cutoff import compute_auto_cut_threshold
+from service.reembedding_service import ReembeddingService
+from service.search_coalescer import SearchCoalescer
+from service.collection_snapshot import (
+    SNAPSHOT_FORMATS,
+    SNAPSHOT_MEDIA_TYPES,
+    SNAPSHOT_FILE_EXTENSIONS,
+    SnapshotError,
+    export_snapshot,
+    read_snapshot,
+)
+from processor.document_processor import (
+    POINT_ID_NAMESPACE,
+    DocumentProcessor,
+    chunk_point_id,
+)
+from config.vars import (
+    DATABASE_SERVICE_URL,
+    MAX_UPLOAD_SIZE_MB,
+    MAX_ARCHIVE_UPLOAD_SIZE_MB,
+    MAX_SNAPSHOT_UPLOAD_SIZE_MB,
+    VECTOR_DIMENSION,
+    VECTOR_DATATYPE,
+)
 
 
 MAX_UPLOAD_SIZE_BYTES = MAX_UPLOAD_SIZE_MB * 1024 * 1024
 
 
+SUPPORTED_DOCUMENT_EXTENSIONS = (".pdf", ".txt")
+
+
+UPSERT_BATCH_SIZE = 64
+UPSERT_CONCURRENCY = 4
+
+# Snapshot points already carry their vectors, so imports are bound by
+# Qdrant rather than the encoder and use much larger batches.
+SNAPSHOT_IMPORT_BATCH_SIZE = 4096
+SNAPSHOT_UPSERT_BATCH_SIZE = 512
+
+
+MAX_EMBED_BATCH_SIZE = 1024
+
+EMBEDDING_OCTET_STREAM_MEDIA_TYPE = "application/octet-stream"
+EMBEDDING_NPY_MEDIA_TYPE = "application/x-npy"
+
+
+PAYLOAD_INDEX_SCHEMAS = ["keyword", "integer", "float", "bool"]
+
+
 RESERVED_COLLECTION_NAMES = [
     "conversations",
 ]
@@ -36,10 +93,135 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/embeddings", tags=["embedding"])
 
 
+def _guard_collection_writes(
+    collection_name: str,
+    request: Request
+) -> Generator[None, None, None]:
+    # A re-embedding swap replaces the collection behind its name; writes
+    # are refused while it runs and the swap waits for those in flight.
+    reembedding_service: ReembeddingService = (
+        request.app.state.reembedding_service
+    )
+    try:
+        reembedding_service.begin_write(collection_name)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    try:
+        yield
+    finally:
+        reembedding_service.end_write(collection_name)
+
+
+@router.get("/metrics/search")
+async def get_search_metrics(request: Request):
+    search_coalescer: SearchCoalescer = (
+        request.app.state.search_coalescer
+    )
+    return search_coalescer.get_stats()
+
+
+@router.get("/metrics/encoding")
+async def get_encoding_metrics(request: Request):
+    embedding_service: EmbeddingService = (
+        request.app.state.embedding_service
+    )
+    return embedding_service.get_encoding_stats()
+
+
+@router.post("/embed")
+async def embed(data: EmbedRequest, request: Request):
+    logger.info(
+        f"Embed request for {len(data.texts)} texts, dtype={data.dtype}, "
+        f"dimension={data.dimension}"
+    )
+    embedding_service: EmbeddingService = (
+        request.app.state.embedding_service
+    )
+
+    if len(data.texts) > MAX_EMBED_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=(
+                f"Cannot embed more than {MAX_EMBED_BATCH_SIZE} "
+                f"texts per request"
+            )
+        )
+
+    if data.dimension is not None and not (
+        0 < data.dimension <= embedding_service.get_dimension()
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Dimension must be between 1 and the model dimension "
+                f"({embedding_service.get_dimension()})"
+            )
+        )
+
+    # Encoding is CPU-bound, so it runs on a worker thread to keep the
+    # event loop free for concurrent requests.
+    try:
+        embeddings = (await run_in_threadpool(
+            embedding_service.encode_batch,
+            data.texts,
+            dimension=data.dimension
+        )).astype(np.dtype(data.dtype).newbyteorder("<"))
+    except Exception as e:
+        logger.error(f"Failed to embed texts: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to embed texts: {e}"
+        )
+
+    # Binary encodings are negotiated through the Accept header: raw
+    # little-endian values with the shape and dtype in response headers,
+    # or a self-describing NumPy .npy file. JSON remains the default.
+    accept = request.headers.get("accept", "")
+    shape_header = ",".join(str(size) for size in embeddings.shape)
+
+    if EMBEDDING_OCTET_STREAM_MEDIA_TYPE in accept:
+        return Response(
+            content=embeddings.tobytes(),
+            media_type=EMBEDDING_OCTET_STREAM_MEDIA_TYPE,
+            headers={
+                "X-Embedding-Shape": shape_header,
+                "X-Embedding-Dtype": data.dtype,
+            }
+        )
+
+    if EMBEDDING_NPY_MEDIA_TYPE in accept:
+        buffer = io.BytesIO()
+        np.save(buffer, embeddings, allow_pickle=False)
+        return Response(
+            content=buffer.getvalue(),
+            media_type=EMBEDDING_NPY_MEDIA_TYPE,
+            headers={
+                "X-Embedding-Shape": shape_header,
+                "X-Embedding-Dtype": data.dtype,
+            }
+        )
+
+    if data.encoding_format == "base64":
+        encoded_embeddings = [
+            base64.b64encode(row.tobytes()).decode("ascii")
+            for row in embeddings
+        ]
+    else:
+        encoded_embeddings = embeddings.tolist()
+
+    return {
+        "embeddings": encoded_embeddings,
+        "dtype": data.dtype,
+        "dimension": embeddings.shape[1],
+        "count": embeddings.shape[0]
+    }
+
+
 @router.get("/collections")
 async def list_collections(request: Request):
     logger.info("Listing all collections")
-    vector_client: QdrantVectorClient = (
+    vector_client: VectorClient = (
         request.app.state.vector_client
     )
     try:
@@ -57,7 +239,7 @@ async def list_collections(request: Request):
 @router.get("/collections/{collection_name}")
 async def collection_exists(collection_name: str, request: Request):
     logger.info(f"Checking if collection '{collection_name}' exists")
-    vector_client: QdrantVectorClient = (
+    vector_client: VectorClient = (
         request.app.state.vector_client
     )
 
@@ -73,10 +255,13 @@ async def collection_exists(collection_name: str, request: Request):
         )
 
 
-@router.delete("/collections/{collection_name}")
+@router.delete(
+    "/collections/{collection_name}",
+    dependencies=[Depends(_guard_collection_writes)]
+)
 async def delete_collection(collection_name: str, request: Request):
     logger.info(f"Delete collection request for '{collection_name}'")
-    vector_client: QdrantVectorClient = (
+    vector_client: VectorClient = (
         request.app.state.vector_client
     )
 
@@ -104,8 +289,42 @@ async def delete_collection(collection_name: str, request: Request):
         )
 
 
+def _resolve_storage_config(
+    embedding_service: EmbeddingService,
+    storage_config: VectorStorageConfig
+) -> Tuple[int, str]:
+    model_dimension = embedding_service.get_dimension()
+    vector_size = (
+        storage_config.dimension or
+        VECTOR_DIMENSION or
+        model_dimension
+    )
+    datatype = storage_config.datatype or VECTOR_DATATYPE
+
+    if vector_size <= 0 or vector_size > model_dimension:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Vector dimension must be between 1 and the model "
+                f"dimension ({model_dimension}), got {vector_size}"
+            )
+        )
+
+    if datatype not in ("float32", "float16", "uint8"):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported vector datatype '{datatype}'"
+        )
+
+    return vector_size, datatype
+
+
 @router.post("/collections/{collection_name}")
-async def create_collection(collection_name: str, request: Request):
+async def create_collection(
+    collection_name: str,
+    request: Request,
+    storage_config: Optional[VectorStorageConfig] = Body(default=None)
+):
     if collection_name in RESERVED_COLLECTION_NAMES:
         logger.warning(f"Attempt to create collection with reserved name '{collection_name}'")
         raise HTTPException(
@@ -117,7 +336,7 @@ async def create_collection(collection_name: str, request: Request):
     embedding_service: EmbeddingService = (
         request.app.state.embedding_service
     )
-    vector_client: QdrantVectorClient = (
+    vector_client: VectorClient = (
         request.app.state.vector_client
     )
 
@@ -129,14 +348,23 @@ async def create_collection(collection_name: str, request: Request):
                 detail=f"Collection '{collection_name}' already exists"
             )
 
-        vector_size = embedding_service.get_dimension()
-        vector_client.create_collection(collection_name, vector_size)
+        vector_size, datatype = _resolve_storage_config(
+            embedding_service,
+            storage_config or VectorStorageConfig()
+        )
+
+        vector_client.create_collection(
+            collection_name,
+            vector_size,
+            datatype=datatype
+        )
 
         logger.info(f"Collection '{collection_name}' created successfully")
         return {
             "status": "ok",
             "collection": collection_name,
-            "vector_size": vector_size
+            "vector_size": vector_size,
+            "datatype": datatype
         }
     except HTTPException:
         raise
@@ -148,6 +376,175 @@ async def create_collection(collection_name: str, request: Request):
         )
     
 
+@router.post("/collections/{collection_name}/reembed", status_code=202)
+async def start_reembedding(
+    collection_name: str,
+    request: Request,
+    data: Optional[ReembeddingRequest] = Body(default=None)
+):
+    logger.info(f"Re-embedding request for collection '{collection_name}'")
+    embedding_service: EmbeddingService = (
+        request.app.state.embedding_service
+    )
+    vector_client: VectorClient = (
+        request.app.state.vector_client
+    )
+    reembedding_service: ReembeddingService = (
+        request.app.state.reembedding_service
+    )
+
+    if not vector_client.supports_aliases:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                "Re-embedding migrations need collection aliases, which "
+                "the current vector storage layout does not support"
+            )
+        )
+
+    data = data or ReembeddingRequest()
+    if data.batch_size <= 0:
+        raise HTTPException(
+            status_code=400,
+            detail="Batch size must be positive"
+        )
+
+    if not vector_client.collection_exists(collection_name):
+        logger.error(f"Collection '{collection_name}' does not exist")
+        raise HTTPException(
+            status_code=404,
+            detail=f"Collection '{collection_name}' does not exist"
+        )
+
+    vector_size, datatype = _resolve_storage_config(
+        embedding_service,
+        VectorStorageConfig(dimension=data.dimension, datatype=data.datatype)
+    )
+
+    try:
+        job = reembedding_service.start_job(
+            collection_name,
+            vector_size=vector_size,
+            datatype=datatype,
+            batch_size=data.batch_size,
+            max_points_per_second=data.max_points_per_second
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    return job.model_dump()
+
+
+@router.get("/reembed-jobs")
+async def list_reembedding_jobs(request: Request):
+    reembedding_service: ReembeddingService = (
+        request.app.state.reembedding_service
+    )
+    return {
+        "jobs": [
+            job.model_dump() for job in reembedding_service.list_jobs()
+        ]
+    }
+
+
+@router.get("/reembed-jobs/{job_id}")
+async def get_reembedding_job(job_id: str, request: Request):
+    reembedding_service: ReembeddingService = (
+        request.app.state.reembedding_service
+    )
+
+    job = reembedding_service.get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Re-embedding job '{job_id}' not found"
+        )
+    return job.model_dump()
+
+
+@router.post("/reembed-jobs/{job_id}/rollback")
+async def rollback_reembedding_job(job_id: str, request: Request):
+    logger.info(f"Rollback request for re-embedding job '{job_id}'")
+    reembedding_service: ReembeddingService = (
+        request.app.state.reembedding_service
+    )
+
+    if reembedding_service.get_job(job_id) is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Re-embedding job '{job_id}' not found"
+        )
+
+    try:
+        job = reembedding_service.rollback_job(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to roll back re-embedding job '{job_id}': {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to roll back re-embedding job: {e}"
+        )
+
+    return job.model_dump()
+
+
+@router.put(
+    "/collections/{collection_name}/indexes/{field_name}",
+    dependencies=[Depends(_guard_collection_writes)]
+)
+async def create_metadata_index(
+    collection_name: str,
+    field_name: str,
+    request: Request,
+    field_schema: str = "keyword"
+):
+    logger.info(
+        f"Create {field_schema} index request on custom_metadata field "
+        f"'{field_name}' in collection '{collection_name}'"
+    )
+    vector_client: VectorClient = (
+        request.app.state.vector_client
+    )
+
+    if field_schema not in PAYLOAD_INDEX_SCHEMAS:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Unsupported index schema '{field_schema}'. "
+                f"Supported: {', '.join(PAYLOAD_INDEX_SCHEMAS)}"
+            )
+        )
+
+    try:
+        if not vector_client.collection_exists(collection_name):
+            logger.error(f"Collection '{collection_name}' does not exist")
+            raise HTTPException(
+                status_code=404,
+                detail=f"Collection '{collection_name}' does not exist"
+            )
+
+        vector_client.create_payload_index(
+            collection_name,
+            field_name=f"custom_metadata.{field_name}",
+            field_schema=field_schema
+        )
+        return {
+            "status": "ok",
+            "collection": collection_name,
+            "field": f"custom_metadata.{field_name}",
+            "schema": field_schema
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to create metadata index: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to create metadata index: {e}"
+        )
+
+
 @router.get("/collections/{collection_name}/documents")
 async def get_documents(
     collection_name: str,
@@ -158,7 +555,7 @@ async def get_documents(
         f"Get documents request for collection '{collection_name}' "
         f"with limit={limit}"
     )
-    vector_client: QdrantVectorClient = (
+    vector_client: VectorClient = (
         request.app.state.vector_client
     )
 
@@ -225,15 +622,154 @@ async def get_document_by_source(
         )
 
 
-@router.post("/collections/{collection_name}/upload")
+async def _save_upload_to_temp_file(
+    file: UploadFile,
+    file_name: str,
+    max_size_mb: int = MAX_UPLOAD_SIZE_MB
+) -> str:
+    with tempfile.NamedTemporaryFile(
+        delete=False,
+        suffix=os.path.splitext(file_name)[1]
+    ) as tmp_file:
+        tmp_path = tmp_file.name
+        total_size = 0
+        while True:
+            file_chunk = await file.read(1024 * 1024)
+            if not file_chunk:
+                break
+            total_size += len(file_chunk)
+            if total_size > max_size_mb * 1024 * 1024:
+                os.unlink(tmp_path)
+                raise HTTPException(
+                    status_code=413,
+                    detail=(
+                        f"File exceeds maximum upload size "
+                        f"of {max_size_mb}MB"
+                    )
+                )
+            tmp_file.write(file_chunk)
+
+    return tmp_path
+
+
+def _upsert_concurrently(
+    vector_client: VectorClient,
+    collection_name: str,
+    points: Iterable[PointStruct],
+    batch_size: int = UPSERT_BATCH_SIZE
+) -> List[PointStruct]:
+    indexed_points: List[PointStruct] = []
+
+    # Point ids are deterministic, so batches can be sent without waiting
+    # for Qdrant to apply them and any batch can safely be sent twice. The
+    # final batch is sent with wait=True and acts as a consistency barrier
+    # for everything before it.
+    batch: List[PointStruct] = []
+    last_submitted_batch: List[PointStruct] = []
+    in_flight: List[Future] = []
+
+    with ThreadPoolExecutor(max_workers=UPSERT_CONCURRENCY) as executor:
+        for point in points:
+            batch.append(point)
+            indexed_points.append(point)
+
+            if len(batch) >= batch_size:
+                if len(in_flight) >= UPSERT_CONCURRENCY:
+                    in_flight.pop(0).result()
+
+                logger.debug(f"Upserting batch of {len(batch)} points")
+                in_flight.append(
+                    executor.submit(
+                        vector_client.upsert,
+                        collection_name,
+                        batch,
+                        wait=False
+                    )
+                )
+                last_submitted_batch = batch
+                batch = []
+
+        for future in in_flight:
+            future.result()
+
+    final_batch = batch or last_submitted_batch
+    if final_batch:
+        logger.debug(f"Upserting final batch of {len(final_batch)} points")
+        vector_client.upsert(collection_name, final_batch, wait=True)
+
+    return indexed_points
+
+
+def _index_document(
+    vector_client: VectorClient,
+    document_processor: DocumentProcessor,
+    collection_name: str,
+    tmp_path: str,
+    file_name: str,
+    custom_metadata: dict[str, Any],
+    existing_point_ids: List[str],
+    reuse_existing: bool = False
+) -> Tuple[List[Dict[str, Any]], int, int]:
+    vector_size = vector_client.get_vector_size(collection_name)
+    existing_ids = set(existing_point_ids)
+    reused_point_ids: List[str] = []
+
+    indexed_points = _upsert_concurrently(
+        vector_client,
+        collection_name,
+        document_processor.process_document(
+            file_path=tmp_path,
+            collection_name=collection_name,
+            filename=file_name,
+            custom_metadata=custom_metadata,
+            vector_size=vector_size,
+            skip_point_ids=existing_ids if reuse_existing else frozenset(),
+            skipped_point_ids=reused_point_ids
+        )
+    )
+
+    # Points of this source that were not produced by this run belong to
+    # an older version of the document and are removed only now, so the
+    # document never disappears from search while it is being replaced.
+    current_ids = {str(point.id) for point in indexed_points}
+    current_ids.update(reused_point_ids)
+    stale_ids = [
+        point_id for point_id in existing_point_ids
+        if point_id not in current_ids
+    ]
+    if stale_ids:
+        logger.debug(f"Deleting {len(stale_ids)} stale points")
+        vector_client.delete_points(collection_name, stale_ids)
+
+    all_points_serialized = [point.model_dump() for point in indexed_points]
+    if reused_point_ids:
+        all_points_serialized.extend(
+            vector_client.retrieve(
+                collection_name,
+                reused_point_ids,
+                with_vectors=True
+            )
+        )
+        all_points_serialized.sort(
+            key=lambda point: point["payload"]["chunk_index"]
+        )
+
+    return all_points_serialized, len(indexed_points), len(reused_point_ids)
+
+
+@router.post(
+    "/collections/{collection_name}/upload",
+    dependencies=[Depends(_guard_collection_writes)]
+)
 async def upload_document(
     request: Request,
     collection_name: str,
     file: UploadFile = File(...),
-    custom_metadata: dict[str, Any] = Form(default={})
+    custom_metadata: dict[str, Any] = Form(default={}),
+    resume: bool = Form(default=False)
 ):
     logger.info(f"Upload document request for collection '{collection_name}', file: {file.filename}")
-    vector_client: QdrantVectorClient = (
+    vector_client: VectorClient = (
         request.app.state.vector_client
     )
     document_processor: DocumentProcessor = (
@@ -256,11 +792,11 @@ async def upload_document(
             detail=f"Collection '{collection_name}' does not exist"
         )
 
-    existing_count = vector_client.count_points_by_source(
+    existing_point_ids = vector_client.get_point_ids_by_source(
         collection_name,
         file_name
     )
-    if existing_count > 0:
+    if existing_point_ids and not resume:
         logger.warning(
             f"Document '{file_name}' already exists in "
             f"collection '{collection_name}'"
@@ -269,59 +805,37 @@ async def upload_document(
             status_code=409,
             detail=(
                 f"Document '{file_name}' already exists in "
-                f"collection '{collection_name}'. Use PUT to replace it."
+                f"collection '{collection_name}'. Use PUT to replace it "
+                f"or resume=true to resume an interrupted upload."
             )
         )
 
-    with tempfile.NamedTemporaryFile(
-        delete=False,
-        suffix=os.path.splitext(file_name)[1]
-    ) as tmp_file:
-        tmp_path = tmp_file.name
-        total_size = 0
-        while True:
-            file_chunk = await file.read(1024 * 1024)
-            if not file_chunk:
-                break
-            total_size += len(file_chunk)
-            if total_size > MAX_UPLOAD_SIZE_BYTES:
-                os.unlink(tmp_path)
-                raise HTTPException(
-                    status_code=413,
-                    detail=(
-                        f"File exceeds maximum upload size "
-                        f"of {MAX_UPLOAD_SIZE_MB}MB"
-                    )
-                )
-            tmp_file.write(file_chunk)
+    tmp_path = await _save_upload_to_temp_file(file, file_name)
 
     try:
         logger.debug(f"Processing document: {file_name}")
+
+        if resume:
+            logger.info(
+                f"Resuming upload of '{file_name}' with "
+                f"{len(existing_point_ids)} points already stored"
+            )
+
+        all_points_serialized, total_chunks, reused_chunks = _index_document(
+            vector_client=vector_client,
+            document_processor=document_processor,
+            collection_name=collection_name,
+            tmp_path=tmp_path,
+            file_name=file_name,
+            custom_metadata=custom_metadata,
+            existing_point_ids=existing_point_ids,
+            reuse_existing=resume
+        )
         
-        batch_size = 64
-        batch = []
-        total_chunks = 0
-        all_points_serialized = []
-        
-        for point in document_processor.process_document(
-            file_path=tmp_path,
-            filename=file_name,
-            custom_metadata=custom_metadata
-        ):
-            batch.append(point)
-            all_points_serialized.append(point.model_dump())
-            total_chunks += 1
-            
-            if len(batch) >= batch_size:
-                logger.debug(f"Upserting batch of {len(batch)} points")
-                vector_client.upsert(collection_name, batch)
-                batch = []
-        
-        if batch:
-            logger.debug(f"Upserting final batch of {len(batch)} points")
-            vector_client.upsert(collection_name, batch)
-        
-        logger.info(f"Document processed into {total_chunks} chunks")
+        logger.info(
+            f"Document processed into {total_chunks + reused_chunks} chunks, "
+            f"{reused_chunks} already stored"
+        )
 
         async with httpx.AsyncClient() as client:
             try:
@@ -355,7 +869,8 @@ async def upload_document(
         return {
             "status": "ok",
             "filename": file.filename,
-            "chunks_indexed": total_chunks
+            "chunks_indexed": total_chunks,
+            "chunks_resumed": reused_chunks
         }
     except Exception as e:
         logger.error(f"Failed to upload document '{file.filename}': {e}")
@@ -364,7 +879,10 @@ async def upload_document(
         os.unlink(tmp_path)
 
 
-@router.delete("/collections/{collection_name}/documents/{source_name}")
+@router.delete(
+    "/collections/{collection_name}/documents/{source_name}",
+    dependencies=[Depends(_guard_collection_writes)]
+)
 async def delete_document(
     collection_name: str,
     source_name: str,
@@ -374,7 +892,7 @@ async def delete_document(
         f"Delete document request for collection '{collection_name}', "
         f"source_name: {source_name}"
     )
-    vector_client: QdrantVectorClient = (
+    vector_client: VectorClient = (
         request.app.state.vector_client
     )
 
@@ -463,7 +981,10 @@ async def delete_document(
         )
 
 
-@router.put("/collections/{collection_name}/upload")
+@router.put(
+    "/collections/{collection_name}/upload",
+    dependencies=[Depends(_guard_collection_writes)]
+)
 async def replace_document(
     request: Request,
     collection_name: str,
@@ -471,7 +992,7 @@ async def replace_document(
     custom_metadata: dict[str, Any] = Form(default={})
 ):
     logger.info(f"Replace document request for collection '{collection_name}', file: {file.filename}")
-    vector_client: QdrantVectorClient = (
+    vector_client: VectorClient = (
         request.app.state.vector_client
     )
     document_processor: DocumentProcessor = (
@@ -496,12 +1017,12 @@ async def replace_document(
             )
 
         logger.debug(f"Checking if document '{file_name}' exists")
-        existing_count = vector_client.count_points_by_source(
+        existing_point_ids = vector_client.get_point_ids_by_source(
             collection_name,
             file_name
         )
 
-        if existing_count == 0:
+        if not existing_point_ids:
             logger.warning(
                 f"No existing chunks found for '{file_name}' "
                 f"in collection '{collection_name}'"
@@ -515,14 +1036,9 @@ async def replace_document(
             )
 
         logger.info(
-            f"Found {existing_count} existing chunks for '{file_name}', "
-            f"deleting them"
-        )
-        deleted_count = vector_client.delete_points_by_source(
-            collection_name,
-            file_name
+            f"Found {len(existing_point_ids)} existing chunks for "
+            f"'{file_name}', replacing them"
         )
-        logger.info(f"Deleted {deleted_count} chunks")
     except HTTPException:
         raise
     except Exception as e:
@@ -532,53 +1048,20 @@ async def replace_document(
             detail=f"Failed to check existing document: {e}"
         )
 
-    with tempfile.NamedTemporaryFile(
-        delete=False,
-        suffix=os.path.splitext(file_name)[1]
-    ) as tmp_file:
-        tmp_path = tmp_file.name
-        total_size = 0
-        while True:
-            file_chunk = await file.read(1024 * 1024)
-            if not file_chunk:
-                break
-            total_size += len(file_chunk)
-            if total_size > MAX_UPLOAD_SIZE_BYTES:
-                os.unlink(tmp_path)
-                raise HTTPException(
-                    status_code=413,
-                    detail=(
-                        f"File exceeds maximum upload size "
-                        f"of {MAX_UPLOAD_SIZE_MB}MB"
-                    )
-                )
-            tmp_file.write(file_chunk)
+    tmp_path = await _save_upload_to_temp_file(file, file_name)
 
     try:
         logger.debug(f"Processing document: {file_name}")
-        
-        batch_size = 64
-        batch = []
-        total_chunks = 0
-        all_points_serialized = []
-        
-        for point in document_processor.process_document(
-            file_path=tmp_path,
-            filename=file_name,
-            custom_metadata=custom_metadata
-        ):
-            batch.append(point)
-            all_points_serialized.append(point.model_dump())
-            total_chunks += 1
-            
-            if len(batch) >= batch_size:
-                logger.debug(f"Upserting batch of {len(batch)} points")
-                vector_client.upsert(collection_name, batch)
-                batch = []
-        
-        if batch:
-            logger.debug(f"Upserting final batch of {len(batch)} points")
-            vector_client.upsert(collection_name, batch)
+
+        all_points_serialized, total_chunks, _ = _index_document(
+            vector_client=vector_client,
+            document_processor=document_processor,
+            collection_name=collection_name,
+            tmp_path=tmp_path,
+            file_name=file_name,
+            custom_metadata=custom_metadata,
+            existing_point_ids=existing_point_ids
+        )
         
         logger.info(f"Document processed into {total_chunks} chunks")
 
@@ -605,7 +1088,7 @@ async def replace_document(
         return {
             "status": "ok",
             "filename": file_name,
-            "chunks_replaced": existing_count,
+            "chunks_replaced": len(existing_point_ids),
             "chunks_indexed": total_chunks
         }
     except Exception as e:
@@ -615,13 +1098,544 @@ async def replace_document(
         os.unlink(tmp_path)
 
 
-@router.delete("/collections/{collection_name}/data")
+def _iter_archive_entries(
+    archive_path: str
+) -> Generator[Tuple[str, IO[bytes]], None, None]:
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                with archive.open(info) as entry:
+                    yield info.filename, entry
+        return
+
+    if tarfile.is_tarfile(archive_path):
+        # Stream mode reads members strictly in order without seeking back,
+        # so compressed tarballs are decompressed only once.
+        with tarfile.open(archive_path, mode="r|*") as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                entry = archive.extractfile(member)
+                if entry is not None:
+                    yield member.name, entry
+        return
+
+
+def _copy_entry_to_temp_file(entry: IO[bytes], file_name: str) -> str:
+    with tempfile.NamedTemporaryFile(
+        delete=False,
+        suffix=os.path.splitext(file_name)[1]
+    ) as tmp_file:
+        tmp_path = tmp_file.name
+        total_size = 0
+        while True:
+            file_chunk = entry.read(1024 * 1024)
+            if not file_chunk:
+                break
+            total_size += len(file_chunk)
+            if total_size > MAX_UPLOAD_SIZE_BYTES:
+                tmp_file.close()
+                os.unlink(tmp_path)
+                raise ValueError(
+                    f"File exceeds maximum upload size "
+                    f"of {MAX_UPLOAD_SIZE_MB}MB"
+                )
+            tmp_file.write(file_chunk)
+
+    return tmp_path
+
+
+@router.post(
+    "/collections/{collection_name}/upload-archive",
+    dependencies=[Depends(_guard_collection_writes)]
+)
+async def upload_archive(
+    request: Request,
+    collection_name: str,
+    file: UploadFile = File(...),
+    custom_metadata: dict[str, Any] = Form(default={}),
+    replace: bool = Form(default=False)
+):
+    logger.info(
+        f"Upload archive request for collection '{collection_name}', "
+        f"archive: {file.filename}"
+    )
+    vector_client: VectorClient = (
+        request.app.state.vector_client
+    )
+    document_processor: DocumentProcessor = (
+        request.app.state.document_processor
+    )
+
+    if not vector_client.collection_exists(collection_name):
+        logger.error(f"Collection '{collection_name}' does not exist")
+        raise HTTPException(
+            status_code=404,
+            detail=f"Collection '{collection_name}' does not exist"
+        )
+
+    archive_path = await _save_upload_to_temp_file(
+        file,
+        file.filename or "archive",
+        max_size_mb=MAX_ARCHIVE_UPLOAD_SIZE_MB
+    )
+
+    if not (
+        zipfile.is_zipfile(archive_path) or
+        tarfile.is_tarfile(archive_path)
+    ):
+        os.unlink(archive_path)
+        raise HTTPException(
+            status_code=400,
+            detail="Unsupported archive format. Supported: zip, tar"
+        )
+
+    report: List[Dict[str, Any]] = []
+    indexed_files: Dict[str, Dict[str, Any]] = {}
+    existing_point_ids: Dict[str, List[str]] = {}
+    errors: Dict[str, str] = {}
+
+    def documents() -> Generator[Tuple[str, str], None, None]:
+        # Entries are copied to disk one at a time and removed as soon as
+        # the processor has chunked them.
+        for entry_name, entry in _iter_archive_entries(archive_path):
+            file_name = os.path.basename(entry_name)
+            if not file_name or file_name.startswith("."):
+                continue
+
+            file_report = {"filename": file_name, "chunks_indexed": 0}
+            report.append(file_report)
+
+            if os.path.splitext(file_name)[1] not in SUPPORTED_DOCUMENT_EXTENSIONS:
+                file_report.update(
+                    status="skipped",
+                    detail="Unsupported file format"
+                )
+                continue
+
+            if file_name in indexed_files:
+                file_report.update(
+                    status="skipped",
+                    detail="Duplicate file name in archive"
+                )
+                continue
+
+            point_ids = vector_client.get_point_ids_by_source(
+                collection_name,
+                file_name
+            )
+            if point_ids and not replace:
+                file_report.update(
+                    status="skipped",
+                    detail="Document already exists in collection"
+                )
+                continue
+
+            try:
+                tmp_path = _copy_entry_to_temp_file(entry, file_name)
+            except ValueError as e:
+                file_report.update(status="failed", detail=str(e))
+                continue
+
+            file_report.update(status="indexed", replaced=bool(point_ids))
+            indexed_files[file_name] = file_report
+            existing_point_ids[file_name] = point_ids
+            try:
+                yield tmp_path, file_name
+            finally:
+                os.unlink(tmp_path)
+
+    try:
+        vector_size = vector_client.get_vector_size(collection_name)
+
+        # Extraction, embedding and upserts for the whole archive can take
+        # minutes, so they run on a worker thread instead of the event loop.
+        def index_archive() -> List[PointStruct]:
+            return _upsert_concurrently(
+                vector_client,
+                collection_name,
+                document_processor.process_documents(
+                    documents(),
+                    collection_name=collection_name,
+                    custom_metadata=custom_metadata,
+                    vector_size=vector_size,
+                    errors=errors
+                )
+            )
+
+        try:
+            indexed_points = await run_in_threadpool(index_archive)
+        except (zipfile.BadZipFile, tarfile.TarError) as e:
+            logger.error(f"Failed to read archive '{file.filename}': {e}")
+            raise HTTPException(
+                status_code=400,
+                detail=f"Failed to read archive: {e}"
+            )
+
+        for file_name, error in errors.items():
+            indexed_files.pop(file_name).update(status="failed", detail=error)
+
+        points_by_file: Dict[str, List[PointStruct]] = {
+            file_name: [] for file_name in indexed_files
+        }
+        for point in indexed_points:
+            points_by_file[point.payload["source_name"]].append(point)
+
+        stale_ids = []
+        for file_name, points in points_by_file.items():
+            indexed_files[file_name]["chunks_indexed"] = len(points)
+            current_ids = {str(point.id) for point in points}
+            stale_ids.extend(
+                point_id for point_id in existing_point_ids[file_name]
+                if point_id not in current_ids
+            )
+        if stale_ids:
+            logger.debug(f"Deleting {len(stale_ids)} stale points")
+            vector_client.delete_points(collection_name, stale_ids)
+
+        if points_by_file:
+            async with httpx.AsyncClient() as client:
+                try:
+                    response = await client.put(
+                        f"{DATABASE_SERVICE_URL}/documents-embedded/bulk",
+                        json={
+                            "documents": [
+                                {
+                                    "filename": file_name,
+                                    "points": json.dumps(
+                                        [point.model_dump() for point in points]
+                                    ),
+                                }
+                                for file_name, points in points_by_file.items()
+                            ]
+                        },
+                        timeout=60
+                    )
+                    response.raise_for_status()
+                    logger.info(
+                        f"Recorded {len(points_by_file)} embedded documents "
+                        f"in database service"
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to record embedded documents in database service: {e}")
+                    raise HTTPException(
+                        status_code=500,
+                        detail=f"Failed to record embedded documents in database service: {e}"
+                    )
+
+        logger.info(
+            f"Archive '{file.filename}' indexed {len(points_by_file)} of "
+            f"{len(report)} files into collection '{collection_name}'"
+        )
+        return {
+            "status": "ok",
+            "collection": collection_name,
+            "files_indexed": len(points_by_file),
+            "chunks_indexed": len(indexed_points),
+            "files": report
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to upload archive '{file.filename}': {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to upload archive: {e}"
+        )
+    finally:
+        os.unlink(archive_path)
+
+
+@router.get("/collections/{collection_name}/snapshot")
+async def export_collection_snapshot(
+    collection_name: str,
+    request: Request,
+    format: str = "arrow"
+):
+    logger.info(
+        f"Snapshot export request for collection '{collection_name}', "
+        f"format: {format}"
+    )
+    vector_client: VectorClient = (
+        request.app.state.vector_client
+    )
+
+    if format not in SNAPSHOT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Unsupported snapshot format '{format}'. "
+                f"Supported: {', '.join(SNAPSHOT_FORMATS)}"
+            )
+        )
+
+    if not vector_client.collection_exists(collection_name):
+        logger.error(f"Collection '{collection_name}' does not exist")
+        raise HTTPException(
+            status_code=404,
+            detail=f"Collection '{collection_name}' does not exist"
+        )
+
+    file_name = f"{collection_name}{SNAPSHOT_FILE_EXTENSIONS[format]}"
+    return StreamingResponse(
+        export_snapshot(vector_client, collection_name, format),
+        media_type=SNAPSHOT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{file_name}"'
+        }
+    )
+
+
+def _snapshot_point_id(
+    collection_name: str,
+    snapshot_collection: str,
+    point: Dict[str, Any]
+) -> str:
+    if collection_name == snapshot_collection:
+        return point["id"]
+
+    # Ids embed the collection name, and in the shared layout they share
+    # one id space, so restoring under another name derives new ids the
+    # same way an upload into that collection would.
+    payload = point["payload"]
+    if all(key in payload for key in ("source_name", "chunk_index", "content")):
+        return chunk_point_id(
+            collection_name,
+            payload["source_name"],
+            payload["chunk_index"],
+            payload["content"]
+        )
+    return str(
+        uuid.uuid5(POINT_ID_NAMESPACE, f"{collection_name}\n{point['id']}")
+    )
+
+
+@router.post(
+    "/collections/{collection_name}/snapshot",
+    dependencies=[Depends(_guard_collection_writes)]
+)
+async def import_collection_snapshot(
+    collection_name: str,
+    request: Request,
+    file: UploadFile = File(...),
+    replace: bool = Form(default=False),
+    record_documents: bool = Form(default=True)
+):
+    logger.info(
+        f"Snapshot import request for collection '{collection_name}', "
+        f"file: {file.filename}"
+    )
+    vector_client: VectorClient = (
+        request.app.state.vector_client
+    )
+
+    if collection_name in RESERVED_COLLECTION_NAMES:
+        logger.warning(f"Attempt to import into reserved collection '{collection_name}'")
+        raise HTTPException(
+            status_code=400,
+            detail=f"Collection name '{collection_name}' is reserved and cannot be used"
+        )
+
+    snapshot_path = await _save_upload_to_temp_file(
+        file,
+        file.filename or "snapshot",
+        max_size_mb=MAX_SNAPSHOT_UPLOAD_SIZE_MB
+    )
+
+    def import_snapshot() -> Tuple[Dict[str, Any], int, Dict[str, List[str]]]:
+        try:
+            info, point_batches = read_snapshot(
+                snapshot_path,
+                batch_size=SNAPSHOT_IMPORT_BATCH_SIZE
+            )
+        except SnapshotError as e:
+            logger.error(f"Invalid snapshot '{file.filename}': {e}")
+            raise HTTPException(status_code=400, detail=str(e))
+
+        if vector_client.collection_exists(collection_name):
+            vector_size = vector_client.get_vector_size(collection_name)
+            if vector_size != info["vector_size"]:
+                raise HTTPException(
+                    status_code=400,
+                    detail=(
+                        f"Snapshot stores vectors of size "
+                        f"{info['vector_size']}, collection "
+                        f"'{collection_name}' expects {vector_size}"
+                    )
+                )
+            if vector_client.count_points(collection_name) > 0:
+                if not replace:
+                    raise HTTPException(
+                        status_code=409,
+                        detail=(
+                            f"Collection '{collection_name}' is not empty. "
+                            f"Use replace=true to overwrite it."
+                        )
+                    )
+                vector_client.clear_collection(collection_name)
+        else:
+            vector_client.create_collection(
+                collection_name,
+                info["vector_size"],
+                datatype=info["datatype"]
+            )
+
+        for field_name, field_schema in info["payload_indexes"].items():
+            if field_name == "source_name":
+                continue
+            vector_client.create_payload_index(
+                collection_name,
+                field_name=field_name,
+                field_schema=field_schema
+            )
+
+        imported_count = 0
+        # Only point ids are kept per source; the points themselves are
+        # read back source by source when they are recorded.
+        point_ids_by_source: Dict[str, List[str]] = {}
+        for points in point_batches:
+            point_structs = [
+                PointStruct(
+                    id=_snapshot_point_id(
+                        collection_name,
+                        info["collection"],
+                        point
+                    ),
+                    vector=point["vector"].tolist(),
+                    payload=point["payload"]
+                )
+                for point in points
+            ]
+            _upsert_concurrently(
+                vector_client,
+                collection_name,
+                point_structs,
+                batch_size=SNAPSHOT_UPSERT_BATCH_SIZE
+            )
+            imported_count += len(point_structs)
+            logger.debug(
+                f"Imported {imported_count}/{info['point_count']} points"
+            )
+
+            if record_documents:
+                for point in point_structs:
+                    source_name = point.payload.get("source_name")
+                    if source_name is not None:
+                        point_ids_by_source.setdefault(source_name, []).append(
+                            point.id
+                        )
+
+        return info, imported_count, point_ids_by_source
+
+    def read_source_points(
+        source_names: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        return {
+            source_name: sorted(
+                (
+                    PointStruct(
+                        id=point["id"],
+                        vector=point["vector"],
+                        payload=point["payload"]
+                    ).model_dump()
+                    for point in vector_client.retrieve(
+                        collection_name,
+                        point_ids_by_source[source_name],
+                        with_vectors=True
+                    )
+                ),
+                key=lambda point: point["payload"].get("chunk_index", 0)
+            )
+            for source_name in source_names
+        }
+
+    try:
+        # Decoding, validating and upserting the snapshot are blocking and
+        # can take minutes, so they run on a worker thread.
+        info, imported_count, point_ids_by_source = await run_in_threadpool(
+            import_snapshot
+        )
+
+        # Documents are recorded in groups of about one import batch of
+        # points, so neither this service nor the database service ever
+        # holds the whole snapshot in one request.
+        source_groups: List[List[str]] = []
+        group_size = 0
+        for source_name, point_ids in point_ids_by_source.items():
+            if not source_groups or group_size >= SNAPSHOT_IMPORT_BATCH_SIZE:
+                source_groups.append([])
+                group_size = 0
+            source_groups[-1].append(source_name)
+            group_size += len(point_ids)
+
+        if source_groups:
+            async with httpx.AsyncClient() as client:
+                try:
+                    for source_names in source_groups:
+                        points_by_source = await run_in_threadpool(
+                            read_source_points,
+                            source_names
+                        )
+                        response = await client.put(
+                            f"{DATABASE_SERVICE_URL}/documents-embedded/bulk",
+                            json={
+                                "documents": [
+                                    {
+                                        "filename": source_name,
+                                        "points": json.dumps(points),
+                                    }
+                                    for source_name, points in points_by_source.items()
+                                ]
+                            },
+                            timeout=60
+                        )
+                        response.raise_for_status()
+                    logger.info(
+                        f"Recorded {len(point_ids_by_source)} embedded "
+                        f"documents in database service"
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to record embedded documents in database service: {e}")
+                    raise HTTPException(
+                        status_code=500,
+                        detail=f"Failed to record embedded documents in database service: {e}"
+                    )
+
+        logger.info(
+            f"Imported {imported_count} points from snapshot of "
+            f"'{info['collection']}' into collection '{collection_name}'"
+        )
+        return {
+            "status": "ok",
+            "collection": collection_name,
+            "source_collection": info["collection"],
+            "points_imported": imported_count,
+            "documents_recorded": len(point_ids_by_source)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to import snapshot '{file.filename}': {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to import snapshot: {e}"
+        )
+    finally:
+        os.unlink(snapshot_path)
+
+
+@router.delete(
+    "/collections/{collection_name}/data",
+    dependencies=[Depends(_guard_collection_writes)]
+)
 async def clear_collection(
     collection_name: str,
     request: Request
 ):
     logger.info(f"Clear collection request for '{collection_name}'")
-    vector_client: QdrantVectorClient = (
+    vector_client: VectorClient = (
         request.app.state.vector_client
     )
 
@@ -680,6 +1694,72 @@ async def clear_collection(
         )
 
 
+def _execute_search(
+    vector_client: VectorClient,
+    collection_name: str,
+    query_vector: List[float],
+    query: SearchQuery
+) -> Tuple[List[Dict[str, Any]], Optional[float]]:
+    with_payload = (
+        query.payload_fields if query.payload_fields is not None else True
+    )
+
+    if not query.auto_cut:
+        results = vector_client.search(
+            collection_name,
+            query_vector,
+            top_k=query.top_k,
+            score_threshold=query.score_threshold,
+            with_payload=with_payload,
+            search_filter=query.filter
+        )
+        return results[:query.max_results], query.score_threshold
+
+    # Auto-cut needs the whole score distribution but only the surviving
+    # hits' payloads, so score without payloads first and fetch the
+    # (projected) payloads of the kept hits afterwards.
+    hits = vector_client.search(
+        collection_name,
+        query_vector,
+        top_k=query.top_k,
+        score_threshold=query.score_threshold,
+        with_payload=False,
+        search_filter=query.filter
+    )
+    threshold = compute_auto_cut_threshold([hit["score"] for hit in hits])
+    if query.score_threshold is not None:
+        threshold = max(threshold, query.score_threshold)
+
+    kept_hits = [hit for hit in hits if hit["score"] >= threshold]
+    kept_hits = kept_hits[:query.max_results]
+
+    if not kept_hits or with_payload is False:
+        return kept_hits, threshold
+
+    payloads = {
+        str(point["id"]): point["payload"]
+        for point in vector_client.retrieve(
+            collection_name,
+            [hit["id"] for hit in kept_hits],
+            with_payload=with_payload
+        )
+    }
+    results = [
+        {
+            "id": hit["id"],
+            "score": hit["score"],
+            "metadata": payloads.get(str(hit["id"]))
+        }
+        for hit in kept_hits
+    ]
+
+    logger.debug(
+        f"Auto-cut kept {len(results)} of {len(hits)} hits "
+        f"at threshold {threshold:.4f}"
+    )
+    return results, threshold
+
+
 @router.post("/collections/{collection_name}/search")
 async def search(
     collection_name: str,
@@ -690,11 +1770,14 @@ async def search(
     embedding_service: EmbeddingService = (
         request.app.state.embedding_service
     )
-    vector_client: QdrantVectorClient = (
+    vector_client: VectorClient = (
         request.app.state.vector_client
     )
+    search_coalescer: SearchCoalescer = (
+        request.app.state.search_coalescer
+    )
 
-    try:
+    def compute_search() -> Tuple[List[Dict[str, Any]], Optional[float]]:
         if not vector_client.collection_exists(collection_name):
             logger.error(f"Collection '{collection_name}' does not exist")
             raise HTTPException(
@@ -703,16 +1786,36 @@ async def search(
             )
 
         logger.debug("Encoding search query")
-        query_vector = embedding_service.get_encoding(query.query)
+        query_vector = embedding_service.get_encoding(
+            query.query,
+            dimension=vector_client.get_vector_size(collection_name)
+        )
 
-        results = vector_client.search(
+        return _execute_search(
+            vector_client=vector_client,
+            collection_name=collection_name,
+            query_vector=query_vector,
+            query=query
+        )
+
+    # Queries differing only in whitespace tokenize identically, so they
+    # share one computation.
+    request_key = query.model_copy(
+        update={"query": " ".join(query.query.split())}
+    ).model_dump_json()
+
+    try:
+        results, applied_threshold = await search_coalescer.run(
             collection_name,
-            query_vector,
-            top_k=query.top_k
+            request_key,
+            compute_search
         )
 
         logger.info(f"Search completed, found {len(results)} results")
-        return {"results": results}
+        return {
+            "results": results,
+            "applied_threshold": applied_threshold
+        }
     except HTTPException:
         raise
     except Exception as e:
@@ -723,7 +1826,10 @@ async def search(
         )
 
 
-@router.post("/collections/{collection_name}/texts")
+@router.post(
+    "/collections/{collection_name}/texts",
+    dependencies=[Depends(_guard_collection_writes)]
+)
 async def insert_texts(
     collection_name: str,
     data: TextChunkInsert,
@@ -736,7 +1842,7 @@ async def insert_texts(
     embedding_service: EmbeddingService = (
         request.app.state.embedding_service
     )
-    vector_client: QdrantVectorClient = (
+    vector_client: VectorClient = (
         request.app.state.vector_client
     )
 
@@ -750,9 +1856,12 @@ async def insert_texts(
 
         logger.debug(f"Encoding {len(data.entries)} texts")
         points = []
+        vectors = embedding_service.get_encoding_for_batch(
+            [entry.text for entry in data.entries],
+            dimension=vector_client.get_vector_size(collection_name)
+        )
         
-        for entry in data.entries:
-            vector = embedding_service.get_encoding(entry.text)
+        for entry, vector in zip(data.entries, vectors):
             payload = {"text": entry.text}
             
             if entry.custom_metadata:
@@ -790,7 +1899,10 @@ async def insert_texts(
         )
 
 
-@router.patch("/collections/{collection_name}/documents/{source_name}/metadata")
+@router.patch(
+    "/collections/{collection_name}/documents/{source_name}/metadata",
+    dependencies=[Depends(_guard_collection_writes)]
+)
 async def update_document_metadata(
     collection_name: str,
     source_name: str,
@@ -801,7 +1913,7 @@ async def update_document_metadata(
         f"Update metadata request for collection '{collection_name}', "
         f"source_name: {source_name}"
     )
-    vector_client: QdrantVectorClient = (
+    vector_client: VectorClient = (
         request.app.state.vector_client
     )
 
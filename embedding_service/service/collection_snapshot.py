@@ -0,0 +1,279 @@
+import json
+import logging
+
+from typing import Any, Dict, Generator, List, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from client.vector_client import VectorClient
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = "1"
+
+SNAPSHOT_FORMATS = ["arrow", "parquet"]
+
+SNAPSHOT_MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+SNAPSHOT_FILE_EXTENSIONS = {
+    "arrow": ".arrows",
+    "parquet": ".parquet",
+}
+
+SNAPSHOT_EXPORT_BATCH_SIZE = 1000
+
+PARQUET_MAGIC = b"PAR1"
+ARROW_FILE_MAGIC = b"ARROW1"
+
+# Schema metadata keys, stored with the file so a snapshot can recreate
+# its collection without any out-of-band information.
+META_FORMAT_VERSION = b"deepresearch.snapshot_version"
+META_COLLECTION = b"deepresearch.collection"
+META_VECTOR_SIZE = b"deepresearch.vector_size"
+META_DATATYPE = b"deepresearch.datatype"
+META_PAYLOAD_INDEXES = b"deepresearch.payload_indexes"
+META_POINT_COUNT = b"deepresearch.point_count"
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def _snapshot_schema(
+    vector_size: int,
+    datatype: str,
+    metadata: Dict[bytes, bytes]
+) -> pa.Schema:
+    # Vectors are a fixed-size list column so readers get them as one
+    # contiguous buffer. Payloads are free-form, so they are kept as JSON
+    # text rather than forcing every payload into one struct type.
+    value_type = pa.float16() if datatype == "float16" else pa.float32()
+    return pa.schema(
+        [
+            pa.field("id", pa.string(), nullable=False),
+            pa.field(
+                "vector",
+                pa.list_(value_type, vector_size),
+                nullable=False
+            ),
+            pa.field("payload", pa.string()),
+        ],
+        metadata=metadata
+    )
+
+
+def _points_to_record_batch(
+    points: List[Dict[str, Any]],
+    schema: pa.Schema
+) -> pa.RecordBatch:
+    vector_type = schema.field("vector").type
+    vectors = np.asarray(
+        [point["vector"] for point in points],
+        dtype=(
+            np.float16 if pa.types.is_float16(vector_type.value_type)
+            else np.float32
+        )
+    )
+    values = pa.array(vectors.reshape(-1), type=vector_type.value_type)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array([str(point["id"]) for point in points], pa.string()),
+            pa.FixedSizeListArray.from_arrays(values, vector_type.list_size),
+            pa.array(
+                [json.dumps(point["payload"] or {}) for point in points],
+                pa.string()
+            ),
+        ],
+        schema=schema
+    )
+
+
+class _ChunkSink:
+
+    # Minimal writable file object: the Arrow writers push encoded bytes
+    # here and the export generator drains them after every batch, so the
+    # snapshot never has to be materialized in full.
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+
+    def tell(self) -> int:
+        return self._position
+
+
+    def flush(self):
+        pass
+
+
+    def close(self):
+        self.closed = True
+
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def export_snapshot(
+    vector_client: VectorClient,
+    collection_name: str,
+    snapshot_format: str,
+    batch_size: int = SNAPSHOT_EXPORT_BATCH_SIZE
+) -> Generator[bytes, None, None]:
+    if snapshot_format not in SNAPSHOT_FORMATS:
+        raise SnapshotError(
+            f"Unsupported snapshot format '{snapshot_format}'. "
+            f"Supported: {', '.join(SNAPSHOT_FORMATS)}"
+        )
+
+    vector_size = vector_client.get_vector_size(collection_name)
+    datatype = vector_client.get_vector_datatype(collection_name)
+    point_count = vector_client.count_points(collection_name)
+    schema = _snapshot_schema(
+        vector_size,
+        datatype,
+        {
+            META_FORMAT_VERSION: SNAPSHOT_FORMAT_VERSION.encode(),
+            META_COLLECTION: collection_name.encode(),
+            META_VECTOR_SIZE: str(vector_size).encode(),
+            META_DATATYPE: datatype.encode(),
+            META_PAYLOAD_INDEXES: json.dumps(
+                vector_client.get_payload_indexes(collection_name)
+            ).encode(),
+            META_POINT_COUNT: str(point_count).encode(),
+        }
+    )
+
+    logger.info(
+        f"Exporting {point_count} points of collection '{collection_name}' "
+        f"as {snapshot_format}"
+    )
+
+    sink = _ChunkSink()
+    if snapshot_format == "parquet":
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+        write_batch = writer.write_batch
+    else:
+        writer = ipc.new_stream(sink, schema)
+        write_batch = writer.write_batch
+
+    exported = 0
+    offset = None
+    while True:
+        points, offset = vector_client.scroll_points(
+            collection_name,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=True
+        )
+        if points:
+            write_batch(_points_to_record_batch(points, schema))
+            exported += len(points)
+            data = sink.drain()
+            if data:
+                yield data
+        if offset is None:
+            break
+
+    writer.close()
+    data = sink.drain()
+    if data:
+        yield data
+
+    logger.info(
+        f"Exported {exported} points of collection '{collection_name}'"
+    )
+
+
+def _open_batches(
+    path: str,
+    batch_size: int
+) -> Tuple[pa.Schema, Generator[pa.RecordBatch, None, None]]:
+    with open(path, "rb") as snapshot_file:
+        magic = snapshot_file.read(len(ARROW_FILE_MAGIC))
+
+    if magic.startswith(PARQUET_MAGIC):
+        parquet_file = pq.ParquetFile(path)
+        return (
+            parquet_file.schema_arrow,
+            parquet_file.iter_batches(batch_size=batch_size)
+        )
+
+    if magic == ARROW_FILE_MAGIC:
+        reader = ipc.open_file(path)
+        return reader.schema, (
+            reader.get_batch(i) for i in range(reader.num_record_batches)
+        )
+
+    reader = ipc.open_stream(pa.memory_map(path))
+    return reader.schema, iter(reader)
+
+
+def read_snapshot(
+    path: str,
+    batch_size: int
+) -> Tuple[Dict[str, Any], Generator[List[Dict[str, Any]], None, None]]:
+    try:
+        schema, batches = _open_batches(path, batch_size)
+    except (pa.ArrowInvalid, OSError) as e:
+        raise SnapshotError(f"Failed to read snapshot: {e}")
+
+    metadata = schema.metadata or {}
+    if META_VECTOR_SIZE not in metadata or schema.names != [
+        "id", "vector", "payload"
+    ]:
+        raise SnapshotError("File is not a collection snapshot")
+
+    info = {
+        "collection": metadata.get(META_COLLECTION, b"").decode(),
+        "vector_size": int(metadata[META_VECTOR_SIZE]),
+        "datatype": metadata.get(META_DATATYPE, b"float32").decode(),
+        "payload_indexes": json.loads(
+            metadata.get(META_PAYLOAD_INDEXES, b"{}")
+        ),
+        "point_count": int(metadata.get(META_POINT_COUNT, b"0")),
+    }
+
+    def iter_points() -> Generator[List[Dict[str, Any]], None, None]:
+        vector_size = info["vector_size"]
+        for batch in batches:
+            # Larger batches read from the Arrow stream are re-sliced so
+            # callers always get at most batch_size points at a time.
+            for start in range(0, batch.num_rows, batch_size):
+                batch_slice = batch.slice(start, batch_size)
+                vectors = batch_slice.column(1).flatten().to_numpy(
+                    zero_copy_only=False
+                ).reshape(-1, vector_size)
+                yield [
+                    {
+                        "id": point_id,
+                        "vector": vector,
+                        "payload": json.loads(payload)
+                    }
+                    for point_id, vector, payload in zip(
+                        batch_slice.column(0).to_pylist(),
+                        vectors,
+                        batch_slice.column(2).to_pylist()
+                    )
+                ]
+
+    return info, iter_points()
@@ -1,6 +1,10 @@
 import uuid
+import time
 import logging
-from typing import List
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from sentence_transformers import SentenceTransformer
 from qdrant_client.models import PointStruct
@@ -13,6 +17,15 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_EMBEDDING_DIMENSION = 768
 
+# Forward pass size handed to SentenceTransformer.encode, which already
+# sorts its input by length so each batch is padded to similar texts.
+ENCODING_BUCKET_SIZE = 32
+
+# Token statistics need a second, untruncated tokenizer pass, so they are
+# only measured on one encoded batch in this many; the token counts,
+# throughput and ratios describe those sampled batches.
+ENCODING_STATS_SAMPLE_INTERVAL = 10
+
 
 class EmbeddingService:
 
@@ -23,17 +36,219 @@ class EmbeddingService:
         self.dim = self.model.get_sentence_embedding_dimension() or DEFAULT_EMBEDDING_DIMENSION
         logger.info(f"EmbeddingService initialized, embedding dimension: {self.dim}")
 
+        self._stats_lock = threading.Lock()
+        self._encoded_batches = 0
+        self._encoded_texts = 0
+        self._encoding_stats = {
+            "sampled_batches": 0,
+            "texts": 0,
+            "tokens": 0,
+            "padded_tokens": 0,
+            "truncated_texts": 0,
+            "truncated_tokens": 0,
+            "seconds": 0.0,
+        }
+
+
+    def project(
+        self,
+        embeddings: np.ndarray,
+        dimension: Optional[int] = None
+    ) -> np.ndarray:
+        # Matryoshka-style truncation: keep the leading components and
+        # renormalize so cosine scores stay comparable across dimensions.
+        if dimension is None or dimension >= embeddings.shape[-1]:
+            return embeddings
+
+        truncated = embeddings[..., :dimension]
+        norms = np.linalg.norm(truncated, axis=-1, keepdims=True)
+        return truncated / np.maximum(norms, 1e-12)
 
-    def get_encoding(self, text: str) -> List[float]:
+
+    def get_encoding(
+        self,
+        text: str,
+        dimension: Optional[int] = None
+    ) -> List[float]:
         logger.debug(f"Encoding text of length {len(text)}")
         embedding = self.model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        return self.project(embedding, dimension).tolist()
+
+
+    def get_max_chunk_tokens(self) -> int:
+        # Room left in the model window once the tokenizer has added its
+        # special tokens ([CLS]/[SEP] and the like).
+        return self.model.max_seq_length - (
+            self.model.tokenizer.num_special_tokens_to_add(pair=False)
+        )
+
+
+    def supports_token_offsets(self) -> bool:
+        # Only the fast (Rust) tokenizers report character offsets.
+        return bool(getattr(self.model.tokenizer, "is_fast", False))
 
 
-    def get_encoding_for_batch(self, texts: List[str]) -> List[List[float]]:
+    def get_token_offsets(self, texts: List[str]) -> List[List[Tuple[int, int]]]:
+        encoded = self.model.tokenizer(
+            texts,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+            verbose=False
+        )
+        return encoded["offset_mapping"]
+
+
+    def _get_token_lengths(self, texts: List[str]) -> np.ndarray:
+        # Lengths are measured untruncated so that input the model is going
+        # to drop shows up in the truncation stats.
+        encoded = self.model.tokenizer(
+            texts,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+            verbose=False
+        )
+        return np.array(
+            [len(input_ids) for input_ids in encoded["input_ids"]],
+            dtype=np.int64
+        )
+
+
+    def _get_padded_tokens(
+        self,
+        texts: List[str],
+        token_lengths: np.ndarray
+    ) -> int:
+        # Mirrors how SentenceTransformer.encode batches: longest texts (by
+        # characters) first, each batch padded to its longest member.
+        order = np.argsort(
+            [-len(text) for text in texts],
+            kind="stable"
+        )
+        return sum(
+            int(token_lengths[batch].max()) * len(batch)
+            for batch in (
+                order[start:start + ENCODING_BUCKET_SIZE]
+                for start in range(0, len(texts), ENCODING_BUCKET_SIZE)
+            )
+        )
+
+
+    def _record_encoding_stats(
+        self,
+        token_lengths: np.ndarray,
+        padded_tokens: int,
+        truncated_tokens: np.ndarray,
+        elapsed: float
+    ):
+        tokens = int(token_lengths.sum())
+        truncated_texts = int(np.count_nonzero(truncated_tokens))
+
+        with self._stats_lock:
+            self._encoding_stats["sampled_batches"] += 1
+            self._encoding_stats["texts"] += len(token_lengths)
+            self._encoding_stats["tokens"] += tokens
+            self._encoding_stats["padded_tokens"] += padded_tokens
+            self._encoding_stats["truncated_texts"] += truncated_texts
+            self._encoding_stats["truncated_tokens"] += int(
+                truncated_tokens.sum()
+            )
+            self._encoding_stats["seconds"] += elapsed
+
+        if truncated_texts:
+            logger.warning(
+                f"{truncated_texts} of {len(token_lengths)} texts exceeded "
+                f"the model window of {self.model.max_seq_length} tokens, "
+                f"{int(truncated_tokens.sum())} tokens were not embedded"
+            )
+
+        logger.debug(
+            f"Encoded {len(token_lengths)} texts ({tokens} tokens) in "
+            f"{elapsed:.3f}s, {tokens / max(elapsed, 1e-9):.0f} tokens/sec, "
+            f"padding efficiency {tokens / max(padded_tokens, 1):.2%}"
+        )
+
+
+    def get_encoding_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._encoding_stats)
+            stats["encoded_batches"] = self._encoded_batches
+            stats["encoded_texts"] = self._encoded_texts
+
+        stats["tokens_per_second"] = (
+            stats["tokens"] / stats["seconds"] if stats["seconds"] else 0.0
+        )
+        stats["padding_efficiency"] = (
+            stats["tokens"] / stats["padded_tokens"]
+            if stats["padded_tokens"] else 1.0
+        )
+        stats["truncated_text_ratio"] = (
+            stats["truncated_texts"] / stats["texts"]
+            if stats["texts"] else 0.0
+        )
+        stats["truncated_token_ratio"] = (
+            stats["truncated_tokens"] /
+            (stats["tokens"] + stats["truncated_tokens"])
+            if stats["tokens"] else 0.0
+        )
+        return stats
+
+
+    def encode_batch(
+        self,
+        texts: List[str],
+        dimension: Optional[int] = None
+    ) -> np.ndarray:
         logger.debug(f"Encoding batch of {len(texts)} texts")
-        embeddings = self.model.encode(texts, convert_to_numpy=True)
-        return embeddings.tolist()
+        if not texts:
+            return np.empty(
+                (0, min(dimension or self.dim, self.dim)),
+                dtype=np.float32
+            )
+
+        start_time = time.perf_counter()
+
+        embeddings = self.model.encode(
+            texts,
+            batch_size=ENCODING_BUCKET_SIZE,
+            convert_to_numpy=True
+        )
+        elapsed = time.perf_counter() - start_time
+
+        with self._stats_lock:
+            sampled = (
+                self._encoded_batches % ENCODING_STATS_SAMPLE_INTERVAL == 0
+            )
+            self._encoded_batches += 1
+            self._encoded_texts += len(texts)
+        if not sampled:
+            return self.project(embeddings, dimension)
+
+        # One tokenizer pass for the throughput and truncation stats only;
+        # it is not part of the timed encode.
+        full_token_lengths = self._get_token_lengths(texts)
+        token_lengths = np.minimum(
+            full_token_lengths,
+            self.model.max_seq_length
+        )
+
+        self._record_encoding_stats(
+            token_lengths=token_lengths,
+            padded_tokens=self._get_padded_tokens(texts, token_lengths),
+            truncated_tokens=full_token_lengths - token_lengths,
+            elapsed=elapsed
+        )
+
+        return self.project(embeddings, dimension)
+
+
+    def get_encoding_for_batch(
+        self,
+        texts: List[str],
+        dimension: Optional[int] = None
+    ) -> List[List[float]]:
+        return self.encode_batch(texts, dimension).tolist()
 
 
     def get_dimension(self) -> int:        
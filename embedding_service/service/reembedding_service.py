@@ -0,0 +1,470 @@
+import time
+import uuid
+import logging
+import threading
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set
+
+from qdrant_client.models import PointStruct
+
+from client.vector_client import VectorClient
+from model.reembedding_job import ReembeddingJob
+from service.embedding_service import EmbeddingService
+from service.search_coalescer import SearchCoalescer
+
+
+logger = logging.getLogger(__name__)
+
+SCROLL_PAGE_SIZE = 1000
+
+ACTIVE_STATUSES = ("running", "swapping")
+
+
+class ReembeddingCancelled(Exception):
+    pass
+
+
+class ReembeddingService:
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        vector_client: VectorClient,
+        search_coalescer: Optional[SearchCoalescer] = None
+    ):
+        logger.info("Initializing ReembeddingService")
+        self.embedding_service = embedding_service
+        self.vector_client = vector_client
+        self.search_coalescer = search_coalescer
+        self._jobs: Dict[str, ReembeddingJob] = {}
+        self._cancel_events: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        # Writes in flight per collection name; the swap waits for them to
+        # drain so none can land on a collection that is being replaced.
+        self._active_writes: Dict[str, int] = {}
+        self._writes_drained = threading.Condition(self._lock)
+
+
+    def get_job(self, job_id: str) -> Optional[ReembeddingJob]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.model_copy() if job is not None else None
+
+
+    def list_jobs(self) -> List[ReembeddingJob]:
+        with self._lock:
+            return [job.model_copy() for job in self._jobs.values()]
+
+
+    def start_job(
+        self,
+        collection_name: str,
+        vector_size: int,
+        datatype: str,
+        batch_size: int,
+        max_points_per_second: Optional[float] = None
+    ) -> ReembeddingJob:
+        with self._lock:
+            if any(
+                job.collection_name == collection_name and
+                job.status in ACTIVE_STATUSES
+                for job in self._jobs.values()
+            ):
+                raise ValueError(
+                    f"A re-embedding job is already running for "
+                    f"collection '{collection_name}'"
+                )
+
+            job_id = uuid.uuid4().hex
+            job = ReembeddingJob(
+                id=job_id,
+                collection_name=collection_name,
+                shadow_collection=f"{collection_name}__reembed_{job_id[:12]}",
+                model_name=self.embedding_service.model_name,
+                vector_size=vector_size,
+                datatype=datatype,
+                created_at=datetime.now(timezone.utc)
+            )
+            self._jobs[job_id] = job
+            self._cancel_events[job_id] = threading.Event()
+
+        logger.info(
+            f"Starting re-embedding job {job_id} for collection "
+            f"'{collection_name}' into '{job.shadow_collection}'"
+        )
+        threading.Thread(
+            target=self._run_job,
+            args=(job, batch_size, max_points_per_second),
+            name=f"reembed-{job_id[:12]}",
+            daemon=True
+        ).start()
+        return job.model_copy()
+
+
+    def rollback_job(self, job_id: str) -> ReembeddingJob:
+        with self._lock:
+            job = self._jobs[job_id]
+
+            if job.status == "running":
+                # The job notices the event between batches, drops the
+                # shadow collection and ends as cancelled.
+                logger.info(f"Cancelling re-embedding job {job_id}")
+                self._cancel_events[job_id].set()
+                return job.model_copy()
+
+            if job.status != "completed" or job.previous_collection is None:
+                raise ValueError(
+                    f"Re-embedding job {job_id} cannot be rolled back "
+                    f"in status '{job.status}'"
+                )
+
+            logger.info(
+                f"Rolling back re-embedding job {job_id}: pointing "
+                f"'{job.collection_name}' back to '{job.previous_collection}'"
+            )
+            self.vector_client.set_alias(
+                job.collection_name,
+                job.previous_collection
+            )
+            self._invalidate_searches(job.collection_name)
+            job.status = "rolled_back"
+            return job.model_copy()
+
+
+    def begin_write(self, collection_name: str):
+        with self._lock:
+            if any(
+                job.collection_name == collection_name and
+                job.status == "swapping"
+                for job in self._jobs.values()
+            ):
+                raise ValueError(
+                    f"Collection '{collection_name}' is being swapped by a "
+                    f"re-embedding job; retry the write shortly"
+                )
+            self._active_writes[collection_name] = (
+                self._active_writes.get(collection_name, 0) + 1
+            )
+
+
+    def end_write(self, collection_name: str):
+        with self._lock:
+            self._active_writes[collection_name] -= 1
+            if self._active_writes[collection_name] == 0:
+                del self._active_writes[collection_name]
+                self._writes_drained.notify_all()
+
+
+    def _invalidate_searches(self, collection_name: str):
+        # Alias swaps change what a collection name serves without going
+        # through the router, so cached searches are dropped here.
+        if self.search_coalescer is not None:
+            self.search_coalescer.invalidate(collection_name)
+
+
+    def _check_cancelled(self, job: ReembeddingJob):
+        if self._cancel_events[job.id].is_set():
+            raise ReembeddingCancelled()
+
+
+    def _reembed_points(
+        self,
+        job: ReembeddingJob,
+        points: List[Dict[str, Any]],
+        skipped_ids: Set[str],
+        wait: bool
+    ) -> List[PointStruct]:
+        texts = []
+        kept_points = []
+        for point in points:
+            payload = point["payload"] or {}
+            # Document chunks keep their text under "content", entries
+            # inserted through /texts under "text".
+            text = payload.get("content", payload.get("text"))
+            if not isinstance(text, str) or not text:
+                skipped_ids.add(str(point["id"]))
+                continue
+            texts.append(text)
+            kept_points.append(point)
+
+        job.skipped_points = len(skipped_ids)
+        if not kept_points:
+            return []
+
+        vectors = self.embedding_service.encode_batch(
+            texts,
+            dimension=job.vector_size
+        )
+        new_points = [
+            PointStruct(
+                id=point["id"],
+                vector=vector.tolist(),
+                payload=point["payload"]
+            )
+            for point, vector in zip(kept_points, vectors)
+        ]
+        self.vector_client.upsert(
+            job.shadow_collection,
+            new_points,
+            wait=wait
+        )
+        return new_points
+
+
+    def _point_ids(self, collection_name: str) -> Set[str]:
+        point_ids = set()
+        offset = None
+        while True:
+            points, offset = self.vector_client.scroll_points(
+                collection_name,
+                limit=SCROLL_PAGE_SIZE,
+                offset=offset,
+                with_payload=False
+            )
+            point_ids.update(str(point["id"]) for point in points)
+            if offset is None:
+                return point_ids
+
+
+    def _reconcile(
+        self,
+        job: ReembeddingJob,
+        target_collection: str,
+        batch_size: int,
+        skipped_ids: Set[str],
+        reembed: bool
+    ):
+        # Writes that reached the live collection while it was being
+        # scrolled are caught up by diffing point ids, which is cheap
+        # compared to a second full pass.
+        source_ids = self._point_ids(job.collection_name) - skipped_ids
+        target_ids = self._point_ids(target_collection)
+
+        missing_ids = list(source_ids - target_ids)
+        stale_ids = list(target_ids - source_ids)
+        logger.info(
+            f"Re-embedding job {job.id}: reconciling '{target_collection}', "
+            f"{len(missing_ids)} missing and {len(stale_ids)} stale points"
+        )
+
+        for start in range(0, len(missing_ids), batch_size):
+            self._check_cancelled(job)
+            points = self.vector_client.retrieve(
+                job.collection_name,
+                missing_ids[start:start + batch_size],
+                with_vectors=not reembed
+            )
+            if reembed:
+                self._reembed_points(job, points, skipped_ids, wait=True)
+            else:
+                self.vector_client.upsert(
+                    target_collection,
+                    [
+                        PointStruct(
+                            id=point["id"],
+                            vector=point["vector"],
+                            payload=point["payload"]
+                        )
+                        for point in points
+                    ]
+                )
+
+        if stale_ids:
+            self.vector_client.delete_points(target_collection, stale_ids)
+
+
+    def _copy_payload_indexes(self, source: str, target: str):
+        for field_name, field_schema in (
+            self.vector_client.get_payload_indexes(source).items()
+        ):
+            if field_name == "source_name":
+                continue
+            self.vector_client.create_payload_index(
+                target,
+                field_name=field_name,
+                field_schema=field_schema
+            )
+
+
+    def _run_job(
+        self,
+        job: ReembeddingJob,
+        batch_size: int,
+        max_points_per_second: Optional[float]
+    ):
+        skipped_ids: Set[str] = set()
+        backup_collection = None
+        source_deleted = False
+        swapped = False
+
+        try:
+            self.vector_client.create_collection(
+                job.shadow_collection,
+                job.vector_size,
+                datatype=job.datatype
+            )
+            self._copy_payload_indexes(
+                job.collection_name,
+                job.shadow_collection
+            )
+            job.total_points = self.vector_client.count_points(
+                job.collection_name
+            )
+
+            started = time.monotonic()
+            offset = None
+            last_points: List[PointStruct] = []
+            while True:
+                self._check_cancelled(job)
+                points, offset = self.vector_client.scroll_points(
+                    job.collection_name,
+                    limit=batch_size,
+                    offset=offset
+                )
+                last_points = self._reembed_points(
+                    job,
+                    points,
+                    skipped_ids,
+                    wait=False
+                ) or last_points
+                job.processed_points += len(points)
+
+                elapsed = time.monotonic() - started
+                if max_points_per_second:
+                    # Pace the job so it does not starve live searches of
+                    # encoder and Qdrant capacity.
+                    target_elapsed = job.processed_points / max_points_per_second
+                    if target_elapsed > elapsed:
+                        self._cancel_events[job.id].wait(
+                            target_elapsed - elapsed
+                        )
+                        elapsed = time.monotonic() - started
+                job.points_per_second = job.processed_points / max(elapsed, 1e-9)
+
+                logger.debug(
+                    f"Re-embedding job {job.id}: {job.processed_points}/"
+                    f"{job.total_points} points"
+                )
+                if offset is None:
+                    break
+
+            if last_points:
+                # Batches were sent without waiting; re-sending the last
+                # one with wait=True is a barrier for all of them.
+                self.vector_client.upsert(
+                    job.shadow_collection,
+                    last_points,
+                    wait=True
+                )
+
+            self._reconcile(
+                job,
+                job.shadow_collection,
+                batch_size,
+                skipped_ids,
+                reembed=True
+            )
+
+            with self._lock:
+                self._check_cancelled(job)
+                job.status = "swapping"
+                while self._active_writes.get(job.collection_name):
+                    self._writes_drained.wait()
+
+            # New writes are rejected from here on, so this last catch-up
+            # covers everything the live collection will ever receive.
+            self._reconcile(
+                job,
+                job.shadow_collection,
+                batch_size,
+                skipped_ids,
+                reembed=True
+            )
+
+            previous_collection = self.vector_client.resolve_alias(
+                job.collection_name
+            )
+            if previous_collection is None:
+                # The first migration of a plain collection has to free its
+                # name for the alias, so its points are copied aside first
+                # to keep rollback possible.
+                backup_collection = (
+                    f"{job.collection_name}__backup_{job.id[:12]}"
+                )
+                self.vector_client.create_collection(
+                    backup_collection,
+                    self.vector_client.get_vector_size(job.collection_name),
+                    datatype=self.vector_client.get_vector_datatype(
+                        job.collection_name
+                    )
+                )
+                self._copy_payload_indexes(
+                    job.collection_name,
+                    backup_collection
+                )
+                self._reconcile(
+                    job,
+                    backup_collection,
+                    batch_size,
+                    set(),
+                    reembed=False
+                )
+                self.vector_client.delete_collection(job.collection_name)
+                source_deleted = True
+                previous_collection = backup_collection
+
+            self.vector_client.set_alias(
+                job.collection_name,
+                job.shadow_collection
+            )
+            self._invalidate_searches(job.collection_name)
+            swapped = True
+            job.previous_collection = previous_collection
+            job.status = "completed"
+            logger.info(
+                f"Re-embedding job {job.id} completed: '{job.collection_name}' "
+                f"now points to '{job.shadow_collection}'"
+            )
+        except ReembeddingCancelled:
+            logger.info(f"Re-embedding job {job.id} cancelled")
+            job.status = "cancelled"
+        except Exception as e:
+            logger.error(f"Re-embedding job {job.id} failed: {e}")
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.now(timezone.utc)
+            if swapped:
+                return
+
+            if source_deleted:
+                # Keep serving the copied points under the original name.
+                try:
+                    self.vector_client.set_alias(
+                        job.collection_name,
+                        backup_collection
+                    )
+                    job.previous_collection = backup_collection
+                    self._invalidate_searches(job.collection_name)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to restore '{job.collection_name}' from "
+                        f"'{backup_collection}': {e}"
+                    )
+                self._drop_collections(job.shadow_collection)
+            else:
+                self._drop_collections(job.shadow_collection, backup_collection)
+
+
+    def _drop_collections(self, *collection_names: Optional[str]):
+        for collection_name in collection_names:
+            if collection_name is None:
+                continue
+            try:
+                if self.vector_client.collection_exists(collection_name):
+                    self.vector_client.delete_collection(collection_name)
+            except Exception as e:
+                logger.error(
+                    f"Failed to drop collection '{collection_name}': {e}"
+                )
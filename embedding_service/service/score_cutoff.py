@@ -0,0 +1,35 @@
+import logging
+
+from collections import Counter
+from statistics import mean, median
+from typing import List
+
+
+logger = logging.getLogger(__name__)
+
+AUTO_CUT_DAMPENING = 0.8
+AUTO_CUT_MIN_THRESHOLD = 0.3
+
+
+def compute_auto_cut_threshold(scores: List[float]) -> float:
+    # The cutoff follows the bulk of the score distribution: the highest
+    # of its mean, median and mode, dampened so that hits just below the
+    # typical score survive, and never lower than a fixed floor.
+    if not scores:
+        return AUTO_CUT_MIN_THRESHOLD
+
+    score_mean = mean(scores)
+    score_median = median(scores)
+    score_mode = Counter(scores).most_common(1)[0][0]
+
+    dynamic_threshold = max(score_mean, score_median, score_mode)
+    final_threshold = max(
+        dynamic_threshold * AUTO_CUT_DAMPENING,
+        AUTO_CUT_MIN_THRESHOLD
+    )
+
+    logger.debug(
+        f"Auto-cut threshold {final_threshold:.4f} from mean "
+        f"{score_mean:.4f}, median {score_median:.4f}, mode {score_mode:.4f}"
+    )
+    return final_threshold
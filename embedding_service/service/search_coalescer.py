@@ -0,0 +1,139 @@
+import time
+import asyncio
+import logging
+import threading
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+
+logger = logging.getLogger(__name__)
+
+
+class SearchCoalescer:
+
+    # Identical searches that arrive while one is already running await
+    # that computation instead of starting their own (single-flight), and
+    # finished results are reused for ttl_seconds. Every cache and
+    # in-flight key carries the collection's write generation, so a write
+    # makes both unreachable at once: searches started before the write
+    # are neither joined nor cached afterwards.
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        logger.info(
+            f"Initializing SearchCoalescer with a {ttl_seconds}s result "
+            f"cache of up to {max_entries} entries"
+        )
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._generations: Dict[str, int] = {}
+        self._cache: "OrderedDict[Tuple[str, int, str], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._in_flight: Dict[Tuple[str, int, str], asyncio.Future] = {}
+        self._stats = {
+            "requests": 0,
+            "cache_hits": 0,
+            "coalesced": 0,
+            "executed": 0,
+            "invalidations": 0,
+        }
+
+
+    async def run(
+        self,
+        collection_name: str,
+        request_key: str,
+        compute: Callable[[], Any]
+    ) -> Any:
+        with self._lock:
+            self._stats["requests"] += 1
+            generation = self._generations.get(collection_name, 0)
+            key = (collection_name, generation, request_key)
+
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                self._stats["cache_hits"] += 1
+                return cached[1]
+
+            task = self._in_flight.get(key)
+            if task is not None:
+                self._stats["coalesced"] += 1
+            else:
+                self._stats["executed"] += 1
+                task = asyncio.ensure_future(self._execute(key, compute))
+                # The computation outlives any single caller, so retrieve
+                # its exception even if every caller went away.
+                task.add_done_callback(
+                    lambda done: done.cancelled() or done.exception()
+                )
+                self._in_flight[key] = task
+
+        # Shielded so that one caller disconnecting does not cancel the
+        # search for everyone else awaiting it.
+        return await asyncio.shield(task)
+
+
+    async def _execute(
+        self,
+        key: Tuple[str, int, str],
+        compute: Callable[[], Any]
+    ) -> Any:
+        try:
+            result = await run_in_threadpool(compute)
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+        collection_name, generation, _ = key
+        with self._lock:
+            if (
+                self.ttl_seconds > 0 and
+                self._generations.get(collection_name, 0) == generation
+            ):
+                self._cache[key] = (
+                    time.monotonic() + self.ttl_seconds,
+                    result
+                )
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+        return result
+
+
+    def invalidate(self, collection_name: str):
+        with self._lock:
+            self._generations[collection_name] = (
+                self._generations.get(collection_name, 0) + 1
+            )
+            stale_keys = [
+                key for key in self._cache if key[0] == collection_name
+            ]
+            for key in stale_keys:
+                del self._cache[key]
+            self._stats["invalidations"] += 1
+
+        logger.debug(
+            f"Invalidated {len(stale_keys)} cached searches of collection "
+            f"'{collection_name}'"
+        )
+
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["cache_entries"] = len(self._cache)
+            stats["in_flight"] = len(self._in_flight)
+
+        stats["cache_hit_rate"] = (
+            stats["cache_hits"] / stats["requests"]
+            if stats["requests"] else 0.0
+        )
+        stats["coalesced_rate"] = (
+            stats["coalesced"] / stats["requests"]
+            if stats["requests"] else 0.0
+        )
+        return stats
@@ -0,0 +1,8 @@
+import sys
+
+from pathlib import Path
+
+
+# The service imports its modules from its own directory (client.*,
+# model.*), the way run.sh starts it.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,336 @@
+import uuid
+
+import numpy as np
+import pytest
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import PointStruct
+
+import client.qdrant_vector_client as qdrant_vector_client
+from client.local_vector_client import LocalVectorClient
+from client.qdrant_vector_client import QdrantVectorClient
+from client.shared_qdrant_vector_client import SharedQdrantVectorClient
+from model.search_filter import SearchFilter, MetadataCondition
+
+
+# Every VectorClient backend must behave the same through the interface
+# the router uses; each test runs against all of them.
+
+VECTOR_SIZE = 8
+
+COLLECTION = "contract"
+
+
+@pytest.fixture(params=["local", "qdrant", "shared"])
+def vector_client(request, tmp_path, monkeypatch):
+    if request.param == "local":
+        return LocalVectorClient(str(tmp_path / "vector_store"))
+
+    monkeypatch.setattr(
+        qdrant_vector_client,
+        "QdrantClient",
+        lambda url: QdrantClient(location=":memory:")
+    )
+    if request.param == "shared":
+        return SharedQdrantVectorClient("memory", "shared")
+    return QdrantVectorClient("memory")
+
+
+def _vector(seed: int) -> list:
+    return np.random.default_rng(seed).normal(size=VECTOR_SIZE).tolist()
+
+
+def _normalized(vector) -> np.ndarray:
+    vector = np.asarray(vector, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _point(seed: int, source_name: str, **custom_metadata) -> PointStruct:
+    return PointStruct(
+        id=str(uuid.UUID(int=seed + 1)),
+        vector=_vector(seed),
+        payload={
+            "source_name": source_name,
+            "content": f"chunk {seed}",
+            "custom_metadata": custom_metadata,
+        }
+    )
+
+
+@pytest.fixture
+def points():
+    return [
+        _point(0, "a.pdf", year=2020, topic="x"),
+        _point(1, "a.pdf", year=2021, topic="y"),
+        _point(2, "b.pdf", year=2022, topic="x"),
+        _point(3, "b.pdf", year=2023, topic="y"),
+        _point(4, "c.pdf", year=2024, topic="x"),
+    ]
+
+
+@pytest.fixture
+def collection(vector_client, points):
+    vector_client.create_collection(COLLECTION, VECTOR_SIZE)
+    vector_client.upsert(COLLECTION, points)
+    return COLLECTION
+
+
+def _ids(points) -> set:
+    return {str(point.id) for point in points}
+
+
+def test_create_collection(vector_client):
+    assert not vector_client.collection_exists(COLLECTION)
+
+    vector_client.create_collection(COLLECTION, VECTOR_SIZE)
+
+    assert vector_client.collection_exists(COLLECTION)
+    assert COLLECTION in vector_client.get_collections()
+    assert vector_client.get_vector_size(COLLECTION) == VECTOR_SIZE
+    assert vector_client.get_vector_datatype(COLLECTION) == "float32"
+    assert vector_client.count_points(COLLECTION) == 0
+
+
+def test_upsert_and_count(vector_client, collection, points):
+    assert vector_client.count_points(collection) == len(points)
+
+    # Upserting an existing id replaces the point instead of adding one.
+    replacement = _point(0, "c.pdf", year=1999)
+    vector_client.upsert(collection, [replacement])
+
+    assert vector_client.count_points(collection) == len(points)
+    assert vector_client.count_points_by_source(collection, "a.pdf") == 1
+    assert vector_client.count_points_by_source(collection, "c.pdf") == 2
+    [record] = vector_client.retrieve(collection, [str(replacement.id)])
+    assert record["payload"] == replacement.payload
+
+
+def test_get_point_ids_by_source(vector_client, collection, points):
+    assert set(
+        vector_client.get_point_ids_by_source(collection, "b.pdf")
+    ) == _ids(points[2:4])
+    assert vector_client.get_point_ids_by_source(collection, "missing") == []
+
+
+def test_delete_points(vector_client, collection, points):
+    deleted = vector_client.delete_points(
+        collection,
+        [str(points[0].id), str(points[3].id)]
+    )
+
+    assert deleted == 2
+    assert vector_client.count_points(collection) == len(points) - 2
+    remaining = {
+        point["id"] for point in vector_client.get_all_points(collection)
+    }
+    assert {str(point_id) for point_id in remaining} == (
+        _ids(points) - _ids([points[0], points[3]])
+    )
+
+
+def test_delete_points_by_source(vector_client, collection, points):
+    assert vector_client.delete_points_by_source(collection, "a.pdf") == 2
+
+    assert vector_client.count_points_by_source(collection, "a.pdf") == 0
+    assert vector_client.count_points(collection) == len(points) - 2
+    assert vector_client.delete_points_by_source(collection, "a.pdf") == 0
+
+
+def test_update_custom_metadata_by_source(vector_client, collection, points):
+    vector_client.update_custom_metadata_by_source(
+        collection,
+        "b.pdf",
+        {"reviewed": True}
+    )
+
+    records = vector_client.retrieve(collection, list(_ids(points)))
+    by_id = {str(record["id"]): record["payload"] for record in records}
+    for point in points:
+        payload = by_id[str(point.id)]
+        if point.payload["source_name"] == "b.pdf":
+            assert payload["custom_metadata"] == {"reviewed": True}
+        else:
+            assert payload == point.payload
+
+
+def test_search_ranks_by_cosine_similarity(vector_client, collection, points):
+    query = _vector(2)
+
+    results = vector_client.search(collection, query, top_k=3)
+
+    assert len(results) == 3
+    assert str(results[0]["id"]) == str(points[2].id)
+    assert results[0]["score"] == pytest.approx(1.0, abs=1e-4)
+    scores = [result["score"] for result in results]
+    assert scores == sorted(scores, reverse=True)
+    assert results[0]["metadata"] == points[2].payload
+
+    expected = sorted(
+        float(_normalized(point.vector) @ _normalized(query))
+        for point in points
+    )[::-1][:3]
+    assert scores == pytest.approx(expected, abs=1e-4)
+
+
+def test_search_score_threshold_and_projection(vector_client, collection):
+    results = vector_client.search(
+        collection,
+        _vector(2),
+        top_k=5,
+        score_threshold=0.99,
+        with_payload=["source_name"]
+    )
+
+    assert len(results) == 1
+    assert results[0]["metadata"] == {"source_name": "b.pdf"}
+
+
+def test_filtered_search(vector_client, collection, points):
+    by_source = vector_client.search(
+        collection,
+        _vector(0),
+        top_k=5,
+        search_filter=SearchFilter(source_names=["b.pdf", "c.pdf"])
+    )
+    assert {str(result["id"]) for result in by_source} == _ids(points[2:])
+
+    by_metadata = vector_client.search(
+        collection,
+        _vector(0),
+        top_k=5,
+        search_filter=SearchFilter(
+            custom_metadata=[
+                MetadataCondition(key="topic", equals="x"),
+                MetadataCondition(key="year", gte=2021, lt=2024),
+            ]
+        )
+    )
+    assert {str(result["id"]) for result in by_metadata} == _ids([points[2]])
+
+    combined = vector_client.search(
+        collection,
+        _vector(0),
+        top_k=5,
+        search_filter=SearchFilter(
+            source_names=["a.pdf"],
+            custom_metadata=[MetadataCondition(key="year", gt=2020)]
+        )
+    )
+    assert {str(result["id"]) for result in combined} == _ids([points[1]])
+
+
+def test_scroll_points(vector_client, collection, points):
+    seen = []
+    offset = None
+    while True:
+        page, offset = vector_client.scroll_points(
+            collection,
+            limit=2,
+            offset=offset,
+            with_vectors=True
+        )
+        assert len(page) <= 2
+        seen.extend(page)
+        if offset is None:
+            break
+
+    assert sorted(str(point["id"]) for point in seen) == sorted(_ids(points))
+    vectors = {str(point.id): point.vector for point in points}
+    for point in seen:
+        assert point["payload"]["source_name"]
+        np.testing.assert_allclose(
+            _normalized(point["vector"]),
+            _normalized(vectors[str(point["id"])]),
+            atol=1e-5
+        )
+
+
+def test_retrieve(vector_client, collection, points):
+    ids = [str(points[1].id), str(points[4].id)]
+
+    records = vector_client.retrieve(collection, ids)
+    assert {str(record["id"]) for record in records} == set(ids)
+    assert all("vector" not in record for record in records)
+
+    records = vector_client.retrieve(
+        collection,
+        ids + [str(uuid.UUID(int=999))],
+        with_vectors=True
+    )
+    assert {str(record["id"]) for record in records} == set(ids)
+    vectors = {str(point.id): point.vector for point in points}
+    for record in records:
+        np.testing.assert_allclose(
+            _normalized(record["vector"]),
+            _normalized(vectors[str(record["id"])]),
+            atol=1e-5
+        )
+
+
+def test_aliases(vector_client, collection, points):
+    if not vector_client.supports_aliases:
+        pytest.skip("backend has no collection aliases")
+
+    vector_client.create_collection("contract_v2", VECTOR_SIZE)
+    vector_client.upsert("contract_v2", points[:2])
+
+    vector_client.set_alias("current", collection)
+    assert vector_client.resolve_alias("current") == collection
+    assert vector_client.collection_exists("current")
+    assert vector_client.count_points("current") == len(points)
+
+    # Re-pointing an alias switches every read over at once.
+    vector_client.set_alias("current", "contract_v2")
+    assert vector_client.resolve_alias("current") == "contract_v2"
+    assert vector_client.count_points("current") == 2
+    assert vector_client.resolve_alias(collection) is None
+
+    collections = set(vector_client.get_collections())
+    assert "current" in collections
+    assert "contract_v2" not in collections
+
+    vector_client.delete_collection("current")
+    assert vector_client.resolve_alias("current") is None
+    assert not vector_client.collection_exists("contract_v2")
+    assert vector_client.collection_exists(collection)
+
+
+def test_clear_collection(vector_client, collection, points):
+    assert vector_client.clear_collection(collection) == len(points)
+
+    assert vector_client.collection_exists(collection)
+    assert vector_client.count_points(collection) == 0
+    assert vector_client.search(collection, _vector(0), top_k=3) == []
+
+    vector_client.upsert(collection, points[:1])
+    assert vector_client.count_points(collection) == 1
+
+
+def test_delete_collection(vector_client, collection):
+    assert vector_client.delete_collection(collection)
+
+    assert not vector_client.collection_exists(collection)
+    assert collection not in vector_client.get_collections()
+
+
+def test_local_collection_survives_reopen(tmp_path, points):
+    # The local backend persists through a snapshot plus a write log;
+    # a new client on the same directory must see every write.
+    storage_path = str(tmp_path / "vector_store")
+    vector_client = LocalVectorClient(storage_path)
+    vector_client.create_collection(COLLECTION, VECTOR_SIZE)
+    vector_client.upsert(COLLECTION, points)
+    vector_client.delete_points_by_source(COLLECTION, "a.pdf")
+    vector_client.update_custom_metadata_by_source(
+        COLLECTION,
+        "c.pdf",
+        {"reviewed": True}
+    )
+    expected = vector_client.search(COLLECTION, _vector(3), top_k=5)
+
+    reopened = LocalVectorClient(storage_path)
+
+    assert reopened.count_points(COLLECTION) == len(points) - 2
+    assert reopened.search(COLLECTION, _vector(3), top_k=5) == (
+        pytest.approx(expected)
+    )
@@ -1,5 +1,7 @@
 import logging
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from router.process_selection_router import process_selection_router
@@ -7,6 +9,8 @@ from router.simple_process_router import simple_process_router
 from router.perform_research_router import router as perform_research_router
 from router.graph_router import router as graph_router
 from router.llm_test_router import llm_test_router
+from client.http_client_pool import open_http_clients, close_http_clients
+from utils.prompt_loader import get_prompt_registry
 
 logging.basicConfig(
     level=logging.DEBUG,
@@ -20,7 +24,16 @@ logging.getLogger('anthropic._base_client').setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Deep Research Graph Service")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_prompt_registry()
+    open_http_clients()
+    yield
+    await close_http_clients()
+
+
+app = FastAPI(title="Deep Research Graph Service", lifespan=lifespan)
 
 app.include_router(process_selection_router)
 app.include_router(simple_process_router)
@@ -1,27 +1,32 @@
-from fastapi import HTTPException
-import httpx
-
 from typing import Optional
 
 import logging
 
-from config import DATABASE_SERVICE_URL
+from client.http_client_pool import (
+    database_http_client,
+    database_events_http_client,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Responses of a database service without the stop request long poll.
+STOP_REQUEST_WAIT_UNSUPPORTED_STATUSES = (404, 405, 501)
+
 
 async def get_invocation(
     profile_id: str,
     invocation_id: str,
 ):
-    url = f"{DATABASE_SERVICE_URL}/{profile_id}/invocations/{invocation_id}"
+    url = f"/{profile_id}/invocations/{invocation_id}"
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url=url)
-            response.raise_for_status()
-            return response.json()
+        response = await database_http_client.get(
+            url,
+            endpoint="get_invocation",
+        )
+        response.raise_for_status()
+        return response.json()
     except Exception as e:
         logger.error(
             f"Failed to get invocation {invocation_id}: {str(e)}"
@@ -36,7 +41,7 @@ async def create_invocation(
     status: str = "running",
     graph_state: Optional[dict] = None,
 ):
-    url = f"{DATABASE_SERVICE_URL}/{profile_id}/invocations"
+    url = f"/{profile_id}/invocations"
     
     payload = {
         "invocation_id": invocation_id,
@@ -47,16 +52,16 @@ async def create_invocation(
     }
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                url=url,
-                json=payload,
-            )
-            response.raise_for_status()
-            logger.info(
-                f"Created invocation {invocation_id} for profile {profile_id}"
-            )
-            return response.json()
+        response = await database_http_client.post(
+            url,
+            endpoint="create_invocation",
+            json=payload,
+        )
+        response.raise_for_status()
+        logger.info(
+            f"Created invocation {invocation_id} for profile {profile_id}"
+        )
+        return response.json()
     except Exception as e:
         logger.error(
             f"Failed to create invocation {invocation_id}: {str(e)}"
@@ -70,7 +75,7 @@ async def update_invocation(
     status: Optional[str] = None,
     graph_state: Optional[dict] = None,
 ):
-    url = f"{DATABASE_SERVICE_URL}/{profile_id}/invocations/{invocation_id}"
+    url = f"/{profile_id}/invocations/{invocation_id}"
     
     payload = {}
     
@@ -81,16 +86,16 @@ async def update_invocation(
         payload["graph_state"] = graph_state
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.patch(
-                url=url,
-                json=payload,
-            )
-            response.raise_for_status()
-            logger.debug(
-                f"Updated invocation {invocation_id} for profile {profile_id}"
-            )
-            return response.json()
+        response = await database_http_client.patch(
+            url,
+            endpoint="update_invocation",
+            json=payload,
+        )
+        response.raise_for_status()
+        logger.debug(
+            f"Updated invocation {invocation_id} for profile {profile_id}"
+        )
+        return response.json()
     except Exception as e:
         logger.error(
             f"Failed to update invocation {invocation_id}: {str(e)}"
@@ -98,26 +103,59 @@ async def update_invocation(
         raise
 
 
+async def patch_invocation_graph_state(
+    profile_id: str,
+    invocation_id: str,
+    patch: list[dict],
+    status: Optional[str] = None,
+):
+    url = f"/{profile_id}/invocations/{invocation_id}/graph-state"
+
+    payload = {
+        "status": status,
+        "patch": patch,
+    }
+
+    try:
+        response = await database_http_client.patch(
+            url,
+            endpoint="patch_invocation_graph_state",
+            json=payload,
+        )
+        response.raise_for_status()
+        logger.debug(
+            f"Patched graph state of invocation {invocation_id} with "
+            f"{len(patch)} operations"
+        )
+        return response.json()
+    except Exception as e:
+        logger.error(
+            f"Failed to patch graph state of invocation {invocation_id}: "
+            f"{str(e)}"
+        )
+        raise
+
+
 async def create_stop_request(
     invocation_id: str,
 ):
-    url = f"{DATABASE_SERVICE_URL}/invocation-stop-requests"
+    url = "/invocation-stop-requests"
 
     payload = {
         "invocation_id": invocation_id,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                url=url,
-                json=payload,
-            )
-            response.raise_for_status()
-            logger.info(
-                f"Created stop request for invocation {invocation_id}"
-            )
-            return response.json()
+        response = await database_http_client.post(
+            url,
+            endpoint="create_stop_request",
+            json=payload,
+        )
+        response.raise_for_status()
+        logger.info(
+            f"Created stop request for invocation {invocation_id}"
+        )
+        return response.json()
     except Exception as e:
         logger.error(
             f"Failed to create stop request for invocation {invocation_id}: {str(e)}"
@@ -128,12 +166,14 @@ async def create_stop_request(
 async def check_stop_request_exists(
     invocation_id: str,
 ) -> bool:
-    url = f"{DATABASE_SERVICE_URL}/invocation-stop-requests/{invocation_id}"
+    url = f"/invocation-stop-requests/{invocation_id}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url=url)
-            return response.status_code == 200
+        response = await database_http_client.get(
+            url,
+            endpoint="check_stop_request",
+        )
+        return response.status_code == 200
     except Exception as e:
         logger.warning(
             f"Failed to check stop request for invocation {invocation_id}: {str(e)}"
@@ -141,19 +181,58 @@ async def check_stop_request_exists(
         return False
 
 
+async def wait_for_stop_request(
+    invocation_id: str,
+    timeout: float,
+) -> Optional[bool]:
+    # True once a stop request exists, False if none was created within
+    # the timeout, and None if the database service does not support the
+    # long poll at all, in which case the caller has to poll. Transient
+    # failures raise, so the caller can retry.
+    url = f"/invocation-stop-requests/{invocation_id}/wait"
+
+    try:
+        response = await database_events_http_client.get(
+            url,
+            endpoint="wait_for_stop_request",
+            params={"timeout": timeout},
+        )
+        if response.status_code == 200:
+            return True
+        if response.status_code == 204:
+            return False
+        if response.status_code in STOP_REQUEST_WAIT_UNSUPPORTED_STATUSES:
+            logger.warning(
+                f"Stop request long poll is not supported by the database "
+                f"service: HTTP {response.status_code}"
+            )
+            return None
+        response.raise_for_status()
+        raise RuntimeError(
+            f"Unexpected response HTTP {response.status_code}"
+        )
+    except Exception as e:
+        logger.warning(
+            f"Failed to wait for stop request for invocation {invocation_id}: {str(e)}"
+        )
+        raise
+
+
 async def delete_stop_request(
     invocation_id: str,
 ) -> bool:
-    url = f"{DATABASE_SERVICE_URL}/invocation-stop-requests/{invocation_id}"
+    url = f"/invocation-stop-requests/{invocation_id}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.delete(url=url)
-            response.raise_for_status()
-            logger.info(
-                f"Deleted stop request for invocation {invocation_id}"
-            )
-            return True
+        response = await database_http_client.delete(
+            url,
+            endpoint="delete_stop_request",
+        )
+        response.raise_for_status()
+        logger.info(
+            f"Deleted stop request for invocation {invocation_id}"
+        )
+        return True
     except Exception as e:
         logger.warning(
             f"Failed to delete stop request for invocation {invocation_id}: {str(e)}"
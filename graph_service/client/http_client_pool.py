@@ -0,0 +1,262 @@
+import time
+import logging
+import importlib.util
+
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+import httpx
+
+from config import (
+    DATABASE_SERVICE_URL,
+    DATABASE_SERVICE_TIMEOUT_SECONDS,
+    DATABASE_SERVICE_MAX_CONNECTIONS,
+    DATABASE_EVENTS_MAX_CONNECTIONS,
+    STOP_SIGNAL_LONG_POLL_SECONDS,
+    EMBEDDING_SERVICE_URL,
+    EMBEDDING_SERVICE_TIMEOUT_SECONDS,
+    EMBEDDING_SERVICE_MAX_CONNECTIONS,
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 is negotiated over TLS only, so it matters for https downstreams
+# and needs the optional h2 package; plain http stays on HTTP/1.1.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+LATENCY_WINDOW_SIZE = 512
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(
+        len(sorted_values) - 1,
+        int(round(fraction * (len(sorted_values) - 1)))
+    )
+    return sorted_values[index]
+
+
+class _EndpointStats:
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.recent_seconds: Deque[float] = deque(maxlen=LATENCY_WINDOW_SIZE)
+
+
+    def record(self, elapsed: float, failed: bool):
+        self.requests += 1
+        if failed:
+            self.errors += 1
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+        self.recent_seconds.append(elapsed)
+
+
+    def to_dict(self) -> Dict[str, Any]:
+        recent = sorted(self.recent_seconds)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "avg_ms": (
+                1000 * self.total_seconds / self.requests
+                if self.requests else 0.0
+            ),
+            "p50_ms": 1000 * _percentile(recent, 0.5),
+            "p95_ms": 1000 * _percentile(recent, 0.95),
+            "max_ms": 1000 * self.max_seconds,
+        }
+
+
+class ServiceHttpClient:
+
+    # One pooled httpx.AsyncClient per downstream service, so the many
+    # small requests of a research run reuse keep-alive connections
+    # instead of paying connection setup each time. The underlying client
+    # is created on first use (inside the running event loop) and closed
+    # by the app lifespan. Callers name the endpoint they hit so latency is
+    # reported per logical endpoint rather than per concrete URL.
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        timeout_seconds: float,
+        max_connections: int,
+    ):
+        self.name = name
+        self.base_url = base_url
+        self.timeout_seconds = timeout_seconds
+        self.max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._endpoint_stats: Dict[str, _EndpointStats] = {}
+
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            logger.info(
+                f"Opening HTTP client for '{self.name}' service at "
+                f"{self.base_url} (max {self.max_connections} connections, "
+                f"http2: {HTTP2_AVAILABLE})"
+            )
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=HTTP2_AVAILABLE,
+                timeout=httpx.Timeout(
+                    self.timeout_seconds,
+                    connect=HTTP_CONNECT_TIMEOUT_SECONDS
+                ),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS
+                ),
+            )
+        return self._client
+
+
+    def open(self):
+        self._get_client()
+
+
+    async def aclose(self):
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info(f"Closed HTTP client for '{self.name}' service")
+        self._client = None
+
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        endpoint: str,
+        **kwargs
+    ) -> httpx.Response:
+        client = self._get_client()
+
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = await client.request(method, path, **kwargs)
+            failed = response.is_server_error
+            return response
+        finally:
+            self._in_flight -= 1
+            stats = self._endpoint_stats.get(endpoint)
+            if stats is None:
+                stats = self._endpoint_stats[endpoint] = _EndpointStats()
+            stats.record(time.perf_counter() - started, failed)
+
+
+    async def get(self, path: str, endpoint: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", path, endpoint, **kwargs)
+
+
+    async def post(self, path: str, endpoint: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", path, endpoint, **kwargs)
+
+
+    async def patch(self, path: str, endpoint: str, **kwargs) -> httpx.Response:
+        return await self.request("PATCH", path, endpoint, **kwargs)
+
+
+    async def delete(self, path: str, endpoint: str, **kwargs) -> httpx.Response:
+        return await self.request("DELETE", path, endpoint, **kwargs)
+
+
+    def _connection_counts(self) -> Dict[str, int]:
+        # httpx does not expose its pool, so this reads httpcore's view of
+        # it and reports nothing if that internal layout ever changes.
+        pool = getattr(
+            getattr(self._client, "_transport", None),
+            "_pool",
+            None
+        )
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return {"open_connections": 0, "idle_connections": 0}
+
+        return {
+            "open_connections": len(connections),
+            "idle_connections": sum(
+                1 for connection in connections if connection.is_idle()
+            ),
+        }
+
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "http2": HTTP2_AVAILABLE,
+            "timeout_seconds": self.timeout_seconds,
+            "max_connections": self.max_connections,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "utilization": self._in_flight / self.max_connections,
+            **self._connection_counts(),
+            "endpoints": {
+                endpoint: stats.to_dict()
+                for endpoint, stats in sorted(self._endpoint_stats.items())
+            },
+        }
+
+
+database_http_client = ServiceHttpClient(
+    name="database",
+    base_url=DATABASE_SERVICE_URL,
+    timeout_seconds=DATABASE_SERVICE_TIMEOUT_SECONDS,
+    max_connections=DATABASE_SERVICE_MAX_CONNECTIONS,
+)
+
+database_events_http_client = ServiceHttpClient(
+    name="database_events",
+    base_url=DATABASE_SERVICE_URL,
+    timeout_seconds=(
+        STOP_SIGNAL_LONG_POLL_SECONDS + DATABASE_SERVICE_TIMEOUT_SECONDS
+    ),
+    max_connections=DATABASE_EVENTS_MAX_CONNECTIONS,
+)
+
+embedding_http_client = ServiceHttpClient(
+    name="embedding",
+    base_url=EMBEDDING_SERVICE_URL,
+    timeout_seconds=EMBEDDING_SERVICE_TIMEOUT_SECONDS,
+    max_connections=EMBEDDING_SERVICE_MAX_CONNECTIONS,
+)
+
+SERVICE_HTTP_CLIENTS = {
+    client.name: client
+    for client in (
+        database_http_client,
+        database_events_http_client,
+        embedding_http_client,
+    )
+}
+
+
+def open_http_clients():
+    for client in SERVICE_HTTP_CLIENTS.values():
+        client.open()
+
+
+async def close_http_clients():
+    for client in SERVICE_HTTP_CLIENTS.values():
+        await client.aclose()
+
+
+def get_http_client_stats() -> Dict[str, Any]:
+    return {
+        name: client.get_stats()
+        for name, client in SERVICE_HTTP_CLIENTS.items()
+    }
@@ -45,4 +45,120 @@ DATABASE_SERVICE_URL = _get_optional_env_var(
 EMBEDDING_SERVICE_URL = _get_optional_env_var(
     var_name="EMBEDDING_SERVICE_URL",
     default_value="http://localhost:8004/api/embeddings",
-)
\ No newline at end of file
+)
+
+# Every downstream service gets one pooled, keep-alive HTTP client; the
+# request timeout and connection limit are set per service.
+DATABASE_SERVICE_TIMEOUT_SECONDS = float(_get_optional_env_var(
+    var_name="DATABASE_SERVICE_TIMEOUT_SECONDS",
+    default_value="10",
+))
+
+DATABASE_SERVICE_MAX_CONNECTIONS = int(_get_optional_env_var(
+    var_name="DATABASE_SERVICE_MAX_CONNECTIONS",
+    default_value="20",
+))
+
+# Stop signals from other graph service processes arrive through long
+# polls on the database service, which get a client of their own so that
+# one held connection per running invocation never starves regular
+# database requests.
+STOP_SIGNAL_LONG_POLL_SECONDS = float(_get_optional_env_var(
+    var_name="STOP_SIGNAL_LONG_POLL_SECONDS",
+    default_value="30",
+))
+
+DATABASE_EVENTS_MAX_CONNECTIONS = int(_get_optional_env_var(
+    var_name="DATABASE_EVENTS_MAX_CONNECTIONS",
+    default_value="200",
+))
+
+EMBEDDING_SERVICE_TIMEOUT_SECONDS = float(_get_optional_env_var(
+    var_name="EMBEDDING_SERVICE_TIMEOUT_SECONDS",
+    default_value="30",
+))
+
+EMBEDDING_SERVICE_MAX_CONNECTIONS = int(_get_optional_env_var(
+    var_name="EMBEDDING_SERVICE_MAX_CONNECTIONS",
+    default_value="50",
+))
+
+HTTP_CONNECT_TIMEOUT_SECONDS = float(_get_optional_env_var(
+    var_name="HTTP_CONNECT_TIMEOUT_SECONDS",
+    default_value="5",
+))
+
+HTTP_KEEPALIVE_EXPIRY_SECONDS = float(_get_optional_env_var(
+    var_name="HTTP_KEEPALIVE_EXPIRY_SECONDS",
+    default_value="30",
+))
+
+
+# Admission limits for LLM requests, per provider. Requests beyond the
+# concurrency limit queue fairly across invocations; a requests or tokens
+# per minute limit of 0 disables that bucket.
+CLAUDE_MAX_CONCURRENT_REQUESTS = int(_get_optional_env_var(
+    var_name="CLAUDE_MAX_CONCURRENT_REQUESTS",
+    default_value="8",
+))
+
+CLAUDE_REQUESTS_PER_MINUTE = int(_get_optional_env_var(
+    var_name="CLAUDE_REQUESTS_PER_MINUTE",
+    default_value="0",
+))
+
+CLAUDE_TOKENS_PER_MINUTE = int(_get_optional_env_var(
+    var_name="CLAUDE_TOKENS_PER_MINUTE",
+    default_value="0",
+))
+
+OPENAI_MAX_CONCURRENT_REQUESTS = int(_get_optional_env_var(
+    var_name="OPENAI_MAX_CONCURRENT_REQUESTS",
+    default_value="8",
+))
+
+OPENAI_REQUESTS_PER_MINUTE = int(_get_optional_env_var(
+    var_name="OPENAI_REQUESTS_PER_MINUTE",
+    default_value="0",
+))
+
+OPENAI_TOKENS_PER_MINUTE = int(_get_optional_env_var(
+    var_name="OPENAI_TOKENS_PER_MINUTE",
+    default_value="0",
+))
+
+LLM_RATE_LIMIT_MAX_RETRIES = int(_get_optional_env_var(
+    var_name="LLM_RATE_LIMIT_MAX_RETRIES",
+    default_value="3",
+))
+
+
+# Opt-in cache of deterministic LLM sub-calls (chunk summarization,
+# search query generation, process selection) in a local sqlite file.
+LLM_CACHE_ENABLED = _get_optional_env_var(
+    var_name="LLM_CACHE_ENABLED",
+    default_value="false",
+).lower() in ("1", "true", "yes")
+
+LLM_CACHE_PATH = _get_optional_env_var(
+    var_name="LLM_CACHE_PATH",
+    default_value="./llm_cache/responses.sqlite3",
+)
+
+LLM_CACHE_TTL_SECONDS = float(_get_optional_env_var(
+    var_name="LLM_CACHE_TTL_SECONDS",
+    default_value="86400",
+))
+
+LLM_CACHE_MAX_SIZE_MB = int(_get_optional_env_var(
+    var_name="LLM_CACHE_MAX_SIZE_MB",
+    default_value="256",
+))
+
+
+
+# Development aid: pick up edited prompt files without a restart.
+PROMPT_HOT_RELOAD = _get_optional_env_var(
+    var_name="PROMPT_HOT_RELOAD",
+    default_value="false",
+).lower() in ("1", "true", "yes")
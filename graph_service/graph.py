@@ -35,6 +35,7 @@ from service.simple_process_service import (
 from service.perform_research_service import (
     execute_tasks_in_parallel,
     execute_tasks_in_sequence,
+    execute_tasks_as_dag,
 )
 from service.perform_review_service import (
     execute_perform_review,
@@ -76,7 +77,10 @@ async def node_process_selection(state: GraphState) -> GraphState:
 
         output = state.process_selection
     else:
-        llm_client = get_llm(state.execution_config.model_selection)
+        llm_client = get_llm(
+            state.execution_config.model_selection,
+            temperature=state.execution_config.temperature,
+        )
         output = await select_process(
             input_data=input_data,
             llm_client=llm_client,
@@ -113,7 +117,10 @@ async def node_simple_process(state: GraphState) -> GraphState:
         chat_history=state.messages,
     )
 
-    llm_client = get_llm(state.execution_config.model_selection)
+    llm_client = get_llm(
+        state.execution_config.model_selection,
+        temperature=state.execution_config.temperature,
+    )
     output = await execute_simple_process(
         input_data=input_data,
         llm_client=llm_client,
@@ -147,11 +154,15 @@ async def node_parallel_tasks(
         chat_history=state.messages,        
     )
     
-    llm_client = get_llm(state.execution_config.model_selection)
+    llm_client = get_llm(
+        state.execution_config.model_selection,
+        temperature=state.execution_config.temperature,
+    )
     output = await execute_tasks_in_parallel(
         input_data=input_data,
         llm_client=llm_client,
         stream_writer=stream_writer,
+        execution_config=state.execution_config,
     )
     logger.debug(f"Parallel tasks output: {output.model_dump()}")
 
@@ -181,7 +192,10 @@ async def node_sequential_tasks(
         chat_history=state.messages,        
     )
     
-    llm_client = get_llm(state.execution_config.model_selection)
+    llm_client = get_llm(
+        state.execution_config.model_selection,
+        temperature=state.execution_config.temperature,
+    )
     output = await execute_tasks_in_sequence(
         input_data=input_data,
         llm_client=llm_client,
@@ -204,6 +218,44 @@ async def node_sequential_tasks(
     return state
 
 
+async def node_dag_tasks(
+    state: GraphState,
+) -> GraphState:
+    logger.debug("Starting dag tasks node")
+    stream_writer = _get_stream_writer_safe()
+
+    input_data = PerformResearchInput(
+        query=state.user_query,
+        collection_name=state.profile_id,
+        chat_history=state.messages,        
+    )
+    
+    llm_client = get_llm(
+        state.execution_config.model_selection,
+        temperature=state.execution_config.temperature,
+    )
+    output = await execute_tasks_as_dag(
+        input_data=input_data,
+        llm_client=llm_client,
+        stream_writer=stream_writer,
+        execution_config=state.execution_config,    
+    )
+    logger.debug(f"Dag tasks output: {output.model_dump()}")
+
+    state.task_entries = output.task_entries
+    state.steps.append(
+        GraphStep(
+            type="dag_tasks",
+            details={
+                "input": input_data.model_dump(),
+                "output": output.model_dump(),
+            },
+        )
+    )
+
+    return state
+
+
 async def node_perform_review(
     state: GraphState,
 ) -> GraphState:
@@ -215,7 +267,10 @@ async def node_perform_review(
         chat_history=state.messages,
     )
     
-    llm_client = get_llm(state.execution_config.model_selection)
+    llm_client = get_llm(
+        state.execution_config.model_selection,
+        temperature=state.execution_config.temperature,
+    )
     output = await execute_perform_review(
         input_data=input_data,
         llm_client=llm_client,
@@ -249,7 +304,10 @@ async def node_generate_summary(
         chat_history=state.messages,
     )
     
-    llm_client = get_llm(state.execution_config.model_selection)
+    llm_client = get_llm(
+        state.execution_config.model_selection,
+        temperature=state.execution_config.temperature,
+    )
     output = await execute_generate_summary(
         input_data=input_data,
         llm_client=llm_client,
@@ -273,7 +331,13 @@ async def node_generate_summary(
 
 def route_by_process_selection(
     state: GraphState,
-) -> Literal["simple_process", "parallel_tasks", "sequential_tasks", "end"]:
+) -> Literal[
+    "simple_process",
+    "parallel_tasks",
+    "sequential_tasks",
+    "dag_tasks",
+    "end",
+]:
     process_selection = state.process_selection
 
     if not process_selection or not process_selection.process_type:
@@ -287,6 +351,8 @@ def route_by_process_selection(
         return "parallel_tasks"
     elif process_type == "sequential_tasks":
         return "sequential_tasks"
+    elif process_type == "dag_tasks":
+        return "dag_tasks"
     
     raise ValueError(f"Unknown process type: {process_type}")
 
@@ -297,6 +363,7 @@ GRAPH_STRUCTURE = {
         "simple_process": node_simple_process,
         "parallel_tasks": node_parallel_tasks,
         "sequential_tasks": node_sequential_tasks,
+        "dag_tasks": node_dag_tasks,
         "perform_review": node_perform_review,
         "generate_summary": node_generate_summary,
     },
@@ -304,6 +371,7 @@ GRAPH_STRUCTURE = {
         ("simple_process", END),
         ("parallel_tasks", "perform_review"),
         ("sequential_tasks", "perform_review"),
+        ("dag_tasks", "perform_review"),
         ("perform_review", "generate_summary"),
         ("generate_summary", END),
     ],
@@ -315,6 +383,7 @@ GRAPH_STRUCTURE = {
                 "simple_process": "simple_process",
                 "parallel_tasks": "parallel_tasks",
                 "sequential_tasks": "sequential_tasks",
+                "dag_tasks": "dag_tasks",
             },
         },
     ],
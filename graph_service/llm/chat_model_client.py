@@ -0,0 +1,135 @@
+import logging
+
+from typing import Optional, Type, TypeVar, Any
+
+from langchain_core.callbacks import UsageMetadataCallbackHandler
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable
+from pydantic import BaseModel
+
+from config import LLM_RATE_LIMIT_MAX_RETRIES
+from llm.llm_client import LLMClient
+from llm.rate_limiter import ProviderRateLimiter
+
+
+T = TypeVar("T", bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used to charge a request against the
+# tokens/minute bucket before it is sent. Only the prompt is estimated;
+# the bucket is corrected afterwards with the provider's reported usage,
+# output tokens included.
+CHARS_PER_TOKEN = 4
+
+DEFAULT_RETRY_AFTER_SECONDS = 2.0
+
+
+def _estimate_tokens(input: list[BaseMessage]) -> int:
+    return 1 + sum(
+        len(str(message.content)) for message in input
+    ) // CHARS_PER_TOKEN
+
+
+def _retry_after_seconds(error: Exception, attempt: int) -> Optional[float]:
+    # The Anthropic and OpenAI SDK errors both carry the HTTP status and
+    # response; anything other than a 429 is not a rate limit.
+    if getattr(error, "status_code", None) != 429:
+        return None
+
+    headers = getattr(getattr(error, "response", None), "headers", {})
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    return DEFAULT_RETRY_AFTER_SECONDS * 2 ** attempt
+
+
+class ChatModelClient(LLMClient):
+
+    # Shared by the LangChain-backed providers. The chat model is built
+    # once per provider, so its SDK client and HTTP pool are reused, and
+    # the structured-output runnable for each output type is built once
+    # and kept. Per-call overrides like temperature travel as invoke
+    # kwargs, which LangChain merges into the request payload of the
+    # underlying model (also through the structured-output runnable,
+    # whose first step forwards them). Token usage is collected by a
+    # callback handler on each call, since structured-output runnables
+    # return only the parsed model. Every request is admitted by the
+    # provider's rate limiter and retried after rate-limit responses.
+
+    def __init__(
+        self,
+        chat_model: BaseChatModel,
+        rate_limiter: ProviderRateLimiter,
+    ):
+        self._client = chat_model
+        self._structured_clients: dict[Type[BaseModel], Runnable] = {}
+        self.rate_limiter = rate_limiter
+        model_name = (
+            getattr(chat_model, "model_name", None) or
+            getattr(chat_model, "model", None)
+        )
+        self.model_id = (
+            f"{type(chat_model).__name__}:{model_name}"
+            f"|temperature={getattr(chat_model, 'temperature', None)}"
+        )
+
+
+    def _get_structured_client(self, output_type: Type[T]) -> Runnable:
+        client = self._structured_clients.get(output_type)
+        if client is None:
+            client = self._client.with_structured_output(output_type)
+            self._structured_clients[output_type] = client
+        return client
+
+
+    async def ainvoke(
+        self,
+        input: list[BaseMessage],
+        output_type: Optional[Type[T]] = None,
+        temperature: Optional[float] = None,
+    ) -> Any:
+        if output_type is not None:
+            client = self._get_structured_client(output_type)
+        else:
+            client = self._client
+
+        kwargs = {}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+
+        estimated_tokens = _estimate_tokens(input)
+
+        for attempt in range(LLM_RATE_LIMIT_MAX_RETRIES + 1):
+            async with self.rate_limiter.acquire(estimated_tokens):
+                usage_handler = UsageMetadataCallbackHandler()
+                try:
+                    result = await client.ainvoke(
+                        input,
+                        config={"callbacks": [usage_handler]},
+                        **kwargs
+                    )
+                except Exception as e:
+                    retry_after = _retry_after_seconds(e, attempt)
+                    if (
+                        retry_after is None or
+                        attempt == LLM_RATE_LIMIT_MAX_RETRIES
+                    ):
+                        raise
+                    self.rate_limiter.pause(retry_after)
+                    continue
+
+            if usage_handler.usage_metadata:
+                self.rate_limiter.record_usage(
+                    estimated_tokens,
+                    sum(
+                        usage["total_tokens"]
+                        for usage in usage_handler.usage_metadata.values()
+                    )
+                )
+            return result
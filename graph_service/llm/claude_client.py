@@ -1,11 +1,13 @@
-from typing import Optional, Type, TypeVar, Any
-
 from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import BaseMessage
-from pydantic import BaseModel
 
-from config import CLAUDE_API_KEY
-from llm.llm_client import LLMClient
+from config import (
+    CLAUDE_API_KEY,
+    CLAUDE_MAX_CONCURRENT_REQUESTS,
+    CLAUDE_REQUESTS_PER_MINUTE,
+    CLAUDE_TOKENS_PER_MINUTE,
+)
+from llm.chat_model_client import ChatModelClient
+from llm.rate_limiter import ProviderRateLimiter
 
 
 CLAUDE_MODEL = "claude-opus-4-5"
@@ -13,10 +15,7 @@ CLAUDE_TEMPERATURE = 0.5
 CLAUDE_MAX_TOKENS = 64000
 
 
-T = TypeVar("T", bound=BaseModel)
-
-
-class ClaudeClientWrapper(LLMClient):
+class ClaudeClientWrapper(ChatModelClient):
 
     def __init__(self):
         if not CLAUDE_API_KEY:
@@ -26,24 +25,17 @@ class ClaudeClientWrapper(LLMClient):
                 "to use the Claude provider."
             )
 
-        self._client = ChatAnthropic(
-            model=CLAUDE_MODEL,
-            api_key=CLAUDE_API_KEY,
-            temperature=CLAUDE_TEMPERATURE,
-            max_tokens=CLAUDE_MAX_TOKENS,
+        super().__init__(
+            chat_model=ChatAnthropic(
+                model=CLAUDE_MODEL,
+                api_key=CLAUDE_API_KEY,
+                temperature=CLAUDE_TEMPERATURE,
+                max_tokens=CLAUDE_MAX_TOKENS,
+            ),
+            rate_limiter=ProviderRateLimiter(
+                name="claude",
+                max_concurrent_requests=CLAUDE_MAX_CONCURRENT_REQUESTS,
+                requests_per_minute=CLAUDE_REQUESTS_PER_MINUTE,
+                tokens_per_minute=CLAUDE_TOKENS_PER_MINUTE,
+            ),
         )
-
-
-    async def ainvoke(
-        self,
-        input: list[BaseMessage],
-        output_type: Optional[Type[T]] = None,
-    ) -> Any:
-        if output_type is not None:
-            client = self._client.with_structured_output(
-                output_type,
-            )
-        else:
-            client = self._client
-
-        return await client.ainvoke(input)
@@ -18,10 +18,14 @@ logger = logging.getLogger(__name__)
 
 class DummyAIClientWrapper(LLMClient):
 
+    model_id = "dummy"
+
+
     async def ainvoke(
         self,
         input: list[BaseMessage],
         output_type: Optional[Type[T]] = None,
+        temperature: Optional[float] = None,
     ) -> Any:
         logger.debug(f"DummyAIClientWrapper received input: {input}")
 
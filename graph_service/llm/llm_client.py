@@ -4,17 +4,26 @@ from typing import overload, Optional, Type, TypeVar, Any
 
 from langchain_core.messages import BaseMessage
 
+from llm.rate_limiter import ProviderRateLimiter
+
 
 T = TypeVar("T", bound=BaseModel)
 
 
 class LLMClient(ABC):
 
+    # Identifies the model and its fixed settings, e.g. for cache keys.
+    model_id: str = "unknown"
+
+    rate_limiter: Optional[ProviderRateLimiter] = None
+
+
     @overload
     async def ainvoke(
         self,
         input: list[BaseMessage],
         output_type: None = None,
+        temperature: Optional[float] = None,
     ) -> Any:
         ...
 
@@ -24,6 +33,7 @@ class LLMClient(ABC):
         self,
         input: list[BaseMessage],
         output_type: Type[T] = ...,
+        temperature: Optional[float] = None,
     ) -> T:
         ...
 
@@ -33,5 +43,35 @@ class LLMClient(ABC):
         self,
         input: list[BaseMessage],
         output_type: Optional[Type[T]] = None,
+        temperature: Optional[float] = None,
     ) -> Any:
         ...
+
+
+class TemperatureBoundLLMClient(LLMClient):
+
+    # Applies a per-request temperature to a shared provider client
+    # without building a new one; an explicit temperature on a single
+    # call still wins.
+
+    def __init__(self, client: LLMClient, temperature: float):
+        self._client = client
+        self.temperature = temperature
+        self.model_id = f"{client.model_id}|temperature={temperature}"
+        self.rate_limiter = client.rate_limiter
+
+
+    async def ainvoke(
+        self,
+        input: list[BaseMessage],
+        output_type: Optional[Type[T]] = None,
+        temperature: Optional[float] = None,
+    ) -> Any:
+        return await self._client.ainvoke(
+            input=input,
+            output_type=output_type,
+            temperature=(
+                temperature if temperature is not None
+                else self.temperature
+            ),
+        )
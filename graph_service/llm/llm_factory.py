@@ -1,14 +1,19 @@
-from typing import Optional
+import logging
+
+from typing import Any, Optional
 
 from config import DEFAULT_LLM_MODEL
-from llm.llm_client import LLMClient
+from llm.llm_client import LLMClient, TemperatureBoundLLMClient
 
 
-def get_llm(
-    model_selection: Optional[str] = None,
-) -> LLMClient:
-    selected_model = model_selection or DEFAULT_LLM_MODEL
+logger = logging.getLogger(__name__)
 
+# Provider clients are built once per process and shared by every node
+# and request, so their SDK clients and connection pools are reused.
+_llm_clients: dict[str, LLMClient] = {}
+
+
+def _create_llm(selected_model: str) -> LLMClient:
     if selected_model == "openai":
         from llm.openai_client import OpenAIClientWrapper
 
@@ -28,3 +33,44 @@ def get_llm(
         f"Unknown model selection: '{selected_model}'. "
         f"Supported values: 'claude', 'openai', 'dummy'."
     )
+
+
+def get_llm(
+    model_selection: Optional[str] = None,
+    temperature: Optional[float] = None,
+) -> LLMClient:
+    selected_model = model_selection or DEFAULT_LLM_MODEL
+
+    llm_client = _llm_clients.get(selected_model)
+    if llm_client is None:
+        logger.info(f"Creating LLM client for provider '{selected_model}'")
+        llm_client = _create_llm(selected_model)
+        _llm_clients[selected_model] = llm_client
+
+    if temperature is not None:
+        return TemperatureBoundLLMClient(llm_client, temperature)
+
+    return llm_client
+
+
+def get_llm_rate_limit_stats(
+    invocation_id: Optional[str] = None,
+) -> dict[str, Any]:
+    stats = {}
+    for provider, llm_client in _llm_clients.items():
+        if llm_client.rate_limiter is None:
+            continue
+
+        provider_stats = llm_client.rate_limiter.get_stats()
+        if invocation_id is not None:
+            provider_stats["invocation_queue_wait"] = (
+                llm_client.rate_limiter.get_invocation_wait_stats(
+                    invocation_id
+                )
+            )
+        else:
+            provider_stats["invocation_queue_wait"] = (
+                llm_client.rate_limiter.get_all_invocation_wait_stats()
+            )
+        stats[provider] = provider_stats
+    return stats
@@ -1,20 +1,20 @@
-from typing import Optional, Type, TypeVar, Any
-
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import BaseMessage
-from pydantic import BaseModel
 
-from config import OPENAI_API_KEY, OPENAI_MODEL
-from llm.llm_client import LLMClient
+from config import (
+    OPENAI_API_KEY,
+    OPENAI_MODEL,
+    OPENAI_MAX_CONCURRENT_REQUESTS,
+    OPENAI_REQUESTS_PER_MINUTE,
+    OPENAI_TOKENS_PER_MINUTE,
+)
+from llm.chat_model_client import ChatModelClient
+from llm.rate_limiter import ProviderRateLimiter
 
 
 OPENAI_MAX_TOKENS = 16000
 
 
-T = TypeVar("T", bound=BaseModel)
-
-
-class OpenAIClientWrapper(LLMClient):
+class OpenAIClientWrapper(ChatModelClient):
 
     def __init__(self):
         if not OPENAI_API_KEY:
@@ -31,23 +31,16 @@ class OpenAIClientWrapper(LLMClient):
                 "to specify which OpenAI model to use."
             )
 
-        self._client = ChatOpenAI(
-            model=OPENAI_MODEL,
-            api_key=OPENAI_API_KEY,            
-            max_tokens=OPENAI_MAX_TOKENS,
+        super().__init__(
+            chat_model=ChatOpenAI(
+                model=OPENAI_MODEL,
+                api_key=OPENAI_API_KEY,            
+                max_tokens=OPENAI_MAX_TOKENS,
+            ),
+            rate_limiter=ProviderRateLimiter(
+                name="openai",
+                max_concurrent_requests=OPENAI_MAX_CONCURRENT_REQUESTS,
+                requests_per_minute=OPENAI_REQUESTS_PER_MINUTE,
+                tokens_per_minute=OPENAI_TOKENS_PER_MINUTE,
+            ),
         )
-
-
-    async def ainvoke(
-        self,
-        input: list[BaseMessage],
-        output_type: Optional[Type[T]] = None,
-    ) -> Any:
-        if output_type is not None:
-            client = self._client.with_structured_output(
-                output_type,
-            )
-        else:
-            client = self._client
-
-        return await client.ainvoke(input)
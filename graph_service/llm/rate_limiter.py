@@ -0,0 +1,280 @@
+import time
+import asyncio
+import logging
+
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INVOCATION_ID = "default"
+
+MAX_TRACKED_INVOCATIONS = 256
+
+# The invocation an LLM request is made for. Set once per graph run; the
+# tasks LangGraph and asyncio.gather spawn inherit it, so every request
+# of a run is queued and accounted under that run.
+llm_invocation_id: ContextVar[Optional[str]] = ContextVar(
+    "llm_invocation_id",
+    default=None,
+)
+
+
+class _TokenBucket:
+
+    # Refills continuously at capacity per minute, so bursts up to the
+    # full capacity are allowed and the sustained rate is the limit.
+
+    def __init__(self, capacity_per_minute: int):
+        self.capacity = float(capacity_per_minute)
+        self.refill_per_second = capacity_per_minute / 60.0
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self._updated) * self.refill_per_second
+        )
+        self._updated = now
+
+
+    def time_until(self, amount: float) -> float:
+        self._refill()
+        missing = min(amount, self.capacity) - self.tokens
+        return max(0.0, missing / self.refill_per_second)
+
+
+    def consume(self, amount: float):
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+
+    def adjust(self, amount: float):
+        # Negative after a request used more than estimated; the bucket
+        # may go below zero and then simply takes longer to refill.
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class _Waiter:
+
+    def __init__(self, future: asyncio.Future, tokens: int):
+        self.future = future
+        self.tokens = tokens
+
+
+class _InvocationWaitStats:
+
+    def __init__(self):
+        self.requests = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+
+    def record(self, wait_seconds: float):
+        self.requests += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "total_wait_seconds": self.total_wait_seconds,
+            "avg_wait_seconds": (
+                self.total_wait_seconds / self.requests
+                if self.requests else 0.0
+            ),
+            "max_wait_seconds": self.max_wait_seconds,
+        }
+
+
+class ProviderRateLimiter:
+
+    # Admission control for one LLM provider. A request waits until an
+    # in-flight slot is free and the requests/minute and tokens/minute
+    # buckets can cover it (a limit of 0 disables that bucket). Waiting
+    # requests are queued per invocation and admitted round-robin across
+    # invocations, so one run that fans out into dozens of calls cannot
+    # starve the others. A rate-limit response pauses admission for the
+    # provider's retry-after period.
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent_requests: int,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+    ):
+        logger.info(
+            f"Initializing rate limiter for '{name}': "
+            f"{max_concurrent_requests} concurrent requests, "
+            f"{requests_per_minute or 'unlimited'} requests/min, "
+            f"{tokens_per_minute or 'unlimited'} tokens/min"
+        )
+        self.name = name
+        self.max_concurrent_requests = max_concurrent_requests
+        self._request_bucket = (
+            _TokenBucket(requests_per_minute) if requests_per_minute > 0
+            else None
+        )
+        self._token_bucket = (
+            _TokenBucket(tokens_per_minute) if tokens_per_minute > 0
+            else None
+        )
+        self._queues: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self._rate_limited = 0
+        self._invocation_waits: "OrderedDict[str, _InvocationWaitStats]" = (
+            OrderedDict()
+        )
+
+
+    def _admission_delay(self, waiter: _Waiter) -> float:
+        delay = self._paused_until - time.monotonic()
+        if self._request_bucket is not None:
+            delay = max(delay, self._request_bucket.time_until(1))
+        if self._token_bucket is not None:
+            delay = max(delay, self._token_bucket.time_until(waiter.tokens))
+        return delay
+
+
+    def _dispatch(self):
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        while self._queues and self._in_flight < self.max_concurrent_requests:
+            invocation_id, queue = next(iter(self._queues.items()))
+            waiter = queue[0]
+            if waiter.future.done():
+                queue.popleft()
+            else:
+                delay = self._admission_delay(waiter)
+                if delay > 0:
+                    self._wakeup = asyncio.get_running_loop().call_later(
+                        delay,
+                        self._dispatch
+                    )
+                    return
+
+                queue.popleft()
+                if self._request_bucket is not None:
+                    self._request_bucket.consume(1)
+                if self._token_bucket is not None:
+                    self._token_bucket.consume(waiter.tokens)
+                self._in_flight += 1
+                waiter.future.set_result(None)
+
+            # Move the invocation behind the others that are waiting.
+            del self._queues[invocation_id]
+            if queue:
+                self._queues[invocation_id] = queue
+
+
+    def _release(self):
+        self._in_flight -= 1
+        self._dispatch()
+
+
+    def _record_wait(self, invocation_id: str, wait_seconds: float):
+        stats = self._invocation_waits.pop(invocation_id, None)
+        if stats is None:
+            stats = _InvocationWaitStats()
+        self._invocation_waits[invocation_id] = stats
+        while len(self._invocation_waits) > MAX_TRACKED_INVOCATIONS:
+            self._invocation_waits.popitem(last=False)
+        stats.record(wait_seconds)
+
+
+    @asynccontextmanager
+    async def acquire(self, estimated_tokens: int) -> AsyncIterator[None]:
+        invocation_id = llm_invocation_id.get() or DEFAULT_INVOCATION_ID
+        waiter = _Waiter(
+            asyncio.get_running_loop().create_future(),
+            estimated_tokens
+        )
+        self._queues.setdefault(invocation_id, deque()).append(waiter)
+        enqueued = time.monotonic()
+        self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted in the same loop iteration the caller was
+                # cancelled in, so the slot has to be handed back.
+                self._release()
+            self._dispatch()
+            raise
+
+        self._record_wait(invocation_id, time.monotonic() - enqueued)
+        try:
+            yield
+        finally:
+            self._release()
+
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int):
+        if self._token_bucket is not None:
+            self._token_bucket.adjust(estimated_tokens - actual_tokens)
+
+
+    def pause(self, seconds: float):
+        self._rate_limited += 1
+        self._paused_until = max(
+            self._paused_until,
+            time.monotonic() + seconds
+        )
+        logger.warning(
+            f"Provider '{self.name}' is rate limited, pausing new requests "
+            f"for {seconds:.1f}s"
+        )
+        self._dispatch()
+
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent_requests": self.max_concurrent_requests,
+            "in_flight": self._in_flight,
+            "queued": sum(
+                1
+                for queue in self._queues.values()
+                for waiter in queue
+                if not waiter.future.done()
+            ),
+            "queued_invocations": len(self._queues),
+            "rate_limited": self._rate_limited,
+            "paused_seconds": max(0.0, self._paused_until - time.monotonic()),
+            "request_tokens_available": (
+                self._request_bucket.tokens
+                if self._request_bucket is not None else None
+            ),
+            "tokens_available": (
+                self._token_bucket.tokens
+                if self._token_bucket is not None else None
+            ),
+        }
+
+
+    def get_invocation_wait_stats(
+        self,
+        invocation_id: str
+    ) -> Optional[Dict[str, Any]]:
+        stats = self._invocation_waits.get(invocation_id)
+        return stats.to_dict() if stats is not None else None
+
+
+    def get_all_invocation_wait_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            invocation_id: stats.to_dict()
+            for invocation_id, stats in self._invocation_waits.items()
+        }
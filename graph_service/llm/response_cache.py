@@ -0,0 +1,279 @@
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+
+from typing import Any, Dict, Optional, Type, TypeVar
+
+from langchain_core.messages import AIMessage, BaseMessage
+from pydantic import BaseModel
+
+from config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL_SECONDS,
+    LLM_CACHE_MAX_SIZE_MB,
+)
+from llm.llm_client import LLMClient
+
+
+T = TypeVar("T", bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the key or value layout changes, which makes every
+# older entry unreachable instead of misreading it.
+CACHE_FORMAT_VERSION = 1
+
+
+class LLMResponseCache:
+
+    # Responses of deterministic LLM sub-calls in an embedded sqlite
+    # database. Entries expire ttl_seconds after they were written, and
+    # the least recently read ones are evicted once the stored responses
+    # exceed max_size_bytes. Hits and misses are counted per namespace
+    # (the call site), which is what the hit rates are reported by.
+
+    def __init__(self, path: str, ttl_seconds: float, max_size_bytes: int):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                namespace TEXT NOT NULL,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+            "ON responses (accessed_at)"
+        )
+        self._connection.commit()
+        self._total_size = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+
+        logger.info(
+            f"LLMResponseCache initialized with path: {path}, "
+            f"size: {self._total_size} of {max_size_bytes} bytes"
+        )
+
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is not None and row[1] + self.ttl_seconds <= now:
+                self._delete(key)
+                row = None
+
+            if row is None:
+                self._misses[namespace] = self._misses.get(namespace, 0) + 1
+                return None
+
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (now, key)
+            )
+            self._connection.commit()
+            self._hits[namespace] = self._hits.get(namespace, 0) + 1
+            return row[0]
+
+
+    def put(self, namespace: str, key: str, value: str):
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            self._delete(key)
+            self._connection.execute(
+                "INSERT INTO responses "
+                "(key, namespace, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, namespace, value, size, now, now)
+            )
+            self._total_size += size
+            self._evict(now)
+            self._connection.commit()
+
+
+    def _delete(self, key: str):
+        row = self._connection.execute(
+            "DELETE FROM responses WHERE key = ? RETURNING size",
+            (key,)
+        ).fetchone()
+        if row is not None:
+            self._total_size -= row[0]
+
+
+    def _evict(self, now: float):
+        expired = self._connection.execute(
+            "DELETE FROM responses WHERE created_at <= ? RETURNING size",
+            (now - self.ttl_seconds,)
+        ).fetchall()
+        self._total_size -= sum(size for size, in expired)
+
+        while self._total_size > self.max_size_bytes:
+            evicted = self._connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at LIMIT 64"
+                ") RETURNING size"
+            ).fetchall()
+            if not evicted:
+                break
+            self._total_size -= sum(size for size, in evicted)
+
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+            namespaces = sorted(set(self._hits) | set(self._misses))
+            stats: Dict[str, Any] = {
+                "entries": entries,
+                "size_bytes": self._total_size,
+                "max_size_bytes": self.max_size_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "namespaces": {},
+            }
+            for namespace in namespaces:
+                hits = self._hits.get(namespace, 0)
+                misses = self._misses.get(namespace, 0)
+                stats["namespaces"][namespace] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": hits / (hits + misses),
+                }
+        return stats
+
+
+def _cache_key(
+    model_id: str,
+    input: list[BaseMessage],
+    output_type: Optional[Type[BaseModel]],
+    temperature: Optional[float],
+) -> str:
+    canonical = json.dumps(
+        {
+            "version": CACHE_FORMAT_VERSION,
+            "model": model_id,
+            "temperature": temperature,
+            "output_type": (
+                {
+                    "name": (
+                        f"{output_type.__module__}."
+                        f"{output_type.__qualname__}"
+                    ),
+                    "schema": output_type.model_json_schema(),
+                }
+                if output_type is not None else None
+            ),
+            "messages": [
+                {"type": message.type, "content": message.content}
+                for message in input
+            ],
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CachedLLMClient(LLMClient):
+
+    # Serves repeated (model, messages, output type, temperature) calls
+    # from the response cache. Only meant for sub-calls whose answer may
+    # be reused, so call sites opt in through with_response_cache.
+
+    def __init__(
+        self,
+        client: LLMClient,
+        cache: LLMResponseCache,
+        namespace: str,
+    ):
+        self._client = client
+        self._cache = cache
+        self.namespace = namespace
+        self.model_id = client.model_id
+        self.rate_limiter = client.rate_limiter
+
+
+    async def ainvoke(
+        self,
+        input: list[BaseMessage],
+        output_type: Optional[Type[T]] = None,
+        temperature: Optional[float] = None,
+    ) -> Any:
+        key = _cache_key(self.model_id, input, output_type, temperature)
+
+        cached = await asyncio.to_thread(self._cache.get, self.namespace, key)
+        if cached is not None:
+            logger.debug(f"LLM response cache hit ({self.namespace})")
+            if output_type is not None:
+                return output_type.model_validate_json(cached)
+            return AIMessage(content=json.loads(cached))
+
+        result = await self._client.ainvoke(
+            input=input,
+            output_type=output_type,
+            temperature=temperature,
+        )
+
+        if output_type is not None:
+            value = result.model_dump_json()
+        else:
+            value = json.dumps(result.content)
+        await asyncio.to_thread(self._cache.put, self.namespace, key, value)
+
+        return result
+
+
+_response_cache: Optional[LLMResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    global _response_cache
+
+    if not LLM_CACHE_ENABLED:
+        return None
+
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = LLMResponseCache(
+                path=LLM_CACHE_PATH,
+                ttl_seconds=LLM_CACHE_TTL_SECONDS,
+                max_size_bytes=LLM_CACHE_MAX_SIZE_MB * 1024 * 1024,
+            )
+    return _response_cache
+
+
+def with_response_cache(llm_client: LLMClient, namespace: str) -> LLMClient:
+    cache = get_response_cache()
+    if cache is None:
+        return llm_client
+    return CachedLLMClient(llm_client, cache, namespace)
@@ -3,4 +3,14 @@ from pydantic import BaseModel, Field
 
 class DocumentSummary(BaseModel):
     summary: str = Field(default="")
-    relevant: bool = Field(default=False)
\ No newline at end of file
+    relevant: bool = Field(default=False)
+
+
+class ChunkSummary(BaseModel):
+    chunk_id: str = Field(default="")
+    summary: str = Field(default="")
+    relevant: bool = Field(default=False)
+
+
+class BatchDocumentSummary(BaseModel):
+    summaries: list[ChunkSummary] = Field(default_factory=list)
\ No newline at end of file
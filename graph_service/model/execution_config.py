@@ -1,9 +1,15 @@
-from typing import Optional
+from typing import Literal, Optional, get_args
 
 from pydantic import BaseModel, Field
 
 from model.model_selection import ModelType
 from model.process_selection import ProcessType
+from model.search_filter import SearchFilter
+
+
+ChunkSummarizationMode = Literal["per_chunk", "batched", "extractive"]
+
+CHUNK_SUMMARIZATION_MODES: list[str] = list(get_args(ChunkSummarizationMode))
 
 
 class ExecutionConfig(BaseModel):
@@ -12,6 +18,10 @@ class ExecutionConfig(BaseModel):
     allow_general_knowledge: bool = Field(default=True)
     temperature: Optional[float] = Field(default=None)
     reasoning_level: Optional[str] = Field(default=None)
+    search_filter: Optional[SearchFilter] = Field(default=None)
+    chunk_summarization_mode: ChunkSummarizationMode = Field(
+        default="batched"
+    )
 
 
     @staticmethod
@@ -8,6 +8,7 @@ ProcessType = Literal[
     "simple_process",
     "parallel_tasks",
     "sequential_tasks",
+    "dag_tasks",
 ]
 
 
@@ -0,0 +1,17 @@
+from typing import Optional, Union
+
+from pydantic import BaseModel, Field
+
+
+class MetadataCondition(BaseModel):
+    key: str = Field(default="")
+    equals: Optional[Union[bool, int, float, str]] = Field(default=None)
+    gt: Optional[float] = Field(default=None)
+    gte: Optional[float] = Field(default=None)
+    lt: Optional[float] = Field(default=None)
+    lte: Optional[float] = Field(default=None)
+
+
+class SearchFilter(BaseModel):
+    source_names: Optional[list[str]] = Field(default=None)
+    custom_metadata: list[MetadataCondition] = Field(default_factory=list)
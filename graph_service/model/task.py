@@ -8,6 +8,16 @@ class TaskDecomposition(BaseModel):
     tasks: list[str] = Field(default_factory=list)
 
 
+class DependentTask(BaseModel):
+    id: int = Field(default=0)
+    task: str = Field(default="")
+    depends_on: list[int] = Field(default_factory=list)
+
+
+class DependentTaskDecomposition(BaseModel):
+    tasks: list[DependentTask] = Field(default_factory=list)
+
+
 class TaskResult(BaseModel):
     result: str = Field(default="")
     reasoning: str = Field(default="")
@@ -18,4 +28,5 @@ class TaskEntry(BaseModel):
     success: bool = Field(default=False)
     result: Optional[str] = Field(default=None)
     reasoning: Optional[str] = Field(default=None)
-    citations: list[Citation] = Field(default_factory=list)
\ No newline at end of file
+    citations: list[Citation] = Field(default_factory=list)
+    depends_on: list[str] = Field(default_factory=list)
\ No newline at end of file
@@ -2,14 +2,20 @@ import json
 import httpx
 import asyncio
 
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 
 from client import database_client
+from client.http_client_pool import get_http_client_stats
+from llm.llm_factory import get_llm_rate_limit_stats
+from llm.response_cache import get_response_cache
 
 from model.graph_input import GraphInput
 from model.process_selection import PROCESS_TYPES
 from model.model_selection import MODEL_TYPES
+from utils.stop_signal_registry import stop_signal_registry
 from utils.graph_streamer import (
     consume_graph_to_queue,
     stream_from_queue,
@@ -33,6 +39,24 @@ async def get_models() -> list[str]:
     return MODEL_TYPES
 
 
+@router.get("/metrics/http")
+async def get_http_metrics() -> dict:
+    return get_http_client_stats()
+
+
+@router.get("/metrics/llm")
+async def get_llm_metrics(invocation_id: Optional[str] = None) -> dict:
+    return get_llm_rate_limit_stats(invocation_id=invocation_id)
+
+
+@router.get("/metrics/llm-cache")
+async def get_llm_cache_metrics() -> dict:
+    cache = get_response_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.get_stats()}
+
+
 @router.post("/execute")
 async def invoke_graph(
     input_data: GraphInput,
@@ -69,6 +93,21 @@ async def stop_invocation(invocation_id: str):
         f"Stop request received for invocation {invocation_id}"
     )
 
+    # An invocation running in this process is stopped directly; the
+    # stop request record is only needed to reach other processes.
+
+    if stop_signal_registry.signal(invocation_id):
+        logger.info(
+            f"Stop signal delivered to local invocation {invocation_id}"
+        )
+
+        return {
+            "message": (
+                f"Stop request processed for "
+                f"invocation {invocation_id}"
+            )
+        }
+
     try:
         await database_client.create_stop_request(
             invocation_id=invocation_id,
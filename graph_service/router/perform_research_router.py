@@ -7,6 +7,7 @@ from model.perform_research import (
 from service.perform_research_service import (
     execute_tasks_in_parallel,
     execute_tasks_in_sequence,
+    execute_tasks_as_dag,
 )
 from llm.llm_factory import get_llm
 
@@ -45,3 +46,18 @@ async def sequential_tasks_execute(
         llm_client=llm_client,
     )
 
+
+@router.post(
+    "/dag/execute",
+    response_model=PerformResearchOutput,
+)
+async def dag_tasks_execute(
+    input_data: PerformResearchInput,
+    llm_model: str = "claude",
+) -> PerformResearchOutput:
+    llm_client = get_llm(model_selection=llm_model)
+    
+    return await execute_tasks_as_dag(
+        input_data,
+        llm_client=llm_client,
+    )
@@ -0,0 +1,124 @@
+import io
+import re
+import logging
+
+import numpy as np
+
+from client.http_client_pool import embedding_http_client
+from model.search_result import SearchResult
+
+
+logger = logging.getLogger(__name__)
+
+# The embedding service rejects larger /embed requests.
+EMBED_BATCH_SIZE = 1024
+
+EXTRACTIVE_MAX_SENTENCES = 3
+
+# Sentences scoring below this cosine similarity to the task are never
+# selected; a chunk without any is reported as irrelevant, the same way
+# the LLM summarization prompt does it.
+EXTRACTIVE_MIN_SIMILARITY = 0.2
+
+NO_RELEVANT_INFORMATION = "No relevant information found"
+
+SENTENCE_PATTERN = re.compile(r"[^.!?\n]+(?:[.!?]+|$)", re.MULTILINE)
+
+
+def _split_sentences(text: str) -> list[tuple[int, int]]:
+    # Character spans rather than strings, so selected neighbours can be
+    # cut out of the chunk together with the text between them and the
+    # excerpts stay verbatim.
+    spans = []
+    for match in SENTENCE_PATTERN.finditer(text):
+        start = match.start() + len(match.group()) - len(match.group().lstrip())
+        end = match.start() + len(match.group().rstrip())
+        if end - start > 1:
+            spans.append((start, end))
+    return spans
+
+
+async def _embed(texts: list[str]) -> np.ndarray:
+    batches = []
+    for start in range(0, len(texts), EMBED_BATCH_SIZE):
+        response = await embedding_http_client.post(
+            "/embed",
+            endpoint="embed",
+            json={
+                "texts": texts[start:start + EMBED_BATCH_SIZE],
+                "dtype": "float16",
+            },
+            headers={"Accept": "application/x-npy"},
+        )
+        response.raise_for_status()
+        batches.append(
+            np.load(io.BytesIO(response.content), allow_pickle=False)
+        )
+
+    embeddings = np.concatenate(batches).astype(np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+
+def _select_excerpts(
+    content: str,
+    spans: list[tuple[int, int]],
+    scores: np.ndarray,
+) -> str:
+    ranked = np.argsort(-scores, kind="stable")[:EXTRACTIVE_MAX_SENTENCES]
+    selected = sorted(
+        int(i) for i in ranked if scores[i] >= EXTRACTIVE_MIN_SIMILARITY
+    )
+    if not selected:
+        return NO_RELEVANT_INFORMATION
+
+    excerpts = []
+    run_start = selected[0]
+    previous = selected[0]
+    for index in selected[1:] + [None]:
+        if index is not None and index == previous + 1:
+            previous = index
+            continue
+        excerpts.append(content[spans[run_start][0]:spans[previous][1]])
+        if index is not None:
+            run_start = previous = index
+
+    return "\n\n".join(excerpts)
+
+
+async def attach_extractive_summaries(
+    task: str,
+    documents: list[SearchResult],
+):
+    # Approximates the chunk summarization prompt without an LLM: every
+    # chunk is split into sentences, the sentences and the task are
+    # embedded in one pass, and the sentences closest to the task are
+    # kept verbatim, in document order.
+    document_spans = [
+        _split_sentences(document.metadata.content)
+        for document in documents
+    ]
+    sentences = [
+        document.metadata.content[start:end]
+        for document, spans in zip(documents, document_spans)
+        for start, end in spans
+    ]
+    logger.debug(
+        f"Extracting summaries of {len(documents)} documents from "
+        f"{len(sentences)} sentences"
+    )
+
+    embeddings = await _embed([task] + sentences)
+    scores = embeddings[1:] @ embeddings[0]
+
+    offset = 0
+    for document, spans in zip(documents, document_spans):
+        document.content_summary = (
+            _select_excerpts(
+                document.metadata.content,
+                spans,
+                scores[offset:offset + len(spans)],
+            )
+            if spans else NO_RELEVANT_INFORMATION
+        )
+        offset += len(spans)
@@ -2,7 +2,6 @@ import uuid
 import json
 import asyncio
 import time
-import httpx
 
 from typing import Optional
 
@@ -12,6 +11,7 @@ from langchain_core.messages import (
 )
 from langgraph.graph.state import CompiledStateGraph
 
+from config import STOP_SIGNAL_LONG_POLL_SECONDS
 from graph import build_graph
 from model.raw_chat_message import RawChatMessage
 from model.graph_input import GraphInput
@@ -19,12 +19,15 @@ from model.graph_state import GraphState
 from model.execution_config import ExecutionConfig
 from model.process_selection import ProcessSelectionOutput
 from utils.stop_signal_waiter import StopSignalWaiter
+from utils.stop_signal_registry import stop_signal_registry
 from exception.invocation_stopped_exception import (
     DeepResearchInvocationStoppedException
 )
 from service import invocations_service
+from service.invocation_state_persister import InvocationStatePersister
 from llm.llm_factory import get_llm
-from config import EMBEDDING_SERVICE_URL
+from llm.rate_limiter import llm_invocation_id
+from client.http_client_pool import embedding_http_client
 from utils.prompt_loader import load_prompt
 from utils.copy_messages import copy_raw_messages
 
@@ -40,9 +43,16 @@ HEARTBEAT_INTERVAL = 30
 
 MAX_TIME_THRESHOLD_PER_NODE = 3600
 
+# Stop requests reach invocations in this process directly and those in
+# other processes through a database service long poll; polling at this
+# interval is only the fallback when the long poll is unavailable.
 STOP_SIGNAL_POLL_INTERVAL = 5.0
+
 STOP_SIGNAL_TOTAL_WAIT_TIME = MAX_TIME_THRESHOLD_PER_NODE
 
+# Graph state changes within this window are persisted in one write.
+STATE_PERSIST_DEBOUNCE_SECONDS = 1.0
+
 CHAT_HISTORY_MAX_RECENT_MESSAGES = 4
 CHAT_HISTORY_MAX_RETRIEVED_CONTEXT_MESSAGES = 5
 CHAT_HISTORY_SEMANTIC_SEARCH_TOP_K = 8
@@ -79,93 +89,98 @@ async def _prepare_graph_messages(
     )
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{EMBEDDING_SERVICE_URL}/collections/{temp_collection_name}"
+        response = await embedding_http_client.post(
+            f"/collections/{temp_collection_name}",
+            endpoint="create_collection",
+        )
+        response.raise_for_status()
+        
+        logger.debug(f"Created temporary collection '{temp_collection_name}'")
+        
+        entries = [
+            {
+                "text": f"[{msg.role.upper()}]: {msg.content}",
+                "custom_metadata": {"role": msg.role, "index": idx}
+            }
+            for idx, msg in enumerate(older_messages)
+        ]
+        
+        insert_response = await embedding_http_client.post(
+            f"/collections/{temp_collection_name}/texts",
+            endpoint="insert_texts",
+            json={"entries": entries}
+        )
+        insert_response.raise_for_status()
+        
+        logger.debug(
+            f"Inserted {len(entries)} messages into "
+            f"temporary collection"
+        )
+        
+        search_response = await embedding_http_client.post(
+            f"/collections/{temp_collection_name}/search",
+            endpoint="search",
+            json={
+                "query": user_query,
+                "top_k": CHAT_HISTORY_SEMANTIC_SEARCH_TOP_K,
+                "max_results": CHAT_HISTORY_MAX_RETRIEVED_CONTEXT_MESSAGES,
+                "payload_fields": ["text"]
+            }
+        )
+        search_response.raise_for_status()
+        search_results = search_response.json()
+        
+        logger.debug(
+            f"Search returned {len(search_results.get('results', []))} results"
+        )
+        
+        if search_results.get("results"):
+            relevant_messages = (
+                search_results["results"][:CHAT_HISTORY_MAX_RETRIEVED_CONTEXT_MESSAGES]
             )
-            response.raise_for_status()
-            
-            logger.debug(f"Created temporary collection '{temp_collection_name}'")
             
-            entries = [
-                {
-                    "text": f"[{msg.role.upper()}]: {msg.content}",
-                    "custom_metadata": {"role": msg.role, "index": idx}
-                }
-                for idx, msg in enumerate(older_messages)
+            context_texts = [
+                result["metadata"]["text"]
+                for result in relevant_messages
             ]
-            
-            insert_response = await client.post(
-                f"{EMBEDDING_SERVICE_URL}/collections/{temp_collection_name}/texts",
-                json={"entries": entries}
+
+            context_texts_formatted = "\n".join(
+                f"{i+1}. {text}" 
+                for i, text in enumerate(context_texts)
             )
-            insert_response.raise_for_status()
             
-            logger.debug(
-                f"Inserted {len(entries)} messages into "
-                f"temporary collection"
+            llm_client = get_llm(model_selection)
+            summarization_prompt = load_prompt(
+                "chat_history_summarization.md",
+                args={
+                    "user_query": user_query,
+                    "context_texts": context_texts_formatted,
+                },
             )
             
-            search_response = await client.post(
-                f"{EMBEDDING_SERVICE_URL}/collections/{temp_collection_name}/search",
-                json={
-                    "query": user_query,
-                    "top_k": CHAT_HISTORY_SEMANTIC_SEARCH_TOP_K
-                }
-            )
-            search_response.raise_for_status()
-            search_results = search_response.json()
+            logger.debug("Generating context summary with LLM")
             
-            logger.debug(
-                f"Search returned {len(search_results.get('results', []))} results"
+            summary_response = await llm_client.ainvoke(
+                input=[HumanMessage(content=summarization_prompt)]
             )
             
-            if search_results.get("results"):
-                relevant_messages = (
-                    search_results["results"][:CHAT_HISTORY_MAX_RETRIEVED_CONTEXT_MESSAGES]
-                )
-                
-                context_texts = [
-                    result["metadata"]["text"]
-                    for result in relevant_messages
-                ]
-
-                prompt_template = load_prompt("chat_history_summarization.md")                
-                
-                context_texts_formatted = "\n".join(
-                    f"{i+1}. {text}" 
-                    for i, text in enumerate(context_texts)
-                )
-                
-                llm_client = get_llm(model_selection)
-                summarization_prompt = prompt_template.format(
-                    user_query=user_query,
-                    context_texts=context_texts_formatted
-                )
-                
-                logger.debug("Generating context summary with LLM")
-                
-                summary_response = await llm_client.ainvoke(
-                    input=[HumanMessage(content=summarization_prompt)]
-                )
-                
-                summary_content = summary_response.content
-                
-                logger.debug(f"Generated context summary: {summary_content[:100]}...")
-                
-                graph_state_messages.append(
-                    HumanMessage(
-                        content=(
-                            "[CONVERSATION CONTEXT - Previous relevant discussion]\n\n"
-                            f"{summary_content}"
-                        )
-                    )
-                )                 
+            summary_content = summary_response.content
             
-            logger.debug(
-                f"Deleted temporary collection '{temp_collection_name}'"
-            )                        
+            logger.debug(f"Generated context summary: {summary_content[:100]}...")
             
+            graph_state_messages.append(
+                HumanMessage(
+                    content=(
+                        "[CONVERSATION CONTEXT - Previous relevant discussion]\n\n"
+                        f"{summary_content}"
+                    )
+                )
+            )                 
+        
+        logger.debug(
+            f"Deleted temporary collection '{temp_collection_name}'"
+        )                        
+        
     except Exception as e:
         logger.error(
             f"Failed to process semantic search for chat history: {e}"
@@ -174,14 +189,14 @@ async def _prepare_graph_messages(
     finally:        
         if temp_collection_name:
             try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    await client.delete(
-                        f"{EMBEDDING_SERVICE_URL}/collections/{temp_collection_name}"
-                    )
-                    logger.debug(
-                        f"Cleaned up temporary collection '{temp_collection_name}' "
-                        f"after error"
-                    )
+                await embedding_http_client.delete(
+                    f"/collections/{temp_collection_name}",
+                    endpoint="delete_collection",
+                )
+                logger.debug(
+                    f"Cleaned up temporary collection '{temp_collection_name}' "
+                    f"after error"
+                )
             except Exception as cleanup_error:
                 logger.warning(
                     f"Failed to cleanup temporary collection: {cleanup_error}"
@@ -201,12 +216,30 @@ async def stream_graph(input_data: GraphInput):
 
     logger.debug(f"Graph invocation id: {invocation_id}")
 
+    # LLM requests made for this run, including those of the tasks it
+    # spawns, queue and report their wait time under its id.
+    llm_invocation_id.set(invocation_id)
+
+    # Stop requests handled by this process set this event directly.
+
+    stop_event = stop_signal_registry.register(invocation_id)
+
     # The pending_task holds the currently executing graph node task. 
     # The stop_task holds the stop signal monitoring task.
 
     pending_task: Optional[asyncio.Task] = None
     stop_task: Optional[asyncio.Task] = None    
 
+    # Node completions and blurbs only hand the latest graph state to the
+    # persister, which writes deltas behind the stream; every way out of
+    # the invocation ends with a full flush.
+
+    state_persister = InvocationStatePersister(
+        profile_id=input_data.profile_id,
+        invocation_id=invocation_id,
+        debounce_seconds=STATE_PERSIST_DEBOUNCE_SECONDS,
+    )
+
     try:
         event_data = {
             "invocation_id": invocation_id,
@@ -269,16 +302,7 @@ async def stream_graph(input_data: GraphInput):
 
         # Update invocation with initial graph state
 
-        try:
-            await invocations_service.update_invocation(
-                profile_id=input_data.profile_id,
-                invocation_id=invocation_id,
-                graph_state=graph_state.model_dump(),
-            )
-        except Exception as e:
-            logger.warning(
-                f"Failed to update invocation with initial graph state: {str(e)}"
-            )
+        state_persister.update(graph_state)
 
         # Build the graph and instantiate a streaming coroutine.
         # If the input data specifies a custom start node, then
@@ -295,8 +319,10 @@ async def stream_graph(input_data: GraphInput):
 
         # Set up stop signal waiter which is used to monitor for 
         # stop requests. If a stop is detected, then the waiter
-        # will complete its task. The waiter checks the database
-        # for a stop request record for this invocation.
+        # will complete its task. The waiter wakes up on the local
+        # stop event or on the database service long poll, and only
+        # checks the database for a stop request record for this
+        # invocation if the long poll is unavailable.
 
         async def check_stop_requested() -> bool:
             try:
@@ -316,9 +342,25 @@ async def stream_graph(input_data: GraphInput):
                 )
                 return False
 
+        async def wait_for_stop_request(timeout: float) -> Optional[bool]:
+            is_stop_requested = await invocations_service.wait_for_stop_request(
+                invocation_id=invocation_id,
+                timeout=timeout,
+            )
+
+            if is_stop_requested:
+                logger.info(
+                    f"Stop request detected for invocation {invocation_id}"
+                )
+
+            return is_stop_requested
+
         stop_signal_waiter = StopSignalWaiter(
             max_time=STOP_SIGNAL_TOTAL_WAIT_TIME,
             poll_interval=STOP_SIGNAL_POLL_INTERVAL,
+            stop_event=stop_event,
+            wait_for_stop=wait_for_stop_request,
+            long_poll_timeout=STOP_SIGNAL_LONG_POLL_SECONDS,
         )
 
         stop_task = asyncio.ensure_future(
@@ -426,18 +468,7 @@ async def stream_graph(input_data: GraphInput):
                     )
                     
                     graph_state = GraphState(**data[node_name])
-                    
-                    try:
-                        await invocations_service.update_invocation(
-                            profile_id=input_data.profile_id,
-                            invocation_id=invocation_id,
-                            graph_state=graph_state.model_dump(),
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to update invocation in database: {str(e)}"
-                        )
-                        raise                    
+                    state_persister.update(graph_state)
 
                     event_data = {
                         "invocation_id": invocation_id,
@@ -460,12 +491,7 @@ async def stream_graph(input_data: GraphInput):
                         )
 
                         graph_state.blurb = custom_data.get("content", "")
-
-                        await invocations_service.update_invocation(
-                            profile_id=input_data.profile_id,
-                            invocation_id=invocation_id,
-                            graph_state=graph_state.model_dump(),
-                        )
+                        state_persister.update(graph_state)
 
                         event_data = {
                             "invocation_id": invocation_id,
@@ -512,12 +538,7 @@ async def stream_graph(input_data: GraphInput):
         yield f"data: {json.dumps(event_data)}\n\n"
 
         try:
-            await invocations_service.update_invocation(
-                profile_id=input_data.profile_id,
-                invocation_id=invocation_id,
-                status="completed",
-                graph_state=graph_state.model_dump(),
-            )
+            await state_persister.flush(status="completed")
         except Exception as e:
             logger.warning(
                 f"Failed to update completed invocation in database: {str(e)}"
@@ -539,11 +560,7 @@ async def stream_graph(input_data: GraphInput):
         yield f"data: {json.dumps(event_data)}\n\n"
 
         try:
-            await invocations_service.update_invocation(
-                profile_id=input_data.profile_id,
-                invocation_id=invocation_id,
-                status="stopped",
-            )
+            await state_persister.flush(status="stopped")
         except Exception as e:
             logger.warning(
                 f"Failed to update stopped invocation in database: {str(e)}"
@@ -565,11 +582,7 @@ async def stream_graph(input_data: GraphInput):
         yield f"data: {json.dumps(event_data)}\n\n"
 
         try:
-            await invocations_service.update_invocation(
-                profile_id=input_data.profile_id,
-                invocation_id=invocation_id,
-                status="error",
-            )
+            await state_persister.flush(status="error")
         except Exception as update_error:
             logger.warning(
                 f"Failed to update error invocation in database: {str(update_error)}"
@@ -577,6 +590,14 @@ async def stream_graph(input_data: GraphInput):
             raise
 
     finally:
+        # After a final flush there is nothing left for close() to send;
+        # when the client disconnected mid-stream, it writes the changes
+        # still waiting for their debounced write.
+
+        await state_persister.close()
+
+        stop_signal_registry.unregister(invocation_id)
+
         # Delete any pending stop request for this invocation
 
         try:
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+
+from typing import Any, Optional
+
+from model.graph_state import GraphState
+from service import invocations_service
+
+
+logger = logging.getLogger(__name__)
+
+
+def _diff_graph_state(
+    persisted: dict[str, Any],
+    current: dict[str, Any],
+    dirty_keys: frozenset[str] = frozenset(),
+) -> list[dict[str, Any]]:
+    # JSON Patch operations turning the persisted state into the current
+    # one, at top-level granularity. Lists that only grew (steps, task
+    # entries) are sent as appends of the new items instead of in full.
+    # Dirty keys may hold anything on the server, so they are always
+    # sent whole, which is idempotent.
+    patch = []
+    for key, value in current.items():
+        if key in dirty_keys:
+            patch.append({"op": "replace", "path": f"/{key}", "value": value})
+            continue
+
+        if key not in persisted:
+            patch.append({"op": "add", "path": f"/{key}", "value": value})
+            continue
+
+        previous = persisted[key]
+        if previous == value:
+            continue
+
+        if (
+            isinstance(previous, list) and
+            isinstance(value, list) and
+            len(value) > len(previous) and
+            value[:len(previous)] == previous
+        ):
+            patch.extend(
+                {"op": "add", "path": f"/{key}/-", "value": item}
+                for item in value[len(previous):]
+            )
+        else:
+            patch.append({"op": "replace", "path": f"/{key}", "value": value})
+
+    for key in (persisted.keys() | dirty_keys) - current.keys():
+        patch.append({"op": "remove", "path": f"/{key}"})
+
+    return patch
+
+
+class InvocationStatePersister:
+
+    # Write-behind persistence of an invocation's graph state. Updates
+    # only record the latest state; it is sent after debounce_seconds, so
+    # a burst of node completions and blurbs becomes one write, and only
+    # as a patch against what the database already holds. Writes are
+    # serialized so patches always apply on top of each other. A failed
+    # patch leaves the persisted snapshot untouched, so its changes are
+    # sent again with the next one. Since the failed patch may still have
+    # been applied, its keys are marked dirty and resent whole instead of
+    # appended to twice. Updates that arrive while a write is in flight
+    # get a write of their own after another debounce period. flush()
+    # writes the full state with the final status and is what
+    # completion, stop and error end with; close() sends whatever is
+    # still unwritten, also when the invocation is being cancelled.
+
+    def __init__(
+        self,
+        profile_id: str,
+        invocation_id: str,
+        debounce_seconds: float,
+    ):
+        self.profile_id = profile_id
+        self.invocation_id = invocation_id
+        self.debounce_seconds = debounce_seconds
+        self._graph_state: Optional[GraphState] = None
+        # The invocation record is created with an empty graph state.
+        self._persisted: dict[str, Any] = {}
+        self._dirty_keys: set[str] = set()
+        # Bumped by every update; a write remembers the version it sent.
+        self._version = 0
+        self._written_version = 0
+        self._pending: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+
+
+    def update(self, graph_state: GraphState):
+        self._graph_state = graph_state
+        self._version += 1
+        if self._pending is None or self._pending.done():
+            self._pending = asyncio.ensure_future(self._write_delayed())
+
+
+    async def _write_delayed(self):
+        while True:
+            await asyncio.sleep(self.debounce_seconds)
+            try:
+                await self._write_patch()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to persist graph state delta of invocation "
+                    f"{self.invocation_id}: {str(e)}"
+                )
+            if self._written_version == self._version:
+                return
+
+
+    async def _write_patch(self):
+        async with self._write_lock:
+            if self._graph_state is None:
+                return
+
+            current = self._graph_state.model_dump()
+            self._written_version = self._version
+            patch = _diff_graph_state(
+                self._persisted,
+                current,
+                frozenset(self._dirty_keys),
+            )
+            if not patch:
+                return
+
+            try:
+                await invocations_service.patch_invocation_graph_state(
+                    profile_id=self.profile_id,
+                    invocation_id=self.invocation_id,
+                    patch=patch,
+                )
+            except BaseException:
+                self._dirty_keys.update(
+                    operation["path"].split("/")[1] for operation in patch
+                )
+                raise
+            self._persisted = current
+            self._dirty_keys.clear()
+
+
+    async def _cancel_pending(self):
+        if self._pending is not None and not self._pending.done():
+            self._pending.cancel()
+            try:
+                await self._pending
+            except asyncio.CancelledError:
+                pass
+        self._pending = None
+
+
+    async def flush(self, status: Optional[str] = None):
+        await self._cancel_pending()
+
+        async with self._write_lock:
+            graph_state = (
+                self._graph_state.model_dump()
+                if self._graph_state is not None else None
+            )
+            self._written_version = self._version
+            await invocations_service.update_invocation(
+                profile_id=self.profile_id,
+                invocation_id=self.invocation_id,
+                status=status,
+                graph_state=graph_state,
+            )
+            if graph_state is not None:
+                self._persisted = graph_state
+                self._dirty_keys.clear()
+
+
+    async def close(self):
+        # Runs in the stream's finally block, which a client disconnect
+        # enters with the task cancelled; the write is shielded so a
+        # second cancellation cannot cut it off halfway.
+        await self._cancel_pending()
+        try:
+            await asyncio.shield(self._write_patch())
+        except BaseException as e:
+            logger.warning(
+                f"Failed to persist final graph state delta of invocation "
+                f"{self.invocation_id}: {e!r}"
+            )
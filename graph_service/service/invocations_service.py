@@ -38,6 +38,20 @@ async def update_invocation(
     )
 
 
+async def patch_invocation_graph_state(
+    profile_id: str,
+    invocation_id: str,
+    patch: list[dict],
+    status: Optional[str] = None,
+):
+    return await database_client.patch_invocation_graph_state(
+        profile_id=profile_id,
+        invocation_id=invocation_id,
+        patch=patch,
+        status=status,
+    )
+
+
 async def check_stop_request_exists(
     invocation_id: str,
 ) -> bool:
@@ -46,6 +60,16 @@ async def check_stop_request_exists(
     )
 
 
+async def wait_for_stop_request(
+    invocation_id: str,
+    timeout: float,
+) -> Optional[bool]:
+    return await database_client.wait_for_stop_request(
+        invocation_id=invocation_id,
+        timeout=timeout,
+    )
+
+
 async def delete_stop_request(
     invocation_id: str,
 ) -> bool:
@@ -2,7 +2,7 @@ import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Type, TypeVar
 
 from langchain_core.messages import (
     AIMessage,
@@ -11,6 +11,7 @@ from langchain_core.messages import (
     SystemMessage,
 )
 from langgraph.types import StreamWriter
+from pydantic import BaseModel
 
 from llm.llm_client import LLMClient
 from model.perform_research import (
@@ -18,6 +19,8 @@ from model.perform_research import (
     PerformResearchOutput,
 )
 from model.task import (
+    DependentTask,
+    DependentTaskDecomposition,
     TaskDecomposition,
     TaskEntry,
 )
@@ -27,6 +30,8 @@ from utils.prompt_loader import load_prompt
 from utils.copy_messages import copy_messages
 
 
+T = TypeVar("T", bound=BaseModel)
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,23 +39,21 @@ async def _decompose_tasks(
     input_data: PerformResearchInput,
     execution_type: str,
     llm_client: LLMClient,
-) -> TaskDecomposition:
+    output_type: Type[T] = TaskDecomposition,
+) -> T:
     logger.debug(
         f"Starting task decomposition for query: " 
         f"{input_data.query}"
     )
 
-    decomposition_prompt = load_prompt(
+    formatted_decomposition_prompt = load_prompt(
         f"{execution_type}_task_decomposition.md",
-    )        
-    
-    formatted_decomposition_prompt = (
-        decomposition_prompt.format(
-            input_data=json.dumps(
+        args={
+            "input_data": json.dumps(
                 input_data.model_dump(),
                 indent=2,
             ),
-        )
+        },
     )
 
     decomposition = await llm_client.ainvoke(
@@ -60,7 +63,7 @@ async def _decompose_tasks(
             ),
             HumanMessage(content=input_data.query),
         ]),
-        output_type=TaskDecomposition,
+        output_type=output_type,
     )
     logger.debug(
         f"Task decomposition complete. Number of tasks: " 
@@ -242,3 +245,159 @@ async def execute_tasks_in_sequence(
     return PerformResearchOutput(
         task_entries=task_entries,
     )
+
+
+def _resolve_task_dependencies(
+    tasks: list[DependentTask],
+) -> list[list[int]]:
+    # Predecessors of every task as positions in the list. Only tasks
+    # listed earlier can be depended on, which is what the decomposition
+    # prompt asks for and keeps the graph acyclic whatever the LLM
+    # returns; unknown, later and self references are dropped.
+    positions: dict[int, int] = {}
+    dependencies: list[list[int]] = []
+
+    for position, task in enumerate(tasks):
+        predecessors = []
+        for task_id in task.depends_on:
+            predecessor = positions.get(task_id)
+            if predecessor is None:
+                logger.debug(
+                    f"Ignoring dependency of task {task.id} on task "
+                    f"{task_id}, which is not listed before it"
+                )
+                continue
+            if predecessor not in predecessors:
+                predecessors.append(predecessor)
+        dependencies.append(predecessors)
+        positions.setdefault(task.id, position)
+
+    return dependencies
+
+
+async def execute_tasks_as_dag(
+    input_data: PerformResearchInput,
+    llm_client: LLMClient,
+    stream_writer: Optional[StreamWriter] = None,
+    execution_config: ExecutionConfig = ExecutionConfig.default(),
+) -> PerformResearchOutput:
+    logger.debug(
+        f"Starting dependency-ordered task execution for query: " 
+        f"{input_data.query}"
+    )
+
+    if stream_writer:
+        stream_writer({
+            "type": "blurb",
+            "content": "Decomposing tasks..."
+        })
+
+    decomposition = await _decompose_tasks(
+        input_data, 
+        execution_type="dag",
+        llm_client=llm_client,
+        output_type=DependentTaskDecomposition,
+    )
+    dependencies = _resolve_task_dependencies(decomposition.tasks)
+
+    # Every task starts right away and waits for its predecessors only,
+    # so independent tasks run concurrently and the whole run takes as
+    # long as its longest dependency chain. Like in sequential execution,
+    # successful predecessor results are passed on as chat history and
+    # failed ones are left out.
+
+    scheduled: list[asyncio.Task] = []
+
+    async def _execute_task_after_dependencies(position: int) -> TaskEntry:
+        dependent_task = decomposition.tasks[position]
+        predecessor_entries: list[TaskEntry] = await asyncio.gather(*[
+            scheduled[predecessor]
+            for predecessor in dependencies[position]
+        ])
+
+        chat_history: list[BaseMessage] = copy_messages(
+            input_data.chat_history
+        ) if input_data.chat_history else []
+
+        for predecessor_entry in predecessor_entries:
+            if predecessor_entry.success:
+                chat_history.append(
+                    HumanMessage(content=(predecessor_entry.task))
+                )
+                chat_history.append(
+                    AIMessage(content=(predecessor_entry.result))
+                )
+
+        logger.debug(
+            f"Executing task {dependent_task.id} after "
+            f"{len(predecessor_entries)} dependencies: "
+            f"{dependent_task.task}"
+        )
+
+        current_date = datetime.now().strftime("%Y-%m-%d")
+
+        task_execution_prompt = load_prompt(
+            "task_execution.md",
+            args={
+                "task": dependent_task.task,
+                "current_date": current_date,      
+            },
+        )
+
+        task_entry = await execute_task(
+            task=dependent_task.task,
+            chat_history=chat_history,
+            prompt=task_execution_prompt,
+            collection_name=input_data.collection_name,
+            execution_config=execution_config,
+            llm_client=llm_client,
+        )
+        task_entry.depends_on = [
+            entry.task for entry in predecessor_entries
+        ]
+
+        return task_entry
+
+    for position in range(len(decomposition.tasks)):
+        scheduled.append(
+            asyncio.create_task(
+                _execute_task_after_dependencies(position)
+            )
+        )
+
+    try:
+        completed_entries: list[TaskEntry] = []
+
+        for completed_task in asyncio.as_completed(scheduled):
+            completed_entries.append(await completed_task)
+
+            if stream_writer:
+                successful_count = sum(
+                    1 for e in completed_entries if e.success
+                )
+                total_count = len(decomposition.tasks)
+                stream_writer({
+                    "type": "blurb",
+                    "content": (
+                        f"Completed {successful_count}/{total_count} "
+                        f"dependent tasks"
+                    )
+                })
+    finally:
+        for scheduled_task in scheduled:
+            if not scheduled_task.done():
+                scheduled_task.cancel()
+
+    # Reported in decomposition order, which lists every task after the
+    # tasks it depends on.
+    task_entries = [scheduled_task.result() for scheduled_task in scheduled]
+
+    logger.debug(
+        f"All tasks executed by dependency order. " 
+        f"Successful: {sum(1 for e in task_entries if e.success)}, " 
+        f"Failed: {sum(1 for e in task_entries if not e.success)}"
+    )
+
+    return PerformResearchOutput(
+        task_entries=task_entries,
+    )
@@ -4,6 +4,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.types import StreamWriter
 
 from llm.llm_client import LLMClient
+from llm.response_cache import with_response_cache
 from model.process_selection import (
     ProcessSelectionInput,
     ProcessSelectionOutput,
@@ -33,7 +34,10 @@ async def select_process(
         HumanMessage(content=input_data.user_query),
     )
     
-    output = await llm_client.ainvoke(
+    output = await with_response_cache(
+        llm_client,
+        namespace="process_selection",
+    ).ainvoke(
         input=messages,        
         output_type=ProcessSelectionOutput,       
     )        
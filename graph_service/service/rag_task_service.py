@@ -3,8 +3,6 @@ import json
 import logging
 import httpx
 
-from collections import Counter
-from statistics import mean, median
 from typing import Optional
 
 from langchain_core.messages import (
@@ -14,37 +12,56 @@ from langchain_core.messages import (
 )
 
 from llm.llm_client import LLMClient
+from llm.response_cache import with_response_cache
+from client.http_client_pool import embedding_http_client
 from model.task import (
     TaskResult,
     TaskEntry,
 )
-from model.document_summary import DocumentSummary
+from model.document_summary import (
+    DocumentSummary,
+    BatchDocumentSummary,
+)
 from model.search_result import SearchResult
 from model.semantic_search_query import (
     SemanticSearchQuery,
 )
 from model.citation import Citation
+from model.search_filter import SearchFilter
 from model.execution_config import ExecutionConfig
+from service.extractive_summary_service import attach_extractive_summaries
 from utils.prompt_loader import load_prompt
 
 
 logger = logging.getLogger(__name__)
 
+SEARCH_CANDIDATE_COUNT = 50
+
+MAX_DOCUMENTS_PER_TASK = 25
+
+# Estimated prompt tokens of chunk content packed into one batched
+# summarization call. The answer is made of verbatim excerpts, so it can
+# approach the size of the input and has to fit the output limit too.
+SUMMARIZATION_BATCH_TOKEN_BUDGET = 8000
+
+CHARS_PER_TOKEN = 4
+
 
 async def _generate_search_query(
     task: str,
     llm_client: LLMClient,
 ) -> str:
     logger.debug(f"Generating search query for task: {task}")
-    search_query_prompt = load_prompt(
+    formatted_search_prompt = load_prompt(
         "semantic_search_query.md",
-    )
-    formatted_search_prompt = (
-        search_query_prompt.format(task=task)
+        args={"task": task},
     )
 
     search_query_response = (
-        await llm_client.ainvoke(
+        await with_response_cache(
+            llm_client,
+            namespace="search_query",
+        ).ainvoke(
             input=[
                 SystemMessage(
                     content=formatted_search_prompt,
@@ -62,25 +79,30 @@ async def _generate_search_query(
 async def _search_documents(
     collection_name: str,
     search_query: str,
+    search_filter: Optional[SearchFilter] = None,
 ) -> list[SearchResult]:
-    from config import EMBEDDING_SERVICE_URL
-
     logger.debug(f"Searching documents in collection '{collection_name}' with query: {search_query}")
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{EMBEDDING_SERVICE_URL}/collections/{collection_name}/search",
-                json={
-                    "query": search_query,
-                    "top_k": 50,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            results_data = data.get("results", [])
-            results = [SearchResult(**result) for result in results_data]
-            logger.debug(f"Found {len(results)} documents")
-            return results
+        response = await embedding_http_client.post(
+            f"/collections/{collection_name}/search",
+            endpoint="search",
+            json={
+                "query": search_query,
+                "top_k": SEARCH_CANDIDATE_COUNT,
+                "auto_cut": True,
+                "max_results": MAX_DOCUMENTS_PER_TASK,
+                "filter": (
+                    search_filter.model_dump()
+                    if search_filter else None
+                ),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        results_data = data.get("results", [])
+        results = [SearchResult(**result) for result in results_data]
+        logger.debug(f"Found {len(results)} documents")
+        return results
     except httpx.HTTPError as e:
         logger.error(f"HTTP error during document search: {e}")
         raise
@@ -158,54 +180,6 @@ def _extract_citations(
     return citations
 
 
-def _filter_documents_by_score(
-    documents: list[SearchResult],
-    max_docs: Optional[int] = None,
-) -> list[SearchResult]:
-    if not documents:
-        return []
-
-    scores = [doc.score for doc in documents]
-
-    score_mean = mean(scores)
-    score_median = median(scores)
-
-    score_counts = Counter(scores)
-    score_mode = score_counts.most_common(1)[0][0]
-
-    logger.debug(
-        f"Score statistics - Mean: {score_mean:.4f}, "
-        f"Median: {score_median:.4f}, Mode: {score_mode:.4f}"
-    )
-
-    dynamic_threshold = max(score_mean, score_median, score_mode)
-    dampened_threshold = dynamic_threshold * 0.8
-    min_threshold = 0.3
-    final_threshold = max(dampened_threshold, min_threshold)
-
-    logger.debug(
-        f"Filtering with threshold: {final_threshold:.4f} "
-        f"(dampened from {dynamic_threshold:.4f})"
-    )
-
-    filtered_docs = [
-        doc for doc in documents
-        if doc.score >= final_threshold
-    ]
-
-    filtered_docs.sort(key=lambda d: d.score, reverse=True)
-
-    if max_docs is not None:
-        filtered_docs = filtered_docs[:max_docs]
-
-    logger.debug(
-        f"Filtered {len(documents)} documents to "
-        f"{len(filtered_docs)} documents"
-    )
-
-    return filtered_docs
-
-
 async def _summarize_chunk(
     task: str,
     content: str,
@@ -218,7 +192,10 @@ async def _summarize_chunk(
         "content": content,
     })
 
-    summary_response = await llm_client.ainvoke(
+    summary_response = await with_response_cache(
+        llm_client,
+        namespace="chunk_summarization",
+    ).ainvoke(
         input=[
             SystemMessage(content=summarization_prompt),
             HumanMessage(content=task_input),
@@ -252,6 +229,149 @@ async def _attach_content_summary_to_doc(
     return document
 
 
+def _pack_summarization_batches(
+    documents: list[SearchResult],
+) -> list[list[SearchResult]]:
+    batches: list[list[SearchResult]] = []
+    batch: list[SearchResult] = []
+    batch_tokens = 0
+
+    for document in documents:
+        tokens = len(document.metadata.content) // CHARS_PER_TOKEN + 1
+        if batch and batch_tokens + tokens > SUMMARIZATION_BATCH_TOKEN_BUDGET:
+            batches.append(batch)
+            batch = []
+            batch_tokens = 0
+        batch.append(document)
+        batch_tokens += tokens
+
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+async def _attach_content_summaries_to_batch(
+    task: str,
+    documents: list[SearchResult],
+    llm_client: LLMClient,
+) -> list[SearchResult]:
+    if len(documents) == 1:
+        return [
+            await _attach_content_summary_to_doc(
+                task,
+                documents[0],
+                llm_client=llm_client,
+            )
+        ]
+
+    summarization_prompt = load_prompt("batch_chunk_summarization.md")
+
+    task_input = json.dumps({
+        "task": task,
+        "chunks": [
+            {
+                "chunk_id": str(chunk_id),
+                "content": document.metadata.content,
+            }
+            for chunk_id, document in enumerate(documents)
+        ],
+    })
+
+    summaries: dict[str, str] = {}
+    try:
+        batch_response = await with_response_cache(
+            llm_client,
+            namespace="batch_chunk_summarization",
+        ).ainvoke(
+            input=[
+                SystemMessage(content=summarization_prompt),
+                HumanMessage(content=task_input),
+            ],
+            output_type=BatchDocumentSummary,
+        )
+        summaries = {
+            entry.chunk_id: entry.summary
+            for entry in batch_response.summaries
+            if entry.summary
+        }
+    except Exception as e:
+        logger.warning(
+            f"Batched summarization of {len(documents)} chunks failed, "
+            f"falling back to per-chunk summarization: {e}"
+        )
+
+    missing: list[SearchResult] = []
+    for chunk_id, document in enumerate(documents):
+        summary = summaries.get(str(chunk_id))
+        if summary is None:
+            missing.append(document)
+        else:
+            document.content_summary = summary
+
+    if missing and summaries:
+        logger.warning(
+            f"Batched summarization returned no summary for "
+            f"{len(missing)} of {len(documents)} chunks, "
+            f"summarizing them individually"
+        )
+
+    await asyncio.gather(*[
+        _attach_content_summary_to_doc(
+            task,
+            document,
+            llm_client=llm_client,
+        )
+        for document in missing
+    ])
+
+    return documents
+
+
+async def _attach_content_summaries(
+    task: str,
+    documents: list[SearchResult],
+    llm_client: LLMClient,
+    execution_config: ExecutionConfig,
+):
+    mode = execution_config.chunk_summarization_mode
+
+    if mode == "extractive":
+        try:
+            await attach_extractive_summaries(task, documents)
+            return
+        except Exception as e:
+            logger.warning(
+                f"Extractive summarization failed, falling back to "
+                f"batched LLM summarization: {e}"
+            )
+            mode = "batched"
+
+    if mode == "batched":
+        batches = _pack_summarization_batches(documents)
+        logger.debug(
+            f"Summarizing {len(documents)} documents in "
+            f"{len(batches)} batched calls"
+        )
+        await asyncio.gather(*[
+            _attach_content_summaries_to_batch(
+                task,
+                batch,
+                llm_client=llm_client,
+            )
+            for batch in batches
+        ])
+        return
+
+    await asyncio.gather(*[
+        _attach_content_summary_to_doc(
+            task,
+            doc,
+            llm_client=llm_client,
+        )
+        for doc in documents
+    ])
+
+
 async def execute_task(
     task: str,
     prompt: str,
@@ -272,25 +392,21 @@ async def execute_task(
             llm_client=llm_client,
         )
 
+        # The embedding service applies the adaptive score cutoff and
+        # the per-task cap, so only the hits used here cross the wire.
         documents = await _search_documents(
             collection_name,
             search_query,
-        )
-
-        documents = _filter_documents_by_score(
-            documents=documents,
-            max_docs=25,
+            search_filter=execution_config.search_filter,
         )
 
         if documents:
-            await asyncio.gather(*[
-                _attach_content_summary_to_doc(
-                    task,
-                    doc,
-                    llm_client=llm_client,
-                )
-                for doc in documents
-            ])
+            await _attach_content_summaries(
+                task,
+                documents,
+                llm_client=llm_client,
+                execution_config=execution_config,
+            )
 
             citations = _extract_citations(
                 collection_name,
@@ -319,12 +435,10 @@ async def execute_task(
             chat_history,
         )
 
-        formatted_prompt = prompt.format(task=task)
-
         messages: list[BaseMessage] = []
 
         system_message_str = (
-            f"{formatted_prompt}\n\n"
+            f"{prompt}\n\n"
             f"# Context\n\n"
             f"{context}"
         )
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import BaseModel
+
+from llm.chat_model_client import ChatModelClient
+from llm.rate_limiter import ProviderRateLimiter
+
+
+# The provider is replaced at the request boundary: requests are built by
+# the real chat model, so what reaches the fake is what would be sent.
+
+MODEL_TEMPERATURE = 0.5
+
+USAGE = {"input_tokens": 100, "output_tokens": 900, "total_tokens": 1000}
+
+
+class Answer(BaseModel):
+    value: int
+
+
+@pytest.fixture
+def sent_payloads(monkeypatch):
+    payloads = []
+
+    async def fake_agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        payloads.append(self._get_request_payload(messages, stop=stop, **kwargs))
+        if kwargs.get("tools"):
+            message = AIMessage(
+                content="",
+                tool_calls=[{"name": "Answer", "args": {"value": 3}, "id": "1"}],
+                usage_metadata=USAGE,
+                response_metadata={"model_name": self.model},
+            )
+        else:
+            message = AIMessage(
+                content="3",
+                usage_metadata=USAGE,
+                response_metadata={"model_name": self.model},
+            )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    monkeypatch.setattr(ChatAnthropic, "_agenerate", fake_agenerate)
+    return payloads
+
+
+@pytest.fixture
+def recorded_usage(monkeypatch):
+    usage = []
+    monkeypatch.setattr(
+        ProviderRateLimiter,
+        "record_usage",
+        lambda self, estimated, actual: usage.append((estimated, actual))
+    )
+    return usage
+
+
+@pytest.fixture
+def llm_client():
+    return ChatModelClient(
+        chat_model=ChatAnthropic(
+            model="claude-test",
+            api_key="test",
+            temperature=MODEL_TEMPERATURE,
+            max_tokens=1024,
+        ),
+        rate_limiter=ProviderRateLimiter(
+            name="test",
+            max_concurrent_requests=1,
+            requests_per_minute=0,
+            tokens_per_minute=0,
+        ),
+    )
+
+
+def test_structured_call_forwards_temperature(llm_client, sent_payloads):
+    result = asyncio.run(llm_client.ainvoke(
+        [HumanMessage("question")],
+        output_type=Answer,
+        temperature=0.1,
+    ))
+
+    assert result == Answer(value=3)
+    assert sent_payloads[-1]["temperature"] == 0.1
+
+
+def test_structured_call_without_temperature_uses_model_default(
+    llm_client,
+    sent_payloads
+):
+    asyncio.run(llm_client.ainvoke([HumanMessage("question")], output_type=Answer))
+
+    assert sent_payloads[-1]["temperature"] == MODEL_TEMPERATURE
+
+
+def test_plain_call_forwards_temperature(llm_client, sent_payloads):
+    result = asyncio.run(llm_client.ainvoke(
+        [HumanMessage("question")],
+        temperature=0.1,
+    ))
+
+    assert result.content == "3"
+    assert sent_payloads[-1]["temperature"] == 0.1
+
+
+@pytest.mark.parametrize("output_type", [Answer, None])
+def test_reported_usage_corrects_the_token_bucket(
+    llm_client,
+    sent_payloads,
+    recorded_usage,
+    output_type
+):
+    asyncio.run(llm_client.ainvoke(
+        [HumanMessage("question")],
+        output_type=output_type,
+    ))
+
+    assert [actual for _, actual in recorded_usage] == [USAGE["total_tokens"]]
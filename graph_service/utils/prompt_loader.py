@@ -1,19 +1,175 @@
-from typing import Any
+import time
+import string
+import logging
+import threading
 
 from pathlib import Path
+from typing import Any, Optional
+
+from config import PROMPT_HOT_RELOAD
+
+
+logger = logging.getLogger(__name__)
+
+PROMPT_DIR = Path(__file__).parent.parent / "prompts"
+
+PROMPT_FILE_PATTERN = "*.md"
+
+# In hot reload mode the prompt directory is checked for changed files
+# at most this often, on the next prompt lookup.
+PROMPT_RELOAD_CHECK_INTERVAL = 1.0
+
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
+
+class PromptTemplate:
+
+    # A prompt file parsed once into literal text and placeholders, so
+    # rendering only has to join the pieces. Rendering matches str.format
+    # for the placeholders that are allowed: plain names with an optional
+    # conversion and a constant format spec.
+
+    def __init__(self, name: str, text: str):
+        self.name = name
+        self.text = text
+        try:
+            self._segments = list(string.Formatter().parse(text))
+        except ValueError as e:
+            raise ValueError(f"Invalid prompt template '{name}': {e}")
+
+        fields = []
+        for _, field_name, format_spec, _ in self._segments:
+            if field_name is None:
+                continue
+            if not field_name.isidentifier():
+                raise ValueError(
+                    f"Invalid placeholder '{{{field_name}}}' in prompt "
+                    f"template '{name}': placeholders must be names"
+                )
+            if format_spec and "{" in format_spec:
+                raise ValueError(
+                    f"Invalid placeholder '{{{field_name}}}' in prompt "
+                    f"template '{name}': nested format specs are not "
+                    f"supported"
+                )
+            fields.append(field_name)
+        self.fields = frozenset(fields)
+
+
+    def render(self, args: dict[str, Any]) -> str:
+        missing = self.fields - args.keys()
+        if missing:
+            raise KeyError(
+                f"Missing arguments for prompt template '{self.name}': "
+                f"{', '.join(sorted(missing))}"
+            )
+
+        parts = []
+        for literal, field_name, format_spec, conversion in self._segments:
+            parts.append(literal)
+            if field_name is None:
+                continue
+            value = args[field_name]
+            if conversion:
+                value = _CONVERSIONS[conversion](value)
+            parts.append(format(value, format_spec))
+        return "".join(parts)
+
+
+class PromptRegistry:
+
+    # Every prompt file is read and parsed once when the registry is
+    # created, so a malformed template fails the service at startup
+    # rather than in the middle of an invocation. With hot_reload, files
+    # changed, added or removed on disk are picked up while running.
+
+    def __init__(self, prompt_dir: Path, hot_reload: bool = False):
+        self.prompt_dir = prompt_dir
+        self.hot_reload = hot_reload
+        self._lock = threading.Lock()
+        self._templates: dict[str, PromptTemplate] = {}
+        self._mtimes: dict[str, float] = {}
+        self._last_checked = time.monotonic()
+
+        for path in sorted(prompt_dir.glob(PROMPT_FILE_PATTERN)):
+            self._load(path)
+
+        logger.info(
+            f"Loaded {len(self._templates)} prompt templates from "
+            f"{prompt_dir} (hot reload: {hot_reload})"
+        )
+
+
+    def _load(self, path: Path):
+        with open(path, "r") as f:
+            text = f.read()
+        self._templates[path.name] = PromptTemplate(path.name, text)
+        self._mtimes[path.name] = path.stat().st_mtime
+
+
+    def _reload_changed(self):
+        paths = {
+            path.name: path
+            for path in self.prompt_dir.glob(PROMPT_FILE_PATTERN)
+        }
+
+        for name in list(self._templates):
+            if name not in paths:
+                del self._templates[name]
+                del self._mtimes[name]
+                logger.info(f"Prompt template '{name}' removed")
+
+        for name, path in paths.items():
+            if self._mtimes.get(name) == path.stat().st_mtime:
+                continue
+            try:
+                self._load(path)
+                logger.info(f"Reloaded prompt template '{name}'")
+            except (OSError, ValueError) as e:
+                # Keep serving the last good version while the file is
+                # being edited.
+                logger.error(f"Failed to reload prompt template: {e}")
+
+
+    def get(self, name: str) -> PromptTemplate:
+        if self.hot_reload:
+            with self._lock:
+                now = time.monotonic()
+                if now - self._last_checked >= PROMPT_RELOAD_CHECK_INTERVAL:
+                    self._last_checked = now
+                    self._reload_changed()
+
+        template = self._templates.get(name)
+        if template is None:
+            raise FileNotFoundError(
+                f"Prompt template '{name}' not found in {self.prompt_dir}"
+            )
+        return template
+
+
+_registry: Optional[PromptRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_prompt_registry() -> PromptRegistry:
+    global _registry
+
+    with _registry_lock:
+        if _registry is None:
+            _registry = PromptRegistry(
+                PROMPT_DIR,
+                hot_reload=PROMPT_HOT_RELOAD,
+            )
+    return _registry
 
 
 def load_prompt(
     filename: str,
     args: dict[str, Any] | None = None,
 ) -> str:
-    prompt_dir = Path(__file__).parent.parent / "prompts"
-    prompt_path = prompt_dir / filename
-
-    with open(prompt_path, "r") as f:
-        prompt = f.read()
+    template = get_prompt_registry().get(filename)
 
     if args:
-        prompt = prompt.format(**args)
+        return template.render(args)
 
-    return prompt
+    return template.text
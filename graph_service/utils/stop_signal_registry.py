@@ -0,0 +1,38 @@
+import asyncio
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+class StopSignalRegistry:
+
+    # Stop events of the invocations running in this process, so a stop
+    # request handled by the same process reaches its invocation
+    # immediately instead of through the database.
+
+    def __init__(self):
+        self._events: dict[str, asyncio.Event] = {}
+
+
+    def register(self, invocation_id: str) -> asyncio.Event:
+        event = asyncio.Event()
+        self._events[invocation_id] = event
+        return event
+
+
+    def unregister(self, invocation_id: str):
+        self._events.pop(invocation_id, None)
+
+
+    def signal(self, invocation_id: str) -> bool:
+        event = self._events.get(invocation_id)
+        if event is None:
+            return False
+
+        logger.debug(f"Signalling stop to local invocation {invocation_id}")
+        event.set()
+        return True
+
+
+stop_signal_registry = StopSignalRegistry()
@@ -1,36 +1,134 @@
+import time
 import asyncio
+import logging
 
 from typing import (
     Callable,
     Awaitable,
+    Optional,
 )
 
 
+logger = logging.getLogger(__name__)
+
+
 class StopSignalWaiter:
 
+    # Completes with True once a stop is signalled, or with False after
+    # max_time without one (reset() restarts that clock). A stop arrives
+    # through the local event when the stop request was handled by this
+    # process, and otherwise through wait_for_stop, a long poll that
+    # returns True on a stop, False when it timed out and None when push
+    # notification is not supported. Only then is stop_condition polled
+    # every poll_interval seconds. While the long poll fails (e.g. the
+    # database cannot push notifications right now), stop_condition is
+    # polled every poll_interval seconds and the long poll is retried on
+    # the same schedule.
+
     def __init__(
         self,
         max_time: int,
         poll_interval: float,
+        stop_event: Optional[asyncio.Event] = None,
+        wait_for_stop: Optional[
+            Callable[[float], Awaitable[Optional[bool]]]
+        ] = None,
+        long_poll_timeout: float = 30.0,
     ):
-        self.time_elapsed = 0
         self.max_time = max_time
-        self.poll_interval = poll_interval        
+        self.poll_interval = poll_interval
+        self.stop_event = stop_event or asyncio.Event()
+        self.wait_for_stop = wait_for_stop
+        self.long_poll_timeout = long_poll_timeout
+        self._started = time.monotonic()
+
+
+    @property
+    def time_elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+
+    async def _race_stop_event(
+        self,
+        awaitable: Awaitable,
+    ) -> tuple[bool, Optional[object]]:
+        event_task = asyncio.ensure_future(self.stop_event.wait())
+        other_task = asyncio.ensure_future(awaitable)
+        try:
+            await asyncio.wait(
+                [event_task, other_task],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            event_task.cancel()
+            if not other_task.done():
+                other_task.cancel()
+
+        if self.stop_event.is_set():
+            return True, None
+        return False, other_task.result()
+
 
-    
     async def run(
         self,
         stop_condition: Callable[[], Awaitable[bool]]
     ) -> bool:
         while self.time_elapsed < self.max_time:
-            if await stop_condition():                
+            if self.stop_event.is_set():
+                return True
+
+            remaining = self.max_time - self.time_elapsed
+
+            if self.wait_for_stop is not None:
+                try:
+                    stopped, result = await self._race_stop_event(
+                        self.wait_for_stop(
+                            min(self.long_poll_timeout, remaining)
+                        )
+                    )
+                except Exception as e:
+                    if await self._poll_after_failure(stop_condition, e):
+                        return True
+                    continue
+
+                if stopped or result:
+                    return True
+                if result is None:
+                    self.wait_for_stop = None
+                continue
+
+            if await stop_condition():
+                return True
+
+            stopped, _ = await self._race_stop_event(
+                asyncio.sleep(min(self.poll_interval, remaining))
+            )
+            if stopped:
                 return True
-            
-            await asyncio.sleep(self.poll_interval)
-            self.time_elapsed += self.poll_interval
 
         return False
+
+
+    async def _poll_after_failure(
+        self,
+        stop_condition: Callable[[], Awaitable[bool]],
+        error: Exception,
+    ) -> bool:
+        delay = min(
+            self.poll_interval,
+            max(self.max_time - self.time_elapsed, 0.0),
+        )
+        logger.debug(
+            f"Stop signal long poll failed ({error}), polling and "
+            f"retrying in {delay:.1f}s"
+        )
+
+        if await stop_condition():
+            return True
+
+        stopped, _ = await self._race_stop_event(asyncio.sleep(delay))
+        return stopped
     
 
     def reset(self):
-        self.time_elapsed = 0
\ No newline at end of file
+        self._started = time.monotonic()
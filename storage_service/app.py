@@ -3,8 +3,13 @@ import logging
 from fastapi import FastAPI
 
 from service.blob_storage import BlobStorage
+from service.extracted_text_cache import ExtractedTextCache
 from router import storage_router
-from config.vars import BLOB_STORAGE_PATH
+from config.vars import (
+    BLOB_STORAGE_PATH,
+    EXTRACTED_TEXT_CACHE_PATH,
+    EXTRACTED_TEXT_CACHE_MAX_SIZE_MB,
+)
 
 
 logging.basicConfig(
@@ -21,12 +26,18 @@ app = FastAPI(title="Deep Research Storage Service")
 
 logger.info("Starting Deep Research Storage Service initialization")
 logger.info(f"Blob Storage Path: {BLOB_STORAGE_PATH}")
+logger.info(f"Extracted Text Cache Path: {EXTRACTED_TEXT_CACHE_PATH}")
 
 blob_storage = BlobStorage(storage_path=BLOB_STORAGE_PATH)
+extracted_text_cache = ExtractedTextCache(
+    cache_path=EXTRACTED_TEXT_CACHE_PATH,
+    max_size_bytes=EXTRACTED_TEXT_CACHE_MAX_SIZE_MB * 1024 * 1024
+)
 
 logger.info("Storage service initialized successfully")
 
 app.state.blob_storage = blob_storage
+app.state.extracted_text_cache = extracted_text_cache
 
 app.include_router(storage_router.router)
 
@@ -26,3 +26,17 @@ MAX_UPLOAD_SIZE_MB = int(
         default_value="50"
     )
 )
+
+# Extracted document text is cached next to the blobs, keyed by the
+# sha256 of the source file.
+EXTRACTED_TEXT_CACHE_PATH = _get_optional_env_var(
+    var_name="EXTRACTED_TEXT_CACHE_PATH",
+    default_value=os.path.join(BLOB_STORAGE_PATH, ".extracted_text")
+)
+
+EXTRACTED_TEXT_CACHE_MAX_SIZE_MB = int(
+    _get_optional_env_var(
+        var_name="EXTRACTED_TEXT_CACHE_MAX_SIZE_MB",
+        default_value="1024"
+    )
+)
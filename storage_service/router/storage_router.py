@@ -1,5 +1,6 @@
 import logging
 import tempfile
+import hashlib
 import os
 import httpx
 
@@ -9,10 +10,12 @@ from fastapi import (
     HTTPException,
     UploadFile,
     File,
+    Body,
 )
 from fastapi.responses import Response
 
 from service.blob_storage import BlobStorage
+from service.extracted_text_cache import ExtractedTextCache
 from config.vars import DATABASE_SERVICE_URL, MAX_UPLOAD_SIZE_MB
 
 
@@ -61,6 +64,9 @@ async def upload_blob(
         f"filename: {file.filename}"
     )
     blob_storage: BlobStorage = request.app.state.blob_storage
+    extracted_text_cache: ExtractedTextCache = (
+        request.app.state.extracted_text_cache
+    )
 
     temp_file_path = None
     try:
@@ -86,11 +92,13 @@ async def upload_blob(
         ) as temp_file:
             temp_file_path = temp_file.name
             total_size = 0
+            content_hash = hashlib.sha256()
             while True:
                 chunk = await file.read(1024 * 1024)
                 if not chunk:
                     break
                 total_size += len(chunk)
+                content_hash.update(chunk)
                 if total_size > MAX_UPLOAD_SIZE_BYTES:
                     raise HTTPException(
                         status_code=413,
@@ -106,6 +114,11 @@ async def upload_blob(
             filename=file.filename,
             file_path=temp_file_path
         )
+        extracted_text_cache.register_blob(
+            collection_name=collection_name,
+            filename=file.filename,
+            content_hash=content_hash.hexdigest()
+        )
 
         async with httpx.AsyncClient() as client:
             try:
@@ -203,6 +216,9 @@ async def delete_blob(
         f"filename: {filename}"
     )
     blob_storage: BlobStorage = request.app.state.blob_storage
+    extracted_text_cache: ExtractedTextCache = (
+        request.app.state.extracted_text_cache
+    )
 
     try:
         success = blob_storage.delete_blob(
@@ -217,6 +233,11 @@ async def delete_blob(
                 detail=f"Blob '{filename}' not found"
             )
 
+        extracted_text_cache.unregister_blob(
+            collection_name=collection_name,
+            filename=filename
+        )
+
         async with httpx.AsyncClient() as client:
             try:
                 await client.delete(
@@ -265,4 +286,78 @@ async def delete_blob(
         raise HTTPException(
             status_code=500,
             detail=f"Failed to delete blob: {e}"
-        )
\ No newline at end of file
+        )
+
+
+@router.get("/extracted-text/stats")
+async def get_extracted_text_cache_stats(request: Request):
+    extracted_text_cache: ExtractedTextCache = (
+        request.app.state.extracted_text_cache
+    )
+    return extracted_text_cache.get_stats()
+
+
+@router.get("/extracted-text/{content_hash}")
+async def get_extracted_text(
+    content_hash: str,
+    extractor: str,
+    request: Request
+):
+    logger.info(
+        f"Get extracted text request for {content_hash[:12]}, "
+        f"extractor: {extractor}"
+    )
+    extracted_text_cache: ExtractedTextCache = (
+        request.app.state.extracted_text_cache
+    )
+
+    try:
+        data = extracted_text_cache.get(content_hash, extractor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if data is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No extracted text cached for '{content_hash}'"
+        )
+
+    # Entries are stored gzip-compressed and sent as-is.
+    return Response(
+        content=data,
+        media_type="application/json",
+        headers={"Content-Encoding": "gzip"}
+    )
+
+
+@router.put("/extracted-text/{content_hash}")
+async def put_extracted_text(
+    content_hash: str,
+    extractor: str,
+    request: Request,
+    pages: list[str] = Body(..., embed=True)
+):
+    logger.info(
+        f"Put extracted text request for {content_hash[:12]}, "
+        f"extractor: {extractor}, {len(pages)} pages"
+    )
+    extracted_text_cache: ExtractedTextCache = (
+        request.app.state.extracted_text_cache
+    )
+
+    try:
+        extracted_text_cache.put(content_hash, extractor, pages)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to cache extracted text: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to cache extracted text: {e}"
+        )
+
+    return {
+        "status": "ok",
+        "content_hash": content_hash,
+        "pages": len(pages)
+    }
@@ -0,0 +1,199 @@
+import os
+import re
+import gzip
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+
+logger = logging.getLogger(__name__)
+
+
+CONTENT_HASH_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+EXTRACTOR_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.+-]{1,64}$")
+
+ENTRY_SUFFIX = ".json.gz"
+BLOB_HASHES_FILENAME = "blob_hashes.json"
+
+
+def _blob_key(collection_name: str, filename: str) -> str:
+    return f"{collection_name}/{filename}"
+
+
+class ExtractedTextCache:
+
+    # Per-page text extracted from documents, stored gzip-compressed under
+    # the sha256 of the source file and the name of the extractor that
+    # produced it. Entries are immutable, so a replaced blob never serves
+    # stale text; the blob -> hash index only lets replace and delete drop
+    # entries no blob refers to anymore. Total size is bounded by evicting
+    # the least recently read entries.
+
+    def __init__(self, cache_path: str, max_size_bytes: int):
+        self.cache_path = Path(cache_path)
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._blob_hashes: Dict[str, str] = self._load_blob_hashes()
+        self._total_size = sum(
+            entry.stat().st_size for entry in self._entries()
+        )
+        logger.info(
+            f"ExtractedTextCache initialized with path: {self.cache_path}, "
+            f"size: {self._total_size} of {self.max_size_bytes} bytes"
+        )
+
+
+    def _entries(self):
+        return self.cache_path.glob(f"*{ENTRY_SUFFIX}")
+
+
+    def _entry_path(self, content_hash: str, extractor: str) -> Path:
+        if not CONTENT_HASH_PATTERN.match(content_hash):
+            raise ValueError(f"Invalid content hash '{content_hash}'")
+        if not EXTRACTOR_NAME_PATTERN.match(extractor):
+            raise ValueError(f"Invalid extractor name '{extractor}'")
+        return self.cache_path / f"{content_hash}.{extractor}{ENTRY_SUFFIX}"
+
+
+    def _load_blob_hashes(self) -> Dict[str, str]:
+        path = self.cache_path / BLOB_HASHES_FILENAME
+        if not path.exists():
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
+    def _save_blob_hashes(self):
+        path = self.cache_path / BLOB_HASHES_FILENAME
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._blob_hashes, f)
+        os.replace(tmp_path, path)
+
+
+    def get(self, content_hash: str, extractor: str) -> Optional[bytes]:
+        path = self._entry_path(content_hash, extractor)
+        with self._lock:
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                self._misses += 1
+                logger.debug(
+                    f"Extracted text cache miss: {content_hash[:12]} "
+                    f"({extractor})"
+                )
+                return None
+
+            # The modification time doubles as the last access time that
+            # eviction orders by.
+            os.utime(path)
+            self._hits += 1
+
+        logger.debug(
+            f"Extracted text cache hit: {content_hash[:12]} ({extractor})"
+        )
+        return data
+
+
+    def put(self, content_hash: str, extractor: str, pages: list[str]):
+        path = self._entry_path(content_hash, extractor)
+        data = gzip.compress(
+            json.dumps({"pages": pages}).encode("utf-8"),
+            compresslevel=6
+        )
+
+        with self._lock:
+            previous_size = path.stat().st_size if path.exists() else 0
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._total_size += len(data) - previous_size
+            self._evict()
+
+        logger.info(
+            f"Cached extracted text for {content_hash[:12]} ({extractor}): "
+            f"{len(pages)} pages, {len(data)} bytes compressed"
+        )
+
+
+    def _evict(self):
+        if self._total_size <= self.max_size_bytes:
+            return
+
+        entries = sorted(
+            (entry.stat().st_mtime, entry) for entry in self._entries()
+        )
+        for _, entry in entries:
+            if self._total_size <= self.max_size_bytes:
+                break
+            self._total_size -= entry.stat().st_size
+            entry.unlink()
+            logger.debug(f"Evicted extracted text cache entry: {entry.name}")
+
+
+    def _drop_hash(self, content_hash: str):
+        for entry in self.cache_path.glob(f"{content_hash}.*{ENTRY_SUFFIX}"):
+            self._total_size -= entry.stat().st_size
+            entry.unlink()
+        logger.debug(
+            f"Invalidated extracted text cache entries for {content_hash[:12]}"
+        )
+
+
+    def _referenced_hashes(self) -> Set[str]:
+        return set(self._blob_hashes.values())
+
+
+    def register_blob(
+        self,
+        collection_name: str,
+        filename: str,
+        content_hash: str
+    ):
+        key = _blob_key(collection_name, filename)
+        with self._lock:
+            previous_hash = self._blob_hashes.get(key)
+            self._blob_hashes[key] = content_hash
+            if (
+                previous_hash is not None and
+                previous_hash != content_hash and
+                previous_hash not in self._referenced_hashes()
+            ):
+                self._drop_hash(previous_hash)
+            self._save_blob_hashes()
+
+
+    def unregister_blob(self, collection_name: str, filename: str):
+        with self._lock:
+            content_hash = self._blob_hashes.pop(
+                _blob_key(collection_name, filename),
+                None
+            )
+            if content_hash is None:
+                return
+            if content_hash not in self._referenced_hashes():
+                self._drop_hash(content_hash)
+            self._save_blob_hashes()
+
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": sum(1 for _ in self._entries()),
+                "size_bytes": self._total_size,
+                "max_size_bytes": self.max_size_bytes,
+                "blobs": len(self._blob_hashes),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": (
+                    self._hits / (self._hits + self._misses)
+                    if self._hits + self._misses else 0.0
+                ),
+            }